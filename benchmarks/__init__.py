@@ -0,0 +1,5 @@
+from .synthetic_resumes import SyntheticResumeGenerator
+from .fake_chat_client import FakeChatCompletionsClient
+from .run_benchmarks import run, main
+
+__all__ = ['SyntheticResumeGenerator', 'FakeChatCompletionsClient', 'run', 'main']
@@ -0,0 +1,17 @@
+"""
+Throughput benchmarks over a synthetic resume corpus with a fake LLM client.
+
+    python -m benchmarks --sizes 10 1000 --latency 0.2 --error-rate 0.05
+
+Results (docs/sec, p50/p95 latency, peak RSS per suite and corpus size) are
+written as JSON to benchmarks/results/ unless --output is given.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.run_benchmarks import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+from azure.core.exceptions import HttpResponseError
+from dao import LocalExtractor
+
+BATCH_SECTION_PATTERN = re.compile(r"=== RESUME (\S+) ===\n(.*?)(?=\n=== RESUME |\Z)", re.DOTALL)
+
+class FakeChatCompletionsClient:
+    """
+    In-process stand-in for ChatCompletionsClient, so benchmarks measure this
+    system rather than the model endpoint. Each ``complete`` call sleeps for
+    ``latency_seconds`` (plus up to ``latency_jitter``) and fails with an
+    HttpResponseError at ``error_rate``. Otherwise it answers extraction prompts
+    with LocalExtractor output and ranking prompts with the profiles ordered by
+    similarity score.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.latency_seconds = latency_seconds
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.extractor = LocalExtractor()
+        self.calls = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def complete(self, messages, **kwargs):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_seconds + self._rng.uniform(0, self.latency_jitter)
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            raise HttpResponseError(message="Simulated ChatCompletions failure")
+
+        content = self._respond(messages[-1].content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    def close(self) -> None:
+        pass
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+
+    def _respond(self, prompt: str) -> str:
+        if "Input Profiles:" in prompt:
+            payload = prompt.split("Input Profiles:", 1)[1].split("Return a JSON array", 1)[0]
+            profiles = json.loads(payload)
+            ranked = sorted(profiles, key=lambda p: p["similarity_score"], reverse=True)
+            return json.dumps([{"id": p["id"], "name": p["name"], "similarity_score": p["similarity_score"]} for p in ranked])
+
+        sections = BATCH_SECTION_PATTERN.findall(prompt)
+        if sections:
+            return json.dumps([
+                {"resume_id": resume_id, **self.extractor.extract_resume_info(text.strip())}
+                for resume_id, text in sections
+            ])
+
+        if "Resume:" in prompt:
+            return json.dumps(self.extractor.extract_resume_info(prompt.split("Resume:", 1)[1].strip()))
+        return "{}"
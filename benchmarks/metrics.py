@@ -0,0 +1,41 @@
+import sys
+from typing import Dict, List, Optional
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Peak resident set size of this process (or of its reaped child processes) so far, in MB"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / divisor, 1)
+
+def summarize(suite: str, case: str, size: int, documents: int, latencies: List[float], elapsed: float, **extra) -> Dict:
+    """
+    One result record for a benchmark case: ``documents`` processed in ``elapsed``
+    seconds, with one latency per timed call (a document, or a whole batch)
+    """
+    latencies_ms = np.asarray(latencies, dtype=float) * 1000
+    record = {
+        "suite": suite,
+        "case": case,
+        "size": size,
+        "samples": len(latencies),
+        "documents": documents,
+        "elapsed_seconds": round(elapsed, 4),
+        "docs_per_sec": round(documents / elapsed, 2) if elapsed > 0 else None,
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3) if len(latencies_ms) else None,
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 3) if len(latencies_ms) else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_child_rss_mb": peak_rss_mb(children=True)
+    }
+    record.update(extra)
+    print(f"[{suite}/{case}] size={size} docs/sec={record['docs_per_sec']} "
+          f"p50={record['p50_ms']}ms p95={record['p95_ms']}ms peak_rss={record['peak_rss_mb']}MB")
+    return record
@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from entities import JobDescription, Profile
+from dao import DocumentReader, LocalExtractor, ComparisonAgent, RankingAgent
+from services import RecruitmentMatchingService
+from utilities import BlobStore
+from config.settings import USE_ASYNC_EXTRACTOR, DEFAULT_TOP_MATCHES
+from .fake_chat_client import FakeChatCompletionsClient
+from .metrics import summarize
+from .synthetic_resumes import SyntheticResumeGenerator
+
+SUITES = ("reader", "comparison", "ranking", "end_to_end")
+
+BENCHMARK_JOB_DESCRIPTION = JobDescription(
+    id="JD_BENCH",
+    title="Senior Python Developer",
+    required_skills=["Python", "Django", "PostgreSQL", "AWS", "Docker", "REST API", "Git"],
+    experience_required="5+ years",
+    raw_text="""
+    We are looking for a Senior Python Developer with 5+ years of experience in Python
+    development, the Django framework, PostgreSQL, AWS cloud services, Docker
+    containerization, REST API development and Git version control.
+    """
+)
+
+def bench_document_reader(size: int, file_paths: List[str]) -> List[Dict]:
+    pdf_files = [path for path in file_paths if path.endswith(".pdf")]
+    docx_files = [path for path in file_paths if path.endswith(".docx")]
+    cases = [
+        ("pdf_fitz", DocumentReader(fast_mode=True), pdf_files),
+        ("pdf_pdfplumber", DocumentReader(fast_mode=False), pdf_files),
+        ("docx", DocumentReader(), docx_files),
+    ]
+
+    results = []
+    for case, reader, files in cases:
+        if not files:
+            continue
+        latencies = []
+        started = time.perf_counter()
+        for file_path in files:
+            call_started = time.perf_counter()
+            reader.read_document(file_path)
+            latencies.append(time.perf_counter() - call_started)
+        results.append(summarize("reader", case, size, len(files), latencies, time.perf_counter() - started))
+    return results
+
+def build_profiles(texts: List[str], blob_store: BlobStore) -> List[Profile]:
+    """Profiles built the way the service builds them, with LocalExtractor standing in for extraction"""
+    extractor = LocalExtractor()
+    profiles = []
+    for idx, text in enumerate(texts):
+        info = extractor.extract_resume_info(text)
+        profiles.append(Profile(
+            id=f"profile_{idx+1}",
+            name=info.get("name") or f"Candidate_{idx+1}",
+            email=info.get("email", ""),
+            phone=info.get("phone", ""),
+            skills=info.get("skills", []),
+            # Unknown experience stays empty, as in the service
+            experience=f"{info['experience_years']} years" if info.get("experience_years") not in (None, "") else "",
+            education=info.get("education", ""),
+            summary=info.get("summary", ""),
+            raw_text_handle=blob_store.put(text)
+        ))
+    return profiles
+
+def bench_comparison(size: int, profiles: List[Profile], repeats: int) -> List[Dict]:
+    agent = ComparisonAgent()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call_started = time.perf_counter()
+        agent.compare_profiles_with_jd(BENCHMARK_JOB_DESCRIPTION, profiles)
+        latencies.append(time.perf_counter() - call_started)
+    return [summarize("comparison", type(agent).__name__, size, size * repeats, latencies, time.perf_counter() - started)]
+
+def bench_ranking(size: int, profiles: List[Profile], repeats: int, client: FakeChatCompletionsClient,
+                  top_n: int) -> List[Dict]:
+    # Profiles carry the similarity scores left by the comparison suite
+    agent = RankingAgent(min_similarity_threshold=0.0, client=client)
+    client.reset_stats()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call_started = time.perf_counter()
+        agent.get_top_matches(profiles, top_n)
+        latencies.append(time.perf_counter() - call_started)
+    return [summarize("ranking", "RankingAgent", size, size * repeats, latencies, time.perf_counter() - started,
+                      llm_calls=client.calls, llm_errors=client.errors)]
+
+def bench_end_to_end(size: int, file_paths: List[str], repeats: int, client: FakeChatCompletionsClient,
+                     top_n: int) -> List[Dict]:
+    if USE_ASYNC_EXTRACTOR:
+        print("[end_to_end] skipped: USE_ASYNC_EXTRACTOR needs an async client, which the fake does not provide")
+        return []
+
+    # The extraction cache is off so every run pays for extraction
+    service = RecruitmentMatchingService(use_resume_index=False, use_extraction_cache=False, chat_client=client)
+    client.reset_stats()
+    latencies = []
+    started = time.perf_counter()
+    try:
+        for _ in range(repeats):
+            call_started = time.perf_counter()
+            service.run_matching_process(BENCHMARK_JOB_DESCRIPTION, file_paths, min_similarity_threshold=0.0, top_n=top_n)
+            latencies.append(time.perf_counter() - call_started)
+    finally:
+        service.close()
+    return [summarize("end_to_end", "run_matching_process", size, size * repeats, latencies,
+                      time.perf_counter() - started, llm_calls=client.calls, llm_errors=client.errors)]
+
+def run(sizes: List[int], suites: List[str], workdir: str, repeats: int = 3, formats: List[str] = ("pdf", "docx"),
+        pages: int = 1, latency: float = 0.0, latency_jitter: float = 0.0, error_rate: float = 0.0,
+        top_n: int = DEFAULT_TOP_MATCHES, seed: int = 0) -> List[Dict]:
+    """Run the selected suites for every corpus size; relative data paths resolve inside ``workdir``"""
+    generator = SyntheticResumeGenerator(seed=seed)
+    client = FakeChatCompletionsClient(latency, latency_jitter, error_rate, seed)
+    workdir = os.path.abspath(workdir)
+    os.makedirs(workdir, exist_ok=True)
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        return _run_sizes(generator, client, sizes, suites, workdir, repeats, formats, pages, top_n, seed)
+    finally:
+        os.chdir(previous_cwd)
+
+def _run_sizes(generator: SyntheticResumeGenerator, client: FakeChatCompletionsClient, sizes: List[int],
+               suites: List[str], workdir: str, repeats: int, formats: List[str], pages: int, top_n: int,
+               seed: int) -> List[Dict]:
+    results = []
+    for size in sizes:
+        print(f"\n=== Corpus of {size} resumes ===")
+        corpus_folder = os.path.join(workdir, "corpus", f"seed{seed}_pages{pages}_{'_'.join(formats)}_n{size}")
+        file_paths = generator.generate_corpus(corpus_folder, size, formats, pages)
+
+        if "reader" in suites:
+            results.extend(bench_document_reader(size, file_paths))
+
+        if "comparison" in suites or "ranking" in suites:
+            texts = [generator.resume_text(index, pages) for index in range(size)]
+            profiles = build_profiles(texts, BlobStore(os.path.join(workdir, "blobs")))
+            # Ranking needs scored profiles, so scoring always runs at least once
+            comparison_results = bench_comparison(size, profiles, repeats if "comparison" in suites else 1)
+            if "comparison" in suites:
+                results.extend(comparison_results)
+            if "ranking" in suites:
+                results.extend(bench_ranking(size, profiles, repeats, client, top_n))
+
+        if "end_to_end" in suites:
+            results.extend(bench_end_to_end(size, file_paths, repeats, client, top_n))
+    return results
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark document reading, scoring, ranking and end-to-end matching")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000], help="corpus sizes, e.g. 10 1000 10000")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--repeats", type=int, default=3, help="timed repetitions for the scoring, ranking and end-to-end suites")
+    parser.add_argument("--formats", nargs="+", choices=("pdf", "docx"), default=["pdf", "docx"])
+    parser.add_argument("--pages", type=int, default=1, help="approximate pages per synthetic resume")
+    parser.add_argument("--latency", type=float, default=0.0, help="fake LLM latency per call, in seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="extra uniform random latency, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of fake LLM calls that fail")
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_MATCHES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", default=None, help="where corpora and run data are kept; reuse it to skip regeneration")
+    parser.add_argument("--output", default=None, help="results JSON path (default: benchmarks/results/)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> str:
+    args = parse_args(argv)
+    output_path = os.path.abspath(args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results", f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    ))
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="docsim_bench_"))
+    os.makedirs(workdir, exist_ok=True)
+    print(f"Benchmark working directory: {workdir}")
+
+    results = run(
+        sizes=args.sizes, suites=args.suites, workdir=workdir, repeats=args.repeats, formats=args.formats,
+        pages=args.pages, latency=args.latency, latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+        top_n=args.top_n, seed=args.seed
+    )
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as file:
+        json.dump({
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {key: value for key, value in vars(args).items() if key != "output"},
+            "results": results
+        }, file, indent=2)
+
+    print(f"\nBenchmark results written to: {output_path}")
+    return output_path
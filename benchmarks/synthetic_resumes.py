@@ -0,0 +1,101 @@
+import os
+import random
+from typing import List, Sequence
+from docx import Document
+from fpdf import FPDF
+from config.skills import SKILL_GAZETTEER
+
+FIRST_NAMES = ["Alex", "Priya", "Jordan", "Wei", "Maria", "Samuel", "Aisha", "Lukas", "Nora", "Diego", "Hana", "Omar"]
+LAST_NAMES = ["Kumar", "Smith", "Garcia", "Chen", "Okafor", "Novak", "Silva", "Haddad", "Larsen", "Tanaka", "Moreau"]
+ROLES = ["Python Developer", "Backend Engineer", "Data Engineer", "Java Developer", "Frontend Developer",
+         "DevOps Engineer", "Machine Learning Engineer", "Full Stack Developer", "QA Engineer"]
+SENIORITY = ["", "Junior ", "Senior ", "Lead "]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Systems", "Wayne Analytics"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Software Engineering",
+           "Bachelor of Engineering in Information Technology", "MSc in Data Science"]
+DUTIES = [
+    "Designed and maintained REST APIs serving several million requests per day",
+    "Migrated legacy services to containerised deployments with automated rollbacks",
+    "Built data pipelines that ingest and validate partner feeds every hour",
+    "Mentored junior engineers and ran weekly code reviews",
+    "Reduced page load time by optimising queries and adding caching layers",
+    "Wrote integration tests and set up continuous delivery for the team",
+    "Worked with product managers to scope features and estimate delivery",
+    "Profiled hot paths and cut infrastructure cost for the reporting service",
+]
+
+class SyntheticResumeGenerator:
+    """
+    Deterministic generator of plausible resumes for benchmarks. Each resume
+    has the fields the extractors look for (name, contact details, stated years
+    of experience, skills, education, dated employment history); ``pages``
+    pads the employment history to make longer documents.
+    """
+
+    def __init__(self, seed: int = 0, skills: Sequence[str] = SKILL_GAZETTEER):
+        self.seed = seed
+        self.skills = list(skills)
+
+    def resume_text(self, index: int, pages: int = 1) -> str:
+        rng = random.Random(f"{self.seed}-{index}")
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        role = rng.choice(SENIORITY) + rng.choice(ROLES)
+        years = rng.randint(1, 15)
+        skills = rng.sample(self.skills, k=min(len(self.skills), rng.randint(4, 12)))
+
+        lines = [
+            name,
+            f"{name.lower().replace(' ', '.')}{index}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+            "",
+            "Summary",
+            f"{role} with {years} years of professional experience building and operating production software.",
+            "",
+            "Skills",
+            ", ".join(skills),
+            "",
+            "Education",
+            f"{rng.choice(DEGREES)}, {2024 - years - rng.randint(0, 4)}",
+            "",
+            "Experience",
+        ]
+
+        end_year = 2025
+        for _ in range(max(1, pages) * 4):
+            start_year = end_year - rng.randint(1, 4)
+            lines.append(f"{role} at {rng.choice(COMPANIES)}, {start_year} - {end_year}")
+            lines.extend(f"- {duty} using {rng.choice(skills)}." for duty in rng.sample(DUTIES, k=3))
+            lines.append("")
+            end_year = start_year
+        return "\n".join(lines).strip()
+
+    def write_pdf(self, text: str, file_path: str) -> None:
+        pdf = FPDF()
+        pdf.set_auto_page_break(auto=True, margin=15)
+        pdf.add_page()
+        pdf.set_font("Helvetica", size=10)
+        for line in text.split("\n"):
+            pdf.multi_cell(0, 5, line or " ", new_x="LMARGIN", new_y="NEXT")
+        pdf.output(file_path)
+
+    def write_docx(self, text: str, file_path: str) -> None:
+        document = Document()
+        for line in text.split("\n"):
+            document.add_paragraph(line)
+        document.save(file_path)
+
+    def generate_corpus(self, folder: str, count: int, formats: Sequence[str] = ("pdf", "docx"),
+                        pages: int = 1) -> List[str]:
+        """Write ``count`` resumes into ``folder``, cycling through ``formats``; existing files are reused"""
+        os.makedirs(folder, exist_ok=True)
+        file_paths = []
+        for index in range(count):
+            extension = formats[index % len(formats)]
+            file_path = os.path.join(folder, f"resume_{index:05d}.{extension}")
+            if not os.path.exists(file_path):
+                text = self.resume_text(index, pages)
+                if extension == "pdf":
+                    self.write_pdf(text, file_path)
+                else:
+                    self.write_docx(text, file_path)
+            file_paths.append(file_path)
+        return file_paths
@@ -1,4 +1,6 @@
+import hashlib
 import os
+import sys
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -29,23 +31,175 @@ def get_env_var(key: str, default: str = None) -> str:
 AZURE_ENDPOINT = "https://models.github.ai/inference"
 AZURE_MODEL = "openai/gpt-4.1-mini"
 AZURE_TOKEN = get_env_var("AZURE_OPEN_API")
+EXTRACTION_PROMPT_VERSION = "v1"
+
+# Async extractor rate limiting (GitHub Models budgets for the configured model)
+USE_ASYNC_EXTRACTOR = False
+AZURE_REQUESTS_PER_MINUTE = 15
+AZURE_TOKENS_PER_MINUTE = 60000
+AZURE_MAX_CONCURRENCY = 5
+AZURE_MAX_RETRIES = 5
+AZURE_RETRY_BASE_DELAY = 1.0
+AZURE_RETRY_MAX_DELAY = 60.0
+AZURE_COMPLETION_TOKENS_ESTIMATE = 500
 
 # Email Configuration
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 EMAIL_ADDRESS = get_env_var("EMAIL_ADDRESS")
 EMAIL_PASSWORD = get_env_var("EMAIL_PASSWORD")
+SMTP_USE_TLS = True
+SMTP_TIMEOUT_SECONDS = 30
+# Notifications are sent by SMTP_POOL_SIZE background workers, each keeping one
+# authenticated session open until it has been idle for SMTP_IDLE_TIMEOUT_SECONDS
+SMTP_POOL_SIZE = 2
+SMTP_IDLE_TIMEOUT_SECONDS = 60
+SMTP_MAX_RETRIES = 3
+SMTP_RETRY_BASE_DELAY = 2.0
+# notify() writes to a durable outbox drained by a background worker. Notifications for the
+# same recipient queued within NOTIFICATION_DIGEST_WINDOW_SECONDS are sent as one digest.
+NOTIFICATION_DIGEST_WINDOW_SECONDS = 120
+NOTIFICATION_MAX_ATTEMPTS = 8
+NOTIFICATION_RETRY_BASE_DELAY = 30
+NOTIFICATION_RETRY_MAX_DELAY = 3600
+NOTIFICATION_POLL_INTERVAL_SECONDS = 5
+# How long flush() keeps sending pending notifications when a process exits
+NOTIFICATION_FLUSH_TIMEOUT_SECONDS = 30
 
 # Matching Configuration
 MIN_SIMILARITY_THRESHOLD = 0.3
 DEFAULT_TOP_MATCHES = 3
+# In multi-JD runs, each candidate lists up to this many best-matching requisitions
+MULTI_MATCH_TOP_JOBS = 3
+# The title signal is graded: an exact title hit scores 1, a title variant TITLE_VARIANT_SCORE,
+# blended with the share of required-skill keywords found in the resume (TITLE_KEYWORD_WEIGHT)
+TITLE_VARIANT_SCORE = 0.6
+TITLE_KEYWORD_WEIGHT = 0.3
+# Only the best RERANK_SHORTLIST_FACTOR * top_n candidates by score are sent to the LLM re-ranker
+RERANK_SHORTLIST_FACTOR = 3
+# Larger candidate sets are re-ranked in groups of RERANK_CHUNK_SIZE, with the top
+# RERANK_ADVANCE_PER_GROUP of each group advancing to a final round
+RERANK_CHUNK_SIZE = 10  # at least 2, or groups cannot shrink the field
+RERANK_ADVANCE_PER_GROUP = 3
+RERANK_MAX_PARALLEL_REQUESTS = 4
+RERANK_SUMMARY_CHARS = 300
 MAX_TFIDF_FEATURES = 1000
 NGRAM_RANGE = (1, 2)
 
+# Resume Index Configuration
+USE_RESUME_INDEX = False
+RESUME_INDEX_DRIFT_THRESHOLD = 0.1
+# On-disk indexes append new resumes as segments and rewrite their base snapshot
+# once segments hold as many resumes as the base, or there are INDEX_MAX_SEGMENTS of them
+INDEX_MAX_SEGMENTS = 16
+
+# Comparison Backend Configuration
+# "tfidf" fits TF-IDF per run; "semantic" scores in a persisted LSA space (TruncatedSVD over
+# TF-IDF) with an IVF index of SEMANTIC_IVF_LISTS k-means lists (None = sqrt of the pool size).
+# Runs larger than SEMANTIC_EXACT_LIMIT resumes probe SEMANTIC_IVF_PROBES lists for the
+# SEMANTIC_SEARCH_TOP_K nearest resumes instead of scoring every one exactly.
+COMPARISON_BACKEND = "tfidf"
+SEMANTIC_MAX_FEATURES = 20000
+SEMANTIC_DIMENSIONS = 256
+SEMANTIC_IVF_LISTS = None
+SEMANTIC_IVF_PROBES = 8
+SEMANTIC_EXACT_LIMIT = 20000
+SEMANTIC_SEARCH_TOP_K = 1000
+SEMANTIC_REFIT_GROWTH = 2.0
+# Below this many resumes the LSA projection is not fitted and TF-IDF scoring is used instead
+SEMANTIC_MIN_FIT_DOCS = 100
+# "bm25" scores against a persisted inverted index (BM25_K1/BM25_B are the usual Okapi
+# parameters). Runs larger than BM25_EXACT_LIMIT resumes take the BM25_SEARCH_TOP_K best
+# via MaxScore pruning instead of scoring every one. Scores are scaled by the query's
+# upper bound, (BM25_K1 + 1) times the IDF of its terms.
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_EXACT_LIMIT = 20000
+BM25_SEARCH_TOP_K = 1000
+
+# Pre-filter Configuration
+# Before scoring, resumes missing a JD's must-have skills, short of its minimum years of
+# experience, or mentioning one of its excluded keywords are dropped. With
+# PREFILTER_REQUIRED_SKILLS_AS_MUST_HAVE every required skill is a must-have when the JD
+# lists none explicitly. Resumes whose experience cannot be parsed are kept unless
+# PREFILTER_KEEP_UNKNOWN_EXPERIENCE is False.
+PREFILTER_ENABLED = True
+PREFILTER_REQUIRED_SKILLS_AS_MUST_HAVE = False
+PREFILTER_KEEP_UNKNOWN_EXPERIENCE = True
+
+# Extraction Cache Configuration
+USE_EXTRACTION_CACHE = True
+EXTRACTION_CACHE_MAX_ENTRIES = 10000
+EXTRACTION_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Blob Store Configuration
+# Resume texts stay in PROFILE_BLOB_FOLDER so the indexes can refit from them. Blobs not
+# stored again for BLOB_RETENTION_DAYS days are dropped from every index and deleted when
+# a service starts (None keeps them forever).
+BLOB_RETENTION_DAYS = 30
+
+# Extraction Mode
+# "llm" sends every resume to Azure, "local" uses only the offline extractor,
+# "tiered" runs the offline extractor first and calls Azure for low-confidence fields.
+EXTRACTION_MODE = "llm"
+LOCAL_EXTRACTION_MIN_CONFIDENCE = 0.6
+TIERED_REQUIRED_FIELDS = ["name", "email", "skills", "experience_years"]
+
+# Batch Extraction Configuration
+# Packs several resumes into one request up to an estimated input token budget.
+EXTRACTION_BATCH_MODE = False
+EXTRACTION_BATCH_TOKEN_BUDGET = 6000
+EXTRACTION_BATCH_MAX_ITEMS = 10
+EXTRACTION_BATCH_MAX_RETRIES = 1
+
+# Ingestion Configuration
+# Extraction calls run in a thread pool of INGESTION_MAX_WORKERS; 1 keeps ingestion sequential.
+# Document parsing runs in a process pool of INGESTION_PARSER_PROCESSES (None = CPU count),
+# started once per service. Runs of at most INGESTION_INLINE_PARSE_MAX_FILES files are parsed
+# in the calling process, where handing them to the pool costs more than it saves.
+INGESTION_MAX_WORKERS = 8
+INGESTION_PARSER_PROCESSES = None
+INGESTION_INLINE_PARSE_MAX_FILES = 4
+
+# Deduplication Configuration
+# Resumes whose word-shingle Jaccard similarity is at least DEDUP_JACCARD_THRESHOLD are
+# collapsed onto one profile before extraction (MinHash with DEDUP_NUM_PERM permutations).
+DEDUP_ENABLED = True
+DEDUP_JACCARD_THRESHOLD = 0.85
+DEDUP_NUM_PERM = 128
+DEDUP_SHINGLE_SIZE = 5
+
+# Background Job Configuration
+JOB_MAX_WORKERS = 2
+JOB_POLL_INTERVAL_SECONDS = 2
+
+# PDF Reading Configuration
+# Fast mode reads with PyMuPDF first and falls back to pdfplumber. Documents with at least
+# PDF_PARALLEL_PAGE_THRESHOLD pages are split across PDF_PAGE_WORKERS processes.
+PDF_FAST_MODE = True
+PDF_MAX_PAGES = 25
+PDF_PARALLEL_PAGE_THRESHOLD = 16
+PDF_PAGE_WORKERS = 4
+
+# Export Configuration
+# Every run writes per-job files; with EXPORT_FULL_POOL the whole scored pool is also
+# streamed out in each of EXPORT_POOL_FORMATS ("csv", "jsonl", "parquet"). Those files
+# are as large as the pool and are never cleaned up, so this is off by default.
+EXPORT_FULL_POOL = False
+EXPORT_POOL_FORMATS = ["csv", "jsonl"]
+EXPORT_PARQUET_BATCH_SIZE = 5000
+
 # File Paths
 RESUME_FOLDER = "data/resumes"
 OUTPUT_FOLDER = "data/outputs"
 DEFAULT_CSV_FILENAME = "ranked_candidates.csv"
+RESUME_INDEX_FOLDER = "data/index"
+SEMANTIC_INDEX_FOLDER = "data/semantic_index"
+BM25_INDEX_FOLDER = "data/bm25_index"
+EXTRACTION_CACHE_PATH = "data/cache/extraction_cache.sqlite3"
+JOB_DB_PATH = "data/jobs/matching_jobs.sqlite3"
+PROFILE_BLOB_FOLDER = "data/blobs"
+NOTIFICATION_OUTBOX_PATH = "data/outbox/notifications.sqlite3"
 
 # Validation function to check if required environment variables are set
 def validate_config():
@@ -61,4 +215,10 @@ def validate_config():
     if not EMAIL_PASSWORD:
         missing_vars.append("EMAIL_PASSWORD")
     
-    return missing_vars
\ No newline at end of file
+    return missing_vars
+
+def get_config_fingerprint() -> str:
+    """Hash of every upper-case setting, used to invalidate cached services when configuration changes"""
+    settings = sys.modules[__name__]
+    values = sorted((name, repr(getattr(settings, name))) for name in dir(settings) if name.isupper())
+    return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()
@@ -0,0 +1,63 @@
+# Skill gazetteer used by the local extractor. Entries are canonical display names;
+# matching is case-insensitive and respects word boundaries. Single-letter and
+# common-word names (C, R, Go, Excel) are left out to avoid false positives.
+SKILL_GAZETTEER = [
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Golang", "Rust", "Ruby",
+    "PHP", "Scala", "Kotlin", "Swift", "Objective-C", "MATLAB", "Perl", "Bash", "Shell Scripting",
+    "SQL", "HTML", "CSS", "Dart",
+    # Frameworks and libraries
+    "Django", "Flask", "FastAPI", "Spring Framework", "Spring Boot", "Node.js", "Express.js", "React", "Angular",
+    "Vue.js", "Next.js", "jQuery", ".NET", "ASP.NET", "Ruby on Rails", "Laravel", "Celery",
+    "Pandas", "NumPy", "SciPy", "scikit-learn", "TensorFlow", "PyTorch", "Keras", "Spark", "Hadoop",
+    "Airflow", "Kafka", "RabbitMQ", "GraphQL", "REST API", "gRPC", "Microservices",
+    # Data stores
+    "PostgreSQL", "MySQL", "SQLite", "Oracle", "SQL Server", "MongoDB", "Redis", "Cassandra",
+    "DynamoDB", "Elasticsearch", "Snowflake", "BigQuery",
+    # Cloud and infrastructure
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins",
+    "GitHub Actions", "GitLab CI", "CI/CD", "Linux", "Nginx", "Serverless", "AWS Lambda",
+    # Practices and tools
+    "Git", "Agile", "Scrum", "TDD", "Unit Testing", "Machine Learning", "Deep Learning", "NLP",
+    "Computer Vision", "Data Analysis", "Data Engineering", "ETL", "Tableau", "Power BI", "Microsoft Excel",
+    "JIRA", "DevOps",
+]
+
+
+# Alternative spellings mapped to the canonical skill name they stand for. Keys are
+# compared after lowercasing and collapsing whitespace; canonical names and their
+# plurals match themselves without an entry here. The local extractor also finds
+# multi-word aliases in resume text; single words like "rest" are too common to.
+SKILL_ALIASES = {
+    # Languages
+    "js": "JavaScript", "ecmascript": "JavaScript", "ts": "TypeScript",
+    "go lang": "Golang", "cpp": "C++", "c plus plus": "C++", "c sharp": "C#", "csharp": "C#",
+    "objective c": "Objective-C", "objc": "Objective-C", "shell": "Shell Scripting", "bash scripting": "Bash",
+    "html5": "HTML", "css3": "CSS",
+    # Frameworks and libraries
+    "spring": "Spring Framework", "springboot": "Spring Boot", "node": "Node.js", "nodejs": "Node.js",
+    "express": "Express.js", "expressjs": "Express.js", "react.js": "React", "reactjs": "React",
+    "angularjs": "Angular", "angular.js": "Angular", "vue": "Vue.js", "vuejs": "Vue.js", "nextjs": "Next.js",
+    "dotnet": ".NET", ".net core": ".NET", "asp.net core": "ASP.NET", "rails": "Ruby on Rails", "ror": "Ruby on Rails",
+    "sklearn": "scikit-learn", "scikit learn": "scikit-learn", "apache spark": "Spark", "pyspark": "Spark",
+    "apache hadoop": "Hadoop", "apache airflow": "Airflow", "apache kafka": "Kafka",
+    "rest": "REST API", "restful": "REST API", "restful api": "REST API", "rest apis": "REST API",
+    "restful apis": "REST API", "restful services": "REST API", "rest services": "REST API",
+    "micro services": "Microservices", "microservice architecture": "Microservices",
+    # Data stores
+    "postgres": "PostgreSQL", "postgre": "PostgreSQL", "psql": "PostgreSQL", "postgre sql": "PostgreSQL",
+    "mssql": "SQL Server", "ms sql": "SQL Server", "microsoft sql server": "SQL Server",
+    "oracle db": "Oracle", "oracle database": "Oracle", "mongo": "MongoDB", "mongo db": "MongoDB",
+    "dynamo db": "DynamoDB", "elastic search": "Elasticsearch", "elastic": "Elasticsearch",
+    "google bigquery": "BigQuery", "big query": "BigQuery",
+    # Cloud and infrastructure
+    "amazon web services": "AWS", "microsoft azure": "Azure", "google cloud": "GCP",
+    "google cloud platform": "GCP", "k8s": "Kubernetes", "docker compose": "Docker",
+    "github action": "GitHub Actions", "gitlab": "GitLab CI", "ci cd": "CI/CD", "cicd": "CI/CD",
+    "continuous integration": "CI/CD", "lambda": "AWS Lambda",
+    # Practices and tools
+    "version control": "Git", "agile methodologies": "Agile", "test driven development": "TDD",
+    "unit tests": "Unit Testing", "ml": "Machine Learning", "dl": "Deep Learning",
+    "natural language processing": "NLP", "data analytics": "Data Analysis",
+    "powerbi": "Power BI", "excel": "Microsoft Excel", "ms excel": "Microsoft Excel", "jira software": "JIRA",
+}
@@ -1,13 +1,40 @@
 from .document_reader import DocumentReader
+from .azure_client import create_chat_client, create_async_chat_client
 from .azure_extractor import AzureExtractor
+from .async_azure_extractor import AsyncAzureExtractor
+from .local_extractor import LocalExtractor
+from .tiered_extractor import TieredExtractor
+from .title_matcher import TitleMatcher
 from .comparison_agent import ComparisonAgent
+from .semantic_comparison_agent import SemanticComparisonAgent
+from .bm25_comparison_agent import BM25ComparisonAgent
 from .ranking_agent import RankingAgent
 from .communication_agent import CommunicationAgent
+from .smtp_sender import SmtpSender
+from .notification_outbox import NotificationOutbox
+from .resume_index import ResumeIndex
+from .semantic_index import SemanticIndex
+from .bm25_index import BM25Index
+from .extraction_cache import ExtractionCache
 
 __all__ = [
     'DocumentReader',
+    'create_chat_client',
+    'create_async_chat_client',
     'AzureExtractor',
+    'AsyncAzureExtractor',
+    'LocalExtractor',
+    'TieredExtractor',
+    'TitleMatcher',
     'ComparisonAgent', 
+    'SemanticComparisonAgent',
+    'BM25ComparisonAgent',
     'RankingAgent',
-    'CommunicationAgent'
+    'CommunicationAgent',
+    'SmtpSender',
+    'NotificationOutbox',
+    'ResumeIndex',
+    'SemanticIndex',
+    'BM25Index',
+    'ExtractionCache'
 ]
\ No newline at end of file
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional
+from azure.ai.inference.aio import ChatCompletionsClient
+from azure.ai.inference.models import SystemMessage, UserMessage
+from azure.core.exceptions import HttpResponseError
+from interfaces import ExtractorInterface
+from config.settings import (
+    AZURE_MODEL, EXTRACTION_PROMPT_VERSION,
+    AZURE_REQUESTS_PER_MINUTE, AZURE_TOKENS_PER_MINUTE, AZURE_MAX_CONCURRENCY,
+    AZURE_MAX_RETRIES, AZURE_RETRY_BASE_DELAY, AZURE_RETRY_MAX_DELAY, AZURE_COMPLETION_TOKENS_ESTIMATE
+)
+from utilities import RateLimitScheduler
+from .azure_client import create_async_chat_client
+from .azure_extractor import EXTRACTION_SYSTEM_PROMPT, build_extraction_prompt
+from .extraction_cache import ExtractionCache
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class AsyncAzureExtractor(ExtractorInterface):
+    """
+    Extractor built on the async ChatCompletionsClient.
+
+    Requests are admitted by a token-bucket scheduler sized to the model's
+    requests-per-minute and tokens-per-minute budgets. Rate-limit and transient
+    server errors are retried with jittered exponential backoff that honours
+    Retry-After. ``extract_many`` runs a whole batch as concurrent tasks, bounded
+    only by ``max_concurrency`` and the rate budget; the blocking calls run on a
+    background event loop shared by all calling threads, so the budget is enforced
+    process-wide. Cache lookups run in worker threads to keep the loop responsive.
+    ``close`` releases the client and stops the loop.
+    """
+
+    def __init__(self, cache: Optional[ExtractionCache] = None, client: Optional[ChatCompletionsClient] = None,
+                 requests_per_minute: int = AZURE_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = AZURE_TOKENS_PER_MINUTE,
+                 max_concurrency: int = AZURE_MAX_CONCURRENCY,
+                 max_retries: int = AZURE_MAX_RETRIES):
+        self.cache = cache
+        self.scheduler = RateLimitScheduler(requests_per_minute, tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._client = client or create_async_chat_client()
+        self._semaphore = None
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    def extract_resume_info(self, text: str) -> Dict:
+        return asyncio.run_coroutine_threadsafe(self.extract_resume_info_async(text), self._get_loop()).result()
+
+    def extract_many(self, texts: List[str],
+                     on_result: Optional[Callable[[int, Dict], None]] = None) -> List[Dict]:
+        """Extract every text concurrently; ``on_result(index, info)`` is called as each one finishes"""
+        async def extract(idx: int, text: str) -> Dict:
+            info = await self.extract_resume_info_async(text)
+            if on_result is not None:
+                on_result(idx, info)
+            return info
+
+        async def gather():
+            return await asyncio.gather(*(extract(idx, text) for idx, text in enumerate(texts)))
+        # Tasks inherit the caller's context, so cache lookups count towards the caller's run
+        return asyncio.run_coroutine_threadsafe(gather(), self._get_loop()).result()
+
+    async def extract_resume_info_async(self, text: str) -> Dict:
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ExtractionCache.make_key(text, AZURE_MODEL, EXTRACTION_PROMPT_VERSION)
+            cached_info = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached_info is not None:
+                return cached_info
+
+        prompt = build_extraction_prompt(text)
+        estimated_tokens = len(prompt) // 4 + AZURE_COMPLETION_TOKENS_ESTIMATE
+
+        async with self._get_semaphore():
+            for attempt in range(self.max_retries + 1):
+                await self.scheduler.acquire(estimated_tokens)
+                try:
+                    response = await self._client.complete(
+                        messages=[
+                            SystemMessage(EXTRACTION_SYSTEM_PROMPT),
+                            UserMessage(prompt),
+                        ],
+                        temperature=0.3,
+                        top_p=1,
+                        model=AZURE_MODEL
+                    )
+                except HttpResponseError as e:
+                    if e.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                        delay = self._backoff_delay(attempt, e.response)
+                        print(f"Azure extraction throttled ({e.status_code}), retrying in {delay:.1f}s "
+                              f"(attempt {attempt + 1}/{self.max_retries})")
+                        self.scheduler.pause(delay)
+                        continue
+                    print(f"Azure extraction error: {str(e)}")
+                    return {}
+                except Exception as e:
+                    print(f"Azure extraction error: {str(e)}")
+                    return {}
+
+                usage = getattr(response, "usage", None)
+                if usage is not None and usage.total_tokens:
+                    self.scheduler.record_usage(estimated_tokens, usage.total_tokens)
+
+                try:
+                    info = json.loads(response.choices[0].message.content)
+                except Exception as e:
+                    print(f"Azure extraction error: {str(e)}")
+                    return {}
+
+                if cache_key is not None and info:
+                    await asyncio.to_thread(self.cache.put, cache_key, info)
+                return info
+
+        return {}
+
+    def close(self) -> None:
+        with self._loop_lock:
+            # Without a loop the client never opened a session
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result()
+            self._semaphore = None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def _backoff_delay(self, attempt: int, response) -> float:
+        delay = random.uniform(0, min(AZURE_RETRY_MAX_DELAY, AZURE_RETRY_BASE_DELAY * 2 ** attempt))
+        retry_after = self._retry_after_seconds(response)
+        if retry_after is not None:
+            delay = max(delay, retry_after) + random.uniform(0, AZURE_RETRY_BASE_DELAY)
+        return delay
+
+    @staticmethod
+    def _retry_after_seconds(response) -> Optional[float]:
+        if response is None:
+            return None
+
+        headers = response.headers
+        if headers.get("retry-after-ms"):
+            try:
+                return float(headers["retry-after-ms"]) / 1000
+            except ValueError:
+                pass
+
+        retry_after = headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="azure-extractor-loop", daemon=True).start()
+            return self._loop
@@ -0,0 +1,17 @@
+from azure.ai.inference import ChatCompletionsClient
+from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
+from azure.core.credentials import AzureKeyCredential
+from config.settings import AZURE_ENDPOINT, AZURE_TOKEN
+
+def create_chat_client() -> ChatCompletionsClient:
+    return ChatCompletionsClient(
+        endpoint=AZURE_ENDPOINT,
+        credential=AzureKeyCredential(AZURE_TOKEN),
+    )
+
+def create_async_chat_client() -> AsyncChatCompletionsClient:
+    # The async transport needs aiohttp, listed in requirements.txt
+    return AsyncChatCompletionsClient(
+        endpoint=AZURE_ENDPOINT,
+        credential=AzureKeyCredential(AZURE_TOKEN),
+    )
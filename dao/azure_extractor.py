@@ -1,21 +1,22 @@
 import json
-from typing import Dict
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from azure.ai.inference import ChatCompletionsClient
 from azure.ai.inference.models import SystemMessage, UserMessage
-from azure.core.credentials import AzureKeyCredential
 from interfaces import ExtractorInterface
-from config.settings import AZURE_ENDPOINT, AZURE_MODEL, AZURE_TOKEN
+from config.settings import (
+    AZURE_MODEL, EXTRACTION_PROMPT_VERSION,
+    EXTRACTION_BATCH_TOKEN_BUDGET, EXTRACTION_BATCH_MAX_ITEMS, EXTRACTION_BATCH_MAX_RETRIES
+)
+from .azure_client import create_chat_client
+from .extraction_cache import ExtractionCache
 
-class AzureExtractor(ExtractorInterface):
-    
-    def __init__(self):
-        self.client = ChatCompletionsClient(
-            endpoint=AZURE_ENDPOINT,
-            credential=AzureKeyCredential(AZURE_TOKEN),
-        )
-    
-    def extract_resume_info(self, text: str) -> Dict:
-        prompt = f"""
+EXTRACTION_SYSTEM_PROMPT = "You are an expert resume parser."
+EXTRACTION_KEYS = ("name", "email", "phone", "skills", "experience_years", "education", "summary")
+
+def build_extraction_prompt(text: str) -> str:
+    return f"""
         Extract the following from this resume:
         - Name
         - Email
@@ -30,10 +31,106 @@ class AzureExtractor(ExtractorInterface):
         Resume:
         {text}
         """
+
+def build_batch_extraction_prompt(resumes: Dict[str, str]) -> str:
+    sections = "\n\n".join(f"=== RESUME {resume_id} ===\n{text}" for resume_id, text in resumes.items())
+    return f"""
+        Extract the following from each resume below:
+        - Name
+        - Email
+        - Phone
+        - Skills
+        - Experience (in years)
+        - Education
+        - Summary
+
+        Provide a JSON array with exactly one object per resume. Each object must have the keys:
+        resume_id, name, email, phone, skills (list), experience_years, education, summary.
+        Copy resume_id from the resume's "=== RESUME <id> ===" header.
+
+        {sections}
+        """
+
+def parse_json_content(content: str):
+    content = content.strip()
+    if content.startswith("```"):
+        content = re.sub(r"```(?:json)?\n?(.*?)```", r"\1", content, flags=re.DOTALL)
+    return json.loads(content)
+
+def is_valid_extraction(info) -> bool:
+    return (
+        isinstance(info, dict)
+        and all(key in info for key in EXTRACTION_KEYS)
+        and isinstance(info["skills"], list)
+    )
+
+class AzureExtractor(ExtractorInterface):
+
+    def __init__(self, cache: Optional[ExtractionCache] = None, client: Optional[ChatCompletionsClient] = None):
+        self.cache = cache
+        self.client = client or create_chat_client()
+
+    def extract_resume_info(self, text: str) -> Dict:
+        cache_key = self._cache_key(text)
+        if cache_key is not None:
+            cached_info = self.cache.get(cache_key)
+            if cached_info is not None:
+                return cached_info
+
+        return self._extract_single(text, cache_key)
+
+    def extract_batch(self, texts: List[str], max_workers: int = 1) -> List[Dict]:
+        """
+        Extract several resumes per request, packing prompts up to
+        EXTRACTION_BATCH_TOKEN_BUDGET. Results come back in input order; items
+        whose array element is missing or invalid are retried on their own.
+        """
+        results = [{} for _ in texts]
+        cache_keys = {}
+        pending = []
+
+        for idx, text in enumerate(texts):
+            if not text:
+                continue
+            cache_key = self._cache_key(text)
+            if cache_key is not None:
+                cached_info = self.cache.get(cache_key)
+                if cached_info is not None:
+                    results[idx] = cached_info
+                    continue
+            cache_keys[idx] = cache_key
+            pending.append(idx)
+
+        def run_batch(batch: List[int]) -> None:
+            remaining = batch
+            for _ in range(EXTRACTION_BATCH_MAX_RETRIES + 1):
+                if len(remaining) <= 1:
+                    break
+                extracted = self._complete_batch({f"r{idx}": texts[idx] for idx in remaining})
+                for idx in remaining:
+                    info = extracted.get(f"r{idx}")
+                    if info:
+                        results[idx] = info
+                        if cache_keys[idx] is not None:
+                            self.cache.put(cache_keys[idx], info)
+                remaining = [idx for idx in remaining if not results[idx]]
+
+            for idx in remaining:
+                results[idx] = self._extract_single(texts[idx], cache_keys[idx])
+
+        batches = self._pack_batches(pending, texts)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for future in [executor.submit(run_batch, batch) for batch in batches]:
+                future.result()
+
+        return results
+
+    def _extract_single(self, text: str, cache_key: Optional[str]) -> Dict:
+        prompt = build_extraction_prompt(text)
         try:
             response = self.client.complete(
                 messages=[
-                    SystemMessage("You are an expert resume parser."),
+                    SystemMessage(EXTRACTION_SYSTEM_PROMPT),
                     UserMessage(prompt),
                 ],
                 temperature=0.3,
@@ -41,7 +138,65 @@ class AzureExtractor(ExtractorInterface):
                 model=AZURE_MODEL
             )
             content = response.choices[0].message.content
-            return json.loads(content)
+            info = json.loads(content)
+            if cache_key is not None and info:
+                self.cache.put(cache_key, info)
+            return info
         except Exception as e:
             print(f"Azure extraction error: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+
+    def _complete_batch(self, resumes: Dict[str, str]) -> Dict[str, Dict]:
+        """Return the valid extractions from one batched request, keyed by resume ID"""
+        try:
+            response = self.client.complete(
+                messages=[
+                    SystemMessage(EXTRACTION_SYSTEM_PROMPT),
+                    UserMessage(build_batch_extraction_prompt(resumes)),
+                ],
+                temperature=0.3,
+                top_p=1,
+                model=AZURE_MODEL
+            )
+            items = parse_json_content(response.choices[0].message.content)
+        except Exception as e:
+            print(f"Azure batch extraction error: {str(e)}")
+            return {}
+
+        if isinstance(items, dict):
+            items = next((value for value in items.values() if isinstance(value, list)), [])
+
+        extracted = {}
+        for item in items if isinstance(items, list) else []:
+            if not is_valid_extraction(item) or item.get("resume_id") not in resumes:
+                continue
+            resume_id = item.pop("resume_id")
+            extracted[resume_id] = item
+
+        failed = len(resumes) - len(extracted)
+        if failed:
+            print(f"Azure batch extraction: {failed}/{len(resumes)} items missing or invalid")
+        return extracted
+
+    @staticmethod
+    def _pack_batches(indices: List[int], texts: List[str]) -> List[List[int]]:
+        batches = []
+        current = []
+        current_tokens = 0
+        for idx in indices:
+            tokens = len(texts[idx]) // 4
+            if current and (current_tokens + tokens > EXTRACTION_BATCH_TOKEN_BUDGET
+                            or len(current) >= EXTRACTION_BATCH_MAX_ITEMS):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(idx)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _cache_key(self, text: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return ExtractionCache.make_key(text, AZURE_MODEL, EXTRACTION_PROMPT_VERSION)
@@ -0,0 +1,44 @@
+from typing import List, Optional
+import numpy as np
+from entities import Profile, JobDescription
+from config.settings import BM25_EXACT_LIMIT, BM25_SEARCH_TOP_K
+from utilities import SkillVocabulary
+from .comparison_agent import ComparisonAgent
+from .bm25_index import BM25Index
+
+class BM25ComparisonAgent(ComparisonAgent):
+    """
+    ComparisonAgent whose text signal is the BM25 score of the job description
+    against a persisted inverted index. BM25 is unbounded, so each score is divided by
+    the job description's own upper bound (BM25Index.max_scores), which keeps the text
+    signal on the same 0-1 scale as the skill and title signals without making a
+    resume's score depend on the others in the run. Runs of more than BM25_EXACT_LIMIT resumes score only
+    the top candidates found with MaxScore pruning; the rest get a text similarity of 0.
+    """
+
+    def __init__(self, bm25_index: Optional[BM25Index] = None, skill_vocabulary: Optional[SkillVocabulary] = None):
+        super().__init__(skill_vocabulary=skill_vocabulary)
+        self.bm25_index = bm25_index or BM25Index()
+
+    def _text_similarities(self, job_description: JobDescription, profiles: List[Profile],
+                           profile_texts: List[str]) -> np.ndarray:
+        return self._text_similarity_matrix([job_description], profiles, profile_texts)[0]
+
+    def _text_similarity_matrix(self, job_descriptions: List[JobDescription], profiles: List[Profile],
+                                profile_texts: List[str]) -> np.ndarray:
+        content_hashes = [profile.content_hash for profile in profiles]
+        self.bm25_index.add(dict(zip(content_hashes, profile_texts)))
+        query_texts = [job_description.raw_text for job_description in job_descriptions]
+
+        if len(profiles) > BM25_EXACT_LIMIT:
+            # MaxScore pruning works per query, so large pools are searched one job description at a time
+            allowed = set(content_hashes)
+            similarities = np.zeros((len(query_texts), len(content_hashes)))
+            for row, query_text in enumerate(query_texts):
+                scores = dict(self.bm25_index.top_k(query_text, BM25_SEARCH_TOP_K, allowed=allowed))
+                similarities[row] = [scores.get(h, 0.0) for h in content_hashes]
+        else:
+            similarities = self.bm25_index.score_matrix(query_texts, content_hashes)
+
+        bounds = self.bm25_index.max_scores(query_texts)[:, np.newaxis]
+        return np.divide(similarities, bounds, out=np.zeros_like(similarities, dtype=float), where=bounds > 0)
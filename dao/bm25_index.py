@@ -0,0 +1,286 @@
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from config.settings import BM25_INDEX_FOLDER, BM25_K1, BM25_B
+from utilities import IndexStore
+
+class BM25Index:
+    """
+    On-disk BM25 inverted index over resumes keyed by content hash.
+
+    Postings are stored term-major as flat arrays: ``offsets[t]:offsets[t+1]``
+    slices ``docs`` and ``tfs`` for term ``t``, with doc IDs ascending; added resumes
+    get the next doc IDs, so their postings are merged in at the end of each slice.
+    Per-posting BM25 impacts and each term's maximum impact are derived on load and
+    after every add. ``top_k`` evaluates a query term-at-a-time with MaxScore pruning:
+    once the remaining terms' bounds cannot lift an unseen resume into the top k,
+    later terms are only probed for the surviving candidates by binary search.
+    """
+
+    ARRAY_FILES = ("offsets.npy", "docs.npy", "tfs.npy", "doc_lengths.npy")
+    HASHES_FILE = "hashes.npy"
+    VOCABULARY_FILE = "vocabulary.json"
+
+    def __init__(self, index_folder: str = BM25_INDEX_FOLDER, k1: float = BM25_K1, b: float = BM25_B):
+        self.index_folder = index_folder
+        self.k1 = k1
+        self.b = b
+        self.store = IndexStore(index_folder)
+        self._lock = threading.Lock()
+        self._analyzer = CountVectorizer(stop_words='english').build_analyzer()
+        self._reset()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self.row_of
+
+    def add(self, documents: Dict[str, str]) -> None:
+        """Add resumes given as {content_hash: text}; already indexed hashes are skipped"""
+        with self._lock:
+            new_documents = {h: text for h, text in documents.items() if h not in self.row_of}
+            if not new_documents:
+                return
+
+            new_terms, new_docs, new_tfs, new_lengths = [], [], [], []
+            for doc_id, text in enumerate(new_documents.values(), start=len(self.hashes)):
+                counts = Counter(self._analyzer(text))
+                for term, tf in counts.items():
+                    new_terms.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                    new_docs.append(doc_id)
+                    new_tfs.append(tf)
+                new_lengths.append(sum(counts.values()))
+
+            self._merge_postings(
+                np.asarray(new_terms, dtype=np.int64),
+                np.asarray(new_docs, dtype=np.int32),
+                np.asarray(new_tfs, dtype=np.int32)
+            )
+            self.doc_lengths = np.concatenate([self.doc_lengths, np.asarray(new_lengths, dtype=np.float32)])
+            self.hashes.extend(new_documents)
+            self._rebuild_row_lookup()
+            self._compute_impacts()
+            self.save()
+
+    def remove(self, content_hashes: Iterable[str]) -> None:
+        with self._lock:
+            to_remove = set(content_hashes) & set(self.row_of)
+            if not to_remove:
+                return
+
+            removed = np.zeros(len(self.hashes), dtype=bool)
+            removed[[self.row_of[h] for h in to_remove]] = True
+            # Dropping postings keeps both term and doc order, so nothing needs sorting;
+            # surviving docs and terms are renumbered densely
+            keep = ~removed[self.docs]
+            new_doc_ids = np.cumsum(~removed) - 1
+            terms = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))[keep]
+            counts = np.bincount(terms, minlength=len(self.vocabulary))
+            new_term_ids = np.cumsum(counts > 0) - 1
+
+            self.docs = new_doc_ids[self.docs[keep]].astype(np.int32)
+            self.tfs = np.asarray(self.tfs)[keep]
+            self.offsets = np.concatenate([[0], np.cumsum(counts[counts > 0])]).astype(np.int64)
+            self.vocabulary = {term: int(new_term_ids[term_id]) for term, term_id in self.vocabulary.items()
+                               if counts[term_id]}
+            self.doc_lengths = np.asarray(self.doc_lengths)[~removed]
+            self.hashes = [h for row, h in enumerate(self.hashes) if not removed[row]]
+            self._rebuild_row_lookup()
+            self._compute_impacts()
+            self.save()
+
+    def score(self, query_text: str, content_hashes: List[str]) -> np.ndarray:
+        """Exact BM25 score of each given resume, in the given order"""
+        with self._lock:
+            scores = np.zeros(len(content_hashes), dtype=np.float32)
+            if not self.hashes or not content_hashes:
+                return scores
+
+            doc_ids = np.asarray([self.row_of.get(h, -1) for h in content_hashes], dtype=np.int64)
+            for term_id in self._query_terms(query_text):
+                docs, impacts = self._postings(term_id)
+                positions = np.minimum(np.searchsorted(docs, doc_ids), len(docs) - 1)
+                hits = docs[positions] == doc_ids
+                scores[hits] += impacts[positions[hits]]
+            return scores
+
+    def score_matrix(self, query_texts: List[str], content_hashes: List[str]) -> np.ndarray:
+        """Exact BM25 score of every query against every given resume, one row per query"""
+        with self._lock:
+            scores = np.zeros((len(query_texts), len(content_hashes)), dtype=np.float32)
+            if not self.hashes or not content_hashes:
+                return scores
+
+            # Each posting list is read once, however many queries share its term
+            queries_of: Dict[int, List[int]] = {}
+            for query_row, query_text in enumerate(query_texts):
+                for term_id in self._query_terms(query_text):
+                    queries_of.setdefault(term_id, []).append(query_row)
+
+            doc_ids = np.asarray([self.row_of.get(h, -1) for h in content_hashes], dtype=np.int64)
+            for term_id, query_rows in queries_of.items():
+                docs, impacts = self._postings(term_id)
+                positions = np.minimum(np.searchsorted(docs, doc_ids), len(docs) - 1)
+                hits = docs[positions] == doc_ids
+                scores[np.ix_(query_rows, np.flatnonzero(hits))] += impacts[positions[hits]]
+            return scores
+
+    def max_scores(self, query_texts: List[str]) -> np.ndarray:
+        """
+        Upper bound on the BM25 score of each query against any resume: its terms'
+        IDF times the k1 + 1 that term-frequency saturation approaches
+        """
+        with self._lock:
+            bounds = np.zeros(len(query_texts), dtype=np.float32)
+            if not self.hashes:
+                return bounds
+
+            idf = self._idf(np.diff(self.offsets))
+            for row, query_text in enumerate(query_texts):
+                bounds[row] = (self.k1 + 1) * idf[self._query_terms(query_text)].sum()
+            return bounds
+
+    def top_k(self, query_text: str, k: int, allowed: Optional[Set[str]] = None) -> List[Tuple[str, float]]:
+        """Best k (content_hash, BM25 score) pairs, optionally limited to ``allowed`` hashes"""
+        with self._lock:
+            term_ids = self._query_terms(query_text)
+            if not self.hashes or not term_ids or k <= 0:
+                return []
+
+            allowed_mask = None
+            if allowed is not None:
+                allowed_mask = np.zeros(len(self.hashes), dtype=bool)
+                allowed_mask[[self.row_of[h] for h in allowed if h in self.row_of]] = True
+
+            # Highest-impact terms first; remaining[i] bounds what terms i.. can add to any resume
+            term_ids = sorted(term_ids, key=lambda t: -self.max_impacts[t])
+            remaining = np.concatenate([np.cumsum([self.max_impacts[t] for t in term_ids][::-1])[::-1], [0.0]])
+
+            candidates = np.zeros(0, dtype=np.int64)
+            scores = np.zeros(0, dtype=np.float32)
+            for i, term_id in enumerate(term_ids):
+                docs, impacts = self._postings(term_id)
+                threshold = self._kth_score(scores, k)
+
+                if remaining[i] > threshold:
+                    # An unseen resume could still reach the top k: merge the whole posting list
+                    if allowed_mask is not None:
+                        keep = allowed_mask[docs]
+                        docs, impacts = docs[keep], impacts[keep]
+                    merged, inverse = np.unique(np.concatenate([candidates, docs]), return_inverse=True)
+                    scores = np.bincount(inverse, weights=np.concatenate([scores, impacts]),
+                                         minlength=len(merged)).astype(np.float32)
+                    candidates = merged
+                elif len(candidates):
+                    # Only current candidates can still qualify: probe this list for them alone
+                    positions = np.minimum(np.searchsorted(docs, candidates), len(docs) - 1)
+                    hits = docs[positions] == candidates
+                    scores[hits] += impacts[positions[hits]]
+
+                threshold = self._kth_score(scores, k)
+                if threshold > 0:
+                    survivors = scores + remaining[i + 1] >= threshold
+                    candidates, scores = candidates[survivors], scores[survivors]
+
+            if len(scores) > k:
+                keep = np.argpartition(-scores, k - 1)[:k]
+                candidates, scores = candidates[keep], scores[keep]
+            order = np.argsort(-scores)
+            return [(self.hashes[candidates[i]], float(scores[i])) for i in order]
+
+    def save(self) -> None:
+        self.store.save({"k1": self.k1, "b": self.b}, {
+            **dict(zip(self.ARRAY_FILES, (self.offsets, self.docs, self.tfs, self.doc_lengths))),
+            self.HASHES_FILE: np.asarray(self.hashes, dtype=str),
+            self.VOCABULARY_FILE: self.vocabulary
+        }, len(self.hashes))
+
+    def load(self) -> None:
+        if not self.store.exists():
+            return
+
+        try:
+            _, base, _ = self.store.load()
+            self.offsets, self.docs, self.tfs, self.doc_lengths = (base[name] for name in self.ARRAY_FILES)
+            self.hashes = base[self.HASHES_FILE].tolist()
+            self.vocabulary = base[self.VOCABULARY_FILE]
+            self._rebuild_row_lookup()
+            self._compute_impacts()
+        except Exception as e:
+            print(f"Could not load BM25 index from {self.index_folder}, starting empty: {e}")
+            self.store.quarantine()
+            self._reset()
+
+    def _reset(self) -> None:
+        self.vocabulary: Dict[str, int] = {}
+        self.hashes: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.docs = np.zeros(0, dtype=np.int32)
+        self.tfs = np.zeros(0, dtype=np.int32)
+        self.doc_lengths = np.zeros(0, dtype=np.float32)
+        self.impacts = np.zeros(0, dtype=np.float32)
+        self.max_impacts = np.zeros(0, dtype=np.float32)
+
+    def _compute_impacts(self) -> None:
+        if not len(self.docs):
+            self.impacts = np.zeros(0, dtype=np.float32)
+            self.max_impacts = np.zeros(len(self.vocabulary), dtype=np.float32)
+            return
+
+        document_frequency = np.diff(self.offsets)
+        idf = self._idf(document_frequency)
+        terms = np.repeat(np.arange(len(document_frequency)), document_frequency)
+        tfs = np.asarray(self.tfs, dtype=np.float32)
+        length_norm = 1 - self.b + self.b * self.doc_lengths[self.docs] / max(float(self.doc_lengths.mean()), 1.0)
+        self.impacts = (idf[terms] * tfs * (self.k1 + 1) / (tfs + self.k1 * length_norm)).astype(np.float32)
+        # Every term in the vocabulary has at least one posting, so no reduceat segment is empty
+        self.max_impacts = np.maximum.reduceat(self.impacts, self.offsets[:-1])
+
+    def _idf(self, document_frequency: np.ndarray) -> np.ndarray:
+        return np.log1p((len(self.hashes) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _merge_postings(self, new_terms: np.ndarray, new_docs: np.ndarray, new_tfs: np.ndarray) -> None:
+        # New doc IDs are above every indexed one, so each term's new postings go after
+        # its old ones; existing postings are shifted in bulk rather than re-sorted
+        old_counts = np.zeros(len(self.vocabulary), dtype=np.int64)
+        old_counts[:len(self.offsets) - 1] = np.diff(self.offsets)
+        new_counts = np.bincount(new_terms, minlength=len(self.vocabulary))
+        offsets = np.concatenate([[0], np.cumsum(old_counts + new_counts)]).astype(np.int64)
+
+        docs = np.empty(offsets[-1], dtype=np.int32)
+        tfs = np.empty(offsets[-1], dtype=np.int32)
+        old_offsets = np.concatenate([[0], np.cumsum(old_counts)])
+        old_positions = np.arange(len(self.docs)) + np.repeat(offsets[:-1] - old_offsets[:-1], old_counts)
+        docs[old_positions] = self.docs
+        tfs[old_positions] = self.tfs
+
+        # Stable, so a term's new postings keep their ascending doc order
+        order = np.argsort(new_terms, kind='stable')
+        sorted_terms = new_terms[order]
+        rank = np.arange(len(order)) - np.searchsorted(sorted_terms, sorted_terms)
+        new_positions = offsets[sorted_terms] + old_counts[sorted_terms] + rank
+        docs[new_positions] = new_docs[order]
+        tfs[new_positions] = new_tfs[order]
+
+        self.offsets, self.docs, self.tfs = offsets, docs, tfs
+
+    def _postings(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = int(self.offsets[term_id]), int(self.offsets[term_id + 1])
+        return self.docs[start:end], self.impacts[start:end]
+
+    def _query_terms(self, query_text: str) -> List[int]:
+        return [self.vocabulary[term] for term in dict.fromkeys(self._analyzer(query_text)) if term in self.vocabulary]
+
+    @staticmethod
+    def _kth_score(scores: np.ndarray, k: int) -> float:
+        if len(scores) < k:
+            return 0.0
+        return float(np.partition(scores, len(scores) - k)[len(scores) - k])
+
+    def _rebuild_row_lookup(self) -> None:
+        self.row_of = {h: row for row, h in enumerate(self.hashes)}
@@ -1,44 +1,50 @@
-import smtplib
-from typing import Dict
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import json
+from typing import Dict, Optional
 from interfaces import CommunicationInterface
-from config.settings import SMTP_SERVER, SMTP_PORT, EMAIL_ADDRESS, EMAIL_PASSWORD
+from utilities import TextUtils
+from .smtp_sender import SmtpSender, get_shared_sender
+from .notification_outbox import NotificationOutbox, get_shared_outbox
 
 class CommunicationAgent(CommunicationInterface):
     
-    def __init__(self, ar_requestor_email: str, recruiter_email: str):
+    def __init__(self, ar_requestor_email: str, recruiter_email: str,
+                 sender: Optional[SmtpSender] = None, outbox: Optional[NotificationOutbox] = None):
         self.ar_requestor_email = ar_requestor_email
         self.recruiter_email = recruiter_email
+        self.sender = sender or get_shared_sender()
+        self.outbox = outbox or get_shared_outbox()
 
     def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+        """Queue the email on the background sender; delivery errors are retried and logged there"""
         try:
-            msg = MIMEMultipart()
-            msg['From'] = EMAIL_ADDRESS
-            msg['To'] = recipient_email
-            msg['Subject'] = subject
-
-            msg.attach(MIMEText(body, 'plain'))
-
-            with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-                server.starttls()
-                server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-                server.sendmail(EMAIL_ADDRESS, recipient_email, msg.as_string())
-            print(f"Email sent successfully to {recipient_email}")
+            self.sender.submit(recipient_email, subject, body)
+            print(f"Email queued for {recipient_email}")
         except Exception as e:
-            print(f"Error sending email to {recipient_email}: {e}")
+            print(f"Error queueing email to {recipient_email}: {e}")
 
     def notify(self, match_result: Dict) -> None:
         top_matches = match_result.get("matches", [])
         job_id = match_result.get("job_id", "N/A")
         timestamp = match_result.get("timestamp", "")
 
+        # Re-notifying the same job with an unchanged result is deduplicated by the outbox
+        result_hash = TextUtils.content_hash(json.dumps(top_matches, sort_keys=True, default=str))
+
         if top_matches:
-            self._send_success_notification(top_matches, job_id, timestamp)
+            self._send_success_notification(top_matches, job_id, timestamp, result_hash)
         else:
-            self._send_no_matches_notification(job_id, timestamp)
+            self._send_no_matches_notification(job_id, timestamp, result_hash)
+
+    def _queue_notification(self, job_id: str, recipient_email: str, subject: str, body: str, result_hash: str) -> None:
+        try:
+            if self.outbox.enqueue(job_id, recipient_email, subject, body, result_hash):
+                print(f"Notification for job {job_id} queued for {recipient_email}")
+            else:
+                print(f"Notification for job {job_id} to {recipient_email} already queued, skipping")
+        except Exception as e:
+            print(f"Error queueing notification to {recipient_email}: {e}")
 
-    def _send_success_notification(self, top_matches: list, job_id: str, timestamp: str) -> None:
+    def _send_success_notification(self, top_matches: list, job_id: str, timestamp: str, result_hash: str) -> None:
         subject = f"Top Candidates for Job ID {job_id}"
         body = f"Hello,\n\nHere are the top {len(top_matches)} matching candidates for the job posting (Job ID: {job_id}):\n\n"
         
@@ -55,13 +61,13 @@ class CommunicationAgent(CommunicationInterface):
             )
         
         body += f"Timestamp: {timestamp}\n\nRegards,\nRecruitment Matching System"
-        self.send_email(self.ar_requestor_email, subject, body)
+        self._queue_notification(job_id, self.ar_requestor_email, subject, body, result_hash)
 
-    def _send_no_matches_notification(self, job_id: str, timestamp: str) -> None:
+    def _send_no_matches_notification(self, job_id: str, timestamp: str, result_hash: str) -> None:
         subject = f"No Matching Profiles for Job ID {job_id}"
         body = (
             f"Hello,\n\nNo suitable consultant profiles were found for the job posting (Job ID: {job_id}).\n"
             f"Please consider refining the job criteria or uploading more resumes.\n\n"
             f"Timestamp: {timestamp}\n\nRegards,\nRecruitment Matching System"
         )
-        self.send_email(self.recruiter_email, subject, body)
\ No newline at end of file
+        self._queue_notification(job_id, self.recruiter_email, subject, body, result_hash)
\ No newline at end of file
@@ -1,33 +1,116 @@
-from typing import List
+from typing import List, Optional
+import numpy as np
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from interfaces import ComparisonInterface
 from entities import Profile, JobDescription
 from config.settings import MAX_TFIDF_FEATURES, NGRAM_RANGE
+from utilities import AhoCorasick, SkillVocabulary
+from .resume_index import ResumeIndex
+from .title_matcher import TitleMatcher
 
 class ComparisonAgent(ComparisonInterface):
-    
-    def __init__(self):
+
+    def __init__(self, resume_index: Optional[ResumeIndex] = None, skill_vocabulary: Optional[SkillVocabulary] = None):
+        self.resume_index = resume_index
+        self.skill_vocabulary = skill_vocabulary or SkillVocabulary()
         self.vectorizer = TfidfVectorizer(
-            stop_words='english', 
-            max_features=MAX_TFIDF_FEATURES, 
+            stop_words='english',
+            max_features=MAX_TFIDF_FEATURES,
             ngram_range=NGRAM_RANGE
         )
 
     def calculate_similarity(self, job_description: JobDescription, profile: Profile) -> float:
-        documents = [job_description.raw_text, profile.raw_text]
-        tfidf_matrix = self.vectorizer.fit_transform(documents)
-        text_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+        profile_text = profile.normalized_text
+        text_similarity = float(self._text_similarities(job_description, [profile], [profile_text])[0])
+        skill_similarity = float(self._skill_similarities(job_description, [profile])[0])
+        title_similarity = TitleMatcher(job_description).score(profile_text)
+        return float(self._combine_scores(text_similarity, skill_similarity, title_similarity))
 
-        jd_skills = set(s.lower() for s in job_description.required_skills)
-        profile_skills = set(s.lower() for s in profile.skills)
-        skill_similarity = len(jd_skills & profile_skills) / len(jd_skills) if jd_skills else 0
+    def compare_profiles_with_jd(self, job_description: JobDescription, profiles: List[Profile]) -> List[Profile]:
+        if not profiles:
+            return profiles
 
-        title_similarity = 1.0 if job_description.title.lower() in profile.raw_text.lower() else 0.0
+        # Normalized resume texts are loaded from their handles once for this stage and dropped
+        # afterwards. TF-IDF lowercases and tokenizes anyway, so it scores them like the originals.
+        profile_texts = [profile.normalized_text for profile in profiles]
+        text_similarities = self._text_similarities(job_description, profiles, profile_texts)
+        skill_similarities = self._skill_similarities(job_description, profiles)
+        title_matcher = TitleMatcher(job_description)
+        for profile, profile_text, text_similarity, skill_similarity in zip(
+                profiles, profile_texts, text_similarities, skill_similarities):
+            profile.similarity_score = self._combine_scores(
+                float(text_similarity), float(skill_similarity), title_matcher.score(profile_text)
+            )
+        return profiles
 
-        return 0.6 * text_similarity + 0.3 * skill_similarity + 0.1 * title_similarity
+    def score_matrix(self, job_descriptions: List[JobDescription], profiles: List[Profile]) -> np.ndarray:
+        """Combined similarity of every profile to every job description, one row per job description"""
+        if not job_descriptions or not profiles:
+            return np.zeros((len(job_descriptions), len(profiles)))
 
-    def compare_profiles_with_jd(self, job_description: JobDescription, profiles: List[Profile]) -> List[Profile]:
-        for profile in profiles:
-            profile.similarity_score = self.calculate_similarity(job_description, profile)
-        return profiles
\ No newline at end of file
+        profile_texts = [profile.normalized_text for profile in profiles]
+        return self._combine_scores(
+            self._text_similarity_matrix(job_descriptions, profiles, profile_texts),
+            self._skill_similarity_matrix(job_descriptions, profiles),
+            self._title_similarity_matrix(job_descriptions, profile_texts)
+        )
+
+    def _text_similarities(self, job_description: JobDescription, profiles: List[Profile],
+                           profile_texts: List[str]) -> np.ndarray:
+        return self._text_similarity_matrix([job_description], profiles, profile_texts)[0]
+
+    def _text_similarity_matrix(self, job_descriptions: List[JobDescription], profiles: List[Profile],
+                                profile_texts: List[str]) -> np.ndarray:
+        query_texts = [job_description.raw_text for job_description in job_descriptions]
+        if self.resume_index is not None:
+            content_hashes = [profile.content_hash for profile in profiles]
+            self.resume_index.add(dict(zip(content_hashes, profile_texts)))
+            return self.resume_index.score_matrix(query_texts, content_hashes)
+
+        # Fit on the resume pool alone and transform the JDs into it, as the resume index
+        # does, so a JD scores the same alone or alongside others over the same pool.
+        # TfidfVectorizer rows are L2-normalised, so the sparse product gives cosines.
+        # A cloned vectorizer keeps concurrent runs on a shared agent independent.
+        vectorizer = clone(self.vectorizer)
+        try:
+            profile_matrix = vectorizer.fit_transform(profile_texts)
+        except ValueError:
+            # Only stop words (or nothing) in the pool
+            return np.zeros((len(query_texts), len(profile_texts)))
+        return (vectorizer.transform(query_texts) @ profile_matrix.T).toarray()
+
+    def _skill_similarities(self, job_description: JobDescription, profiles: List[Profile]) -> np.ndarray:
+        """Share of the JD's canonical skills each profile covers, as one sparse matrix product"""
+        skill_matrix = self.skill_vocabulary.encode(
+            [job_description.required_skills] + [profile.skills for profile in profiles]
+        )
+        jd_skill_count = skill_matrix[0].nnz
+        if not jd_skill_count:
+            return np.zeros(len(profiles))
+        return (skill_matrix[1:] @ skill_matrix[0].T).toarray().ravel() / jd_skill_count
+
+    def _skill_similarity_matrix(self, job_descriptions: List[JobDescription], profiles: List[Profile]) -> np.ndarray:
+        skill_matrix = self.skill_vocabulary.encode(
+            [job_description.required_skills for job_description in job_descriptions]
+            + [profile.skills for profile in profiles]
+        )
+        n_queries = len(job_descriptions)
+        jd_skill_counts = np.diff(skill_matrix.indptr[:n_queries + 1]).astype(float)
+        overlap = (skill_matrix[:n_queries] @ skill_matrix[n_queries:].T).toarray()
+        return np.divide(overlap, jd_skill_counts[:, np.newaxis],
+                         out=np.zeros_like(overlap), where=jd_skill_counts[:, np.newaxis] > 0)
+
+    def _title_similarity_matrix(self, job_descriptions: List[JobDescription], profile_texts: List[str]) -> np.ndarray:
+        # Every JD's patterns go into one automaton, so each resume is scanned once for all JDs
+        title_matchers = [TitleMatcher(job_description) for job_description in job_descriptions]
+        matcher = AhoCorasick(pattern for title_matcher in title_matchers for pattern in title_matcher.matcher.patterns)
+        similarities = np.zeros((len(title_matchers), len(profile_texts)))
+        for column, profile_text in enumerate(profile_texts):
+            counts = matcher.count(profile_text)
+            for row, title_matcher in enumerate(title_matchers):
+                similarities[row, column] = title_matcher.score_counts(counts)
+        return similarities
+
+    def _combine_scores(self, text_similarity: float, skill_similarity: float, title_similarity: float) -> float:
+        return 0.6 * text_similarity + 0.3 * skill_similarity + 0.1 * title_similarity
@@ -1,41 +1,168 @@
+import io
+import multiprocessing
+import threading
 import pdfplumber
 import fitz
 from docx import Document
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Union
 import warnings
 from interfaces import DocumentReaderInterface
+from config.settings import PDF_FAST_MODE, PDF_MAX_PAGES, PDF_PARALLEL_PAGE_THRESHOLD, PDF_PAGE_WORKERS
 
 warnings.filterwarnings("ignore", message="CropBox missing from /Page, defaulting to MediaBox")
 
+# A PDF is read either from a file path or from its bytes
+PdfSource = Union[str, bytes]
+
+def _open_fitz(source: PdfSource):
+    if isinstance(source, str):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+def _open_pdfplumber(source: PdfSource):
+    if isinstance(source, str):
+        return pdfplumber.open(source)
+    return pdfplumber.open(io.BytesIO(source))
+
+def _extract_page_range(source: PdfSource, start: int, stop: int) -> List[str]:
+    with _open_fitz(source) as doc:
+        return [doc[page_number].get_text() for page_number in range(start, stop)]
+
 class DocumentReader(DocumentReaderInterface):
-    
+
+    def __init__(self, fast_mode: bool = PDF_FAST_MODE, max_pages: Optional[int] = PDF_MAX_PAGES):
+        self.fast_mode = fast_mode
+        self.max_pages = max_pages
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        self._page_pool_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Readers are sent to ingestion worker processes; the page pool stays with its owner
+        state = self.__dict__.copy()
+        state["_page_pool"] = None
+        del state["_page_pool_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._page_pool_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the page pool, if one was started"""
+        with self._page_pool_lock:
+            if self._page_pool is not None:
+                self._page_pool.shutdown(wait=False, cancel_futures=True)
+                self._page_pool = None
+
     def read_pdf(self, file_path: str) -> str:
+        return self._read_pdf_source(file_path)
+
+    def read_bytes(self, data: bytes, ext: str) -> str:
+        """Read an in-memory document; ``ext`` is the file extension, e.g. '.pdf'"""
+        ext = ext.lower() if ext.startswith('.') else f".{ext.lower()}"
+        if ext == '.pdf':
+            return self._read_pdf_source(data if isinstance(data, bytes) else bytes(data))
+        elif ext == '.docx':
+            return self._read_docx_source(io.BytesIO(data))
+        return ""
+
+    def iter_pdf_pages(self, source: PdfSource) -> Iterator[str]:
+        """
+        Yield page texts in order using PyMuPDF, falling back to pdfplumber.
+        Documents longer than PDF_PARALLEL_PAGE_THRESHOLD pages are split into
+        page ranges extracted by a process pool the reader keeps for reuse, unless
+        this already is a worker process (e.g. of parallel ingestion). Callers may
+        stop iterating early; pending ranges are then cancelled.
+        """
         try:
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
+            doc = _open_fitz(source)
+        except Exception:
+            yield from self._iter_pdfplumber_pages(source)
+            return
+
+        with doc:
+            page_count = self._page_limit(doc)
+            if (page_count < PDF_PARALLEL_PAGE_THRESHOLD or PDF_PAGE_WORKERS <= 1
+                    or multiprocessing.parent_process() is not None):
+                for page in doc.pages(0, page_count):
+                    yield page.get_text()
+                return
+
+        yield from self._iter_pages_in_parallel(source, page_count)
+
+    def read_docx(self, file_path: str) -> str:
+        return self._read_docx_source(file_path)
+
+    def read_document(self, file_path: str) -> str:
+        ext = Path(file_path).suffix.lower()
+        if ext == '.pdf':
+            return self.read_pdf(file_path)
+        elif ext == '.docx':
+            return self.read_docx(file_path)
+        return ""
+
+    def _read_pdf_source(self, source: PdfSource) -> str:
+        if self.fast_mode:
+            try:
+                return "\n".join(self.iter_pdf_pages(source)).strip()
+            except Exception:
+                return "\n".join(self._iter_pdfplumber_pages(source)).strip()
+
+        try:
+            pages = []
+            with _open_pdfplumber(source) as pdf:
+                for page in pdf.pages[:self.max_pages]:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
-            return text.strip()
+                        pages.append(page_text)
+            return "\n".join(pages).strip()
         except Exception:
             try:
-                doc = fitz.open(file_path)
-                return "\n".join([page.get_text() for page in doc]).strip()
+                with _open_fitz(source) as doc:
+                    return "\n".join(page.get_text() for page in doc.pages(0, self._page_limit(doc))).strip()
             except Exception:
                 return ""
 
-    def read_docx(self, file_path: str) -> str:
+    def _read_docx_source(self, source) -> str:
         try:
-            doc = Document(file_path)
+            doc = Document(source)
             return "\n".join(p.text for p in doc.paragraphs).strip()
         except Exception:
             return ""
 
-    def read_document(self, file_path: str) -> str:
-        ext = Path(file_path).suffix.lower()
-        if ext == '.pdf':
-            return self.read_pdf(file_path)
-        elif ext == '.docx':
-            return self.read_docx(file_path)
-        return ""
\ No newline at end of file
+    def _iter_pages_in_parallel(self, source: PdfSource, page_count: int) -> Iterator[str]:
+        chunk_size = -(-page_count // PDF_PAGE_WORKERS)
+        executor = self._get_page_pool()
+        futures = [
+            executor.submit(_extract_page_range, source, start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = ProcessPoolExecutor(max_workers=PDF_PAGE_WORKERS)
+            return self._page_pool
+
+    def _iter_pdfplumber_pages(self, source: PdfSource) -> Iterator[str]:
+        try:
+            with _open_pdfplumber(source) as pdf:
+                for page in pdf.pages[:self.max_pages]:
+                    page_text = page.extract_text()
+                    if page_text:
+                        yield page_text
+        except Exception:
+            return
+
+    def _page_limit(self, doc) -> int:
+        if self.max_pages is None:
+            return doc.page_count
+        return min(doc.page_count, self.max_pages)
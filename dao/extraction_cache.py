@@ -0,0 +1,122 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+from config.settings import EXTRACTION_CACHE_PATH, EXTRACTION_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_TTL_SECONDS
+from utilities import FileUtils, TextUtils
+
+# Hit/miss counters of the run currently executing in this context, if any
+_run_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar("extraction_cache_run_stats", default=None)
+
+class ExtractionCache:
+    """
+    SQLite-backed cache of resume extraction results.
+
+    Entries are keyed by a hash of the normalized resume text, the model name and
+    the prompt version, expire after ``ttl_seconds`` and are evicted least recently
+    used first once the cache holds more than ``max_entries`` rows.
+    """
+
+    def __init__(self, db_path: str = EXTRACTION_CACHE_PATH,
+                 max_entries: int = EXTRACTION_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = EXTRACTION_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        FileUtils.ensure_directory_exists(os.path.dirname(db_path) or ".")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_accessed ON extraction_cache (last_accessed)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, model: str, prompt_version: str) -> str:
+        return TextUtils.content_hash("\x1f".join([model, prompt_version, TextUtils.normalize(text)]))
+
+    def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM extraction_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or self._is_expired(row[1], now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM extraction_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self._count("misses")
+                return None
+
+            self._conn.execute("UPDATE extraction_cache SET last_accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._count("hits")
+            return json.loads(row[0])
+
+    def put(self, key: str, info: Dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache (key, payload, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(info, ensure_ascii=False), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @contextmanager
+    def track(self) -> Iterator[Dict[str, int]]:
+        """
+        Count the hits and misses of lookups made in this context (and in contexts
+        copied from it) without touching the lifetime counters other runs read
+        """
+        run_stats = {"hits": 0, "misses": 0}
+        token = _run_stats.set(run_stats)
+        try:
+            yield run_stats
+        finally:
+            _run_stats.reset(token)
+
+    def _count(self, outcome: str) -> None:
+        # Called with self._lock held
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        run_stats = _run_stats.get()
+        if run_stats is not None:
+            run_stats[outcome] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM extraction_cache")
+            self._conn.commit()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds:
+            self._conn.execute("DELETE FROM extraction_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        overflow = self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM extraction_cache WHERE key IN "
+                "(SELECT key FROM extraction_cache ORDER BY last_accessed ASC LIMIT ?)",
+                (overflow,)
+            )
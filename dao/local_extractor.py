@@ -0,0 +1,117 @@
+import re
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from interfaces import ExtractorInterface
+from config.skills import SKILL_GAZETTEER, SKILL_ALIASES
+from utilities import AhoCorasick
+
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_PATTERN = re.compile(r"(?<![\w])(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}(?![\w])")
+EXPERIENCE_PATTERN = re.compile(
+    r"(\d{1,2}(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)\b(?:\s+of)?(?:\s+[\w-]+){0,3}?\s+experience",
+    re.IGNORECASE
+)
+YEAR_RANGE_PATTERN = re.compile(
+    r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now)\b",
+    re.IGNORECASE
+)
+DEGREE_PATTERN = re.compile(
+    r"\b(bachelor|master|b\.?\s?sc|m\.?\s?sc|b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|b\.?\s?a\b|m\.?\s?a\b|"
+    r"ph\.?\s?d|mba|associate degree|diploma)",
+    re.IGNORECASE
+)
+SUMMARY_HEADING_PATTERN = re.compile(
+    r"^\s*(professional summary|summary|profile|objective|about me)\s*:?\s*$",
+    re.IGNORECASE | re.MULTILINE
+)
+NAME_TOKEN_PATTERN = re.compile(r"^[A-Za-z][A-Za-z'.-]*$")
+NON_NAME_WORDS = {"resume", "curriculum", "vitae", "cv", "summary", "profile", "objective", "contact", "experience"}
+MAX_SUMMARY_CHARS = 500
+
+class LocalExtractor(ExtractorInterface):
+    """
+    Offline extractor built from compiled regexes and a skill gazetteer matched
+    with an Aho-Corasick automaton. ``extract_with_confidence`` also reports a
+    0-1 confidence per field so callers can decide which fields need the LLM.
+    """
+
+    def __init__(self, skill_gazetteer: Optional[List[str]] = None, skill_aliases: Optional[Dict[str, str]] = None):
+        skills = skill_gazetteer or SKILL_GAZETTEER
+        aliases = SKILL_ALIASES if skill_aliases is None else skill_aliases
+        self.canonical_skills = {skill.lower(): skill for skill in skills}
+        for alias, skill in aliases.items():
+            if " " in alias:
+                self.canonical_skills.setdefault(alias, skill)
+        self.skill_matcher = AhoCorasick(self.canonical_skills)
+
+    def extract_resume_info(self, text: str) -> Dict:
+        info, _ = self.extract_with_confidence(text)
+        return info
+
+    def extract_with_confidence(self, text: str) -> Tuple[Dict, Dict[str, float]]:
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+        name, name_confidence = self._extract_name(lines)
+        email_match = EMAIL_PATTERN.search(text)
+        phone_match = PHONE_PATTERN.search(text)
+        # Several spellings of one skill, e.g. "GCP" and "Google Cloud", report it once
+        skills = list(dict.fromkeys(self.canonical_skills[skill] for skill in self.skill_matcher.find_all(text.lower())))
+        experience_years, experience_confidence = self._extract_experience_years(text)
+        education = next((line for line in lines if DEGREE_PATTERN.search(line)), "")
+        summary, summary_confidence = self._extract_summary(text)
+
+        info = {
+            "name": name,
+            "email": email_match.group(0) if email_match else "",
+            "phone": phone_match.group(0).strip() if phone_match else "",
+            "skills": skills,
+            "experience_years": experience_years,
+            "education": education,
+            "summary": summary
+        }
+        confidence = {
+            "name": name_confidence,
+            "email": 0.95 if email_match else 0.0,
+            "phone": 0.85 if phone_match else 0.0,
+            "skills": 0.8 if len(skills) >= 3 else 0.4 if skills else 0.0,
+            "experience_years": experience_confidence,
+            "education": 0.7 if education else 0.0,
+            "summary": summary_confidence
+        }
+        return info, confidence
+
+    def _extract_name(self, lines: List[str]) -> Tuple[str, float]:
+        for position, line in enumerate(lines[:5]):
+            tokens = line.split()
+            if not 2 <= len(tokens) <= 4:
+                continue
+            if any(token.lower().strip(".") in NON_NAME_WORDS for token in tokens):
+                continue
+            if all(NAME_TOKEN_PATTERN.match(token) for token in tokens):
+                return line.title() if line.isupper() else line, 0.8 if position == 0 else 0.6
+        return "", 0.0
+
+    def _extract_experience_years(self, text: str) -> Tuple[Optional[float], float]:
+        stated = [float(match.group(1)) for match in EXPERIENCE_PATTERN.finditer(text)]
+        if stated:
+            return max(stated), 0.9
+
+        spans = []
+        for match in YEAR_RANGE_PATTERN.finditer(text):
+            start = int(match.group(1))
+            end = match.group(2)
+            spans.append((start, int(end) if end.isdigit() else None))
+        if spans:
+            first_year = min(start for start, _ in spans)
+            last_year = max(end if end is not None else date.today().year for _, end in spans)
+            return float(max(0, last_year - first_year)), 0.6
+
+        # Unknown, not zero: the pre-filter keeps resumes whose experience is unknown
+        return None, 0.0
+
+    def _extract_summary(self, text: str) -> Tuple[str, float]:
+        heading = SUMMARY_HEADING_PATTERN.search(text)
+        if heading:
+            paragraph = text[heading.end():].strip().split("\n\n")[0]
+            return " ".join(paragraph.split())[:MAX_SUMMARY_CHARS], 0.6
+        return " ".join(text.split())[:MAX_SUMMARY_CHARS], 0.2
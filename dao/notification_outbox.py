@@ -0,0 +1,202 @@
+import atexit
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+from config.settings import (
+    NOTIFICATION_OUTBOX_PATH, NOTIFICATION_DIGEST_WINDOW_SECONDS, NOTIFICATION_MAX_ATTEMPTS,
+    NOTIFICATION_RETRY_BASE_DELAY, NOTIFICATION_RETRY_MAX_DELAY, NOTIFICATION_POLL_INTERVAL_SECONDS,
+    NOTIFICATION_FLUSH_TIMEOUT_SECONDS
+)
+from utilities import FileUtils
+from .smtp_sender import SmtpSender, get_shared_sender
+
+class NotificationOutbox:
+    """
+    Durable SQLite outbox for notification emails.
+
+    ``enqueue`` only records the message, ignoring repeats of the same
+    (job_id, recipient, result_hash). A background drainer sends due messages,
+    coalescing everything pending for one recipient within the digest window
+    into a single email, and reschedules failed sends with exponential backoff.
+    Pending messages survive restarts and are sent by the next drainer.
+    ``flush`` sends everything pending immediately, for processes about to exit.
+    """
+
+    def __init__(self, sender: Optional[SmtpSender] = None, db_path: str = NOTIFICATION_OUTBOX_PATH,
+                 digest_window: float = NOTIFICATION_DIGEST_WINDOW_SECONDS,
+                 max_attempts: int = NOTIFICATION_MAX_ATTEMPTS,
+                 poll_interval: float = NOTIFICATION_POLL_INTERVAL_SECONDS):
+        self.sender = sender or get_shared_sender()
+        self.digest_window = digest_window
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # Serialises drain passes so a flush and the drainer never send the same rows
+        self._drain_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._drainer: Optional[threading.Thread] = None
+
+        FileUtils.ensure_directory_exists(os.path.dirname(db_path) or ".")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS notification_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                recipient TEXT NOT NULL,
+                result_hash TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                next_attempt_at REAL NOT NULL,
+                sent_at REAL,
+                last_error TEXT,
+                UNIQUE (job_id, recipient, result_hash)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notification_outbox_pending ON notification_outbox (status, recipient)"
+        )
+        self._conn.commit()
+
+    def enqueue(self, job_id: str, recipient: str, subject: str, body: str, result_hash: str) -> bool:
+        """Record a notification; returns False if the same one was already queued or sent"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO notification_outbox "
+                "(job_id, recipient, result_hash, subject, body, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, recipient, result_hash, subject, body, now, now)
+            )
+            self._conn.commit()
+        self.start()
+        self._wake.set()
+        return cursor.rowcount == 1
+
+    def drain(self, ignore_window: bool = False) -> int:
+        """Send every due notification once; returns the number of emails sent"""
+        with self._drain_lock:
+            return self._drain(0 if ignore_window else self.digest_window)
+
+    def flush(self, timeout: Optional[float] = NOTIFICATION_FLUSH_TIMEOUT_SECONDS) -> int:
+        """
+        Send all pending notifications now, without waiting for the digest window.
+        Failed sends are rescheduled as usual and left for a later drainer; no new
+        pass starts once ``timeout`` seconds have passed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        sent = 0
+        while True:
+            sent_now = self.drain(ignore_window=True)
+            sent += sent_now
+            if not sent_now or (deadline is not None and time.monotonic() >= deadline):
+                return sent
+
+    def _drain(self, digest_window: float) -> int:
+        now = time.time()
+        with self._lock:
+            recipients = [row[0] for row in self._conn.execute(
+                "SELECT recipient FROM notification_outbox "
+                "WHERE status = 'pending' AND next_attempt_at <= ? "
+                "GROUP BY recipient HAVING MIN(created_at) <= ?",
+                (now, now - digest_window)
+            )]
+
+        sent = 0
+        for recipient in recipients:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, subject, body, attempts FROM notification_outbox "
+                    "WHERE status = 'pending' AND recipient = ? AND next_attempt_at <= ? ORDER BY created_at",
+                    (recipient, now)
+                ).fetchall()
+            if not rows:
+                continue
+
+            subject, body = self._compose(rows)
+            try:
+                self.sender.send(recipient, subject, body)
+            except Exception as e:
+                print(f"Notification to {recipient} failed: {e}")
+                self._reschedule(rows, str(e))
+                continue
+
+            with self._lock:
+                self._conn.executemany(
+                    "UPDATE notification_outbox SET status = 'sent', sent_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    [(time.time(), row[0]) for row in rows]
+                )
+                self._conn.commit()
+            sent += 1
+        return sent
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM notification_outbox WHERE status = 'pending'"
+            ).fetchone()[0]
+
+    def start(self) -> None:
+        """Start the background drainer if it is not running yet"""
+        with self._lock:
+            if self._drainer is not None:
+                return
+            self._drainer = threading.Thread(target=self._work, name="notification-outbox", daemon=True)
+            self._drainer.start()
+
+    @staticmethod
+    def _compose(rows: List[Tuple]) -> Tuple[str, str]:
+        if len(rows) == 1:
+            return rows[0][1], rows[0][2]
+
+        subject = f"Recruitment Matching Digest: {len(rows)} job notifications"
+        body = f"Hello,\n\nThere are {len(rows)} new notifications from the Recruitment Matching System.\n\n"
+        body += "\n\n".join(f"=== {row[1]} ===\n\n{row[2]}" for row in rows)
+        return subject, body
+
+    def _reschedule(self, rows: List[Tuple], error: str) -> None:
+        now = time.time()
+        updates = []
+        for row_id, _, _, attempts in rows:
+            attempts += 1
+            if attempts >= self.max_attempts:
+                updates.append(("failed", attempts, now, error, row_id))
+                continue
+            delay = min(NOTIFICATION_RETRY_MAX_DELAY, NOTIFICATION_RETRY_BASE_DELAY * 2 ** (attempts - 1))
+            updates.append(("pending", attempts, now + random.uniform(0.5, 1.0) * delay, error, row_id))
+
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE notification_outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?",
+                updates
+            )
+            self._conn.commit()
+
+    def _work(self) -> None:
+        while True:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            try:
+                self.drain()
+            except Exception as e:
+                print(f"Notification outbox error: {e}")
+
+_shared_outbox: Optional[NotificationOutbox] = None
+_shared_outbox_lock = threading.Lock()
+
+def get_shared_outbox() -> NotificationOutbox:
+    """Process-wide outbox with a single drainer; it also resumes messages left pending by a restart"""
+    global _shared_outbox
+    with _shared_outbox_lock:
+        if _shared_outbox is None:
+            _shared_outbox = NotificationOutbox()
+            _shared_outbox.start()
+            # Short-lived processes such as the CLI exit before the digest window closes
+            atexit.register(_shared_outbox.flush)
+        return _shared_outbox
@@ -1,57 +1,74 @@
-from typing import List
+from typing import List, Optional
 from interfaces import RankingInterface
 from entities import Profile
-from config.settings import MIN_SIMILARITY_THRESHOLD, DEFAULT_TOP_MATCHES
+from utilities import RankingUtils
+from config.settings import (
+    AZURE_MODEL, MIN_SIMILARITY_THRESHOLD, DEFAULT_TOP_MATCHES, RERANK_SHORTLIST_FACTOR,
+    RERANK_CHUNK_SIZE, RERANK_ADVANCE_PER_GROUP, RERANK_MAX_PARALLEL_REQUESTS, RERANK_SUMMARY_CHARS
+)
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import json
 import re
-import os
-from typing import List
 
 from azure.ai.inference import ChatCompletionsClient
 from azure.ai.inference.models import SystemMessage, UserMessage
-from azure.core.credentials import AzureKeyCredential
-
-
-AZURE_ENDPOINT = "https://models.github.ai/inference"
-AZURE_MODEL = "openai/gpt-4.1-mini"
-AZURE_TOKEN = os.getenv("AZURE_OPEN_API")
-
-client = ChatCompletionsClient(
-    endpoint=AZURE_ENDPOINT,
-    credential=AzureKeyCredential(AZURE_TOKEN),
-)
+from .azure_client import create_chat_client
 
 class RankingAgent(RankingInterface):
-    def __init__(self, min_similarity_threshold: float = MIN_SIMILARITY_THRESHOLD):
+    def __init__(self, min_similarity_threshold: float = MIN_SIMILARITY_THRESHOLD,
+                 client: Optional[ChatCompletionsClient] = None):
         self.min_similarity_threshold = min_similarity_threshold
+        self.client = client or create_chat_client()
 
-    def rank_profiles(self, profiles: List[Profile]) -> List[Profile]:
-        qualified = [p for p in profiles if p.similarity_score >= self.min_similarity_threshold]
+    def rank_profiles(self, profiles: List[Profile], min_similarity_threshold: Optional[float] = None) -> List[Profile]:
+        threshold = self._threshold(min_similarity_threshold)
+        qualified = [p for p in profiles if p.similarity_score >= threshold]
 
         if not qualified:
             return []
 
+        if len(qualified) > RERANK_CHUNK_SIZE:
+            return self._tournament_rank(qualified)
+        return self._llm_rank(qualified)
+
+    def _tournament_rank(self, profiles: List[Profile]) -> List[Profile]:
+        """
+        Rank fixed-size groups in parallel requests, then re-rank the leaders of
+        each group in a further round until one group remains. Profiles that do
+        not advance follow the final order, sorted by similarity score.
+        """
+        groups = [profiles[i:i + RERANK_CHUNK_SIZE] for i in range(0, len(profiles), RERANK_CHUNK_SIZE)]
+        print(f"Re-ranking {len(profiles)} profiles in {len(groups)} groups...")
+
+        with ThreadPoolExecutor(max_workers=RERANK_MAX_PARALLEL_REQUESTS) as executor:
+            ranked_groups = list(executor.map(self._llm_rank, groups))
+
+        # Advance strictly fewer than a full group so every round shrinks the field
+        advance = max(1, min(RERANK_ADVANCE_PER_GROUP, RERANK_CHUNK_SIZE - 1))
+        advancing = [p for group in ranked_groups for p in group[:advance]]
+        eliminated = [p for group in ranked_groups for p in group[advance:]]
+
+        # A chunk size below 2 cannot shrink the field, so stop rather than recurse forever
+        if RERANK_CHUNK_SIZE < len(advancing) < len(profiles):
+            final_round = self._tournament_rank(advancing)
+        else:
+            final_round = self._llm_rank(advancing)
+
+        return final_round + sorted(eliminated, key=lambda x: x.similarity_score, reverse=True)
+
+    def _llm_rank(self, profiles: List[Profile]) -> List[Profile]:
         ranking_prompt = f"""
 You are an expert recruiter. Given a list of candidate profiles with similarity scores, rank them from best to worst based on how well they match a job. Consider skills, experience, and education to decide the final order.
 
 Input Profiles:
-{json.dumps([
-    {
-        "id": p.id,
-        "name": p.name,
-        "similarity_score": p.similarity_score,
-        "summary": p.summary,
-        "skills": p.skills,
-        "experience": p.experience,
-        "education": p.education
-    } for p in qualified
-], indent=2)}
+{self._compact_payload(profiles)}
 
 Return a JSON array sorted by best match, with: id, name, similarity_score.
 """
 
         try:
-            response = client.complete(
+            response = self.client.complete(
                 messages=[
                     SystemMessage("You are a resume ranking expert."),
                     UserMessage(ranking_prompt)
@@ -63,17 +80,50 @@ Return a JSON array sorted by best match, with: id, name, similarity_score.
             print("Azure final ranking response:", content)
             
             if content.strip().startswith("```"):
-                import re
                 content = re.sub(r"```(?:json)?\n?(.*?)```", r"\1", content.strip(), flags=re.DOTALL)
 
             ranked_data = json.loads(content)
             id_order = [item['id'] for item in ranked_data]
-            id_map = {p.id: p for p in qualified}
-            return [id_map[i] for i in id_order if i in id_map]
+            id_map = {p.id: p for p in profiles}
+            ranked = [id_map.pop(i) for i in id_order if i in id_map]
+            # Keep profiles the model left out, after the ones it ranked
+            return ranked + sorted(id_map.values(), key=lambda x: x.similarity_score, reverse=True)
 
         except Exception as e:
             print("Azure ranking error (fallback to local sort):", e)
-            return sorted(qualified, key=lambda x: x.similarity_score, reverse=True)
+            return sorted(profiles, key=lambda x: x.similarity_score, reverse=True)
+
+    @staticmethod
+    def _compact_payload(profiles: List[Profile]) -> str:
+        return json.dumps([
+            {
+                "id": p.id,
+                "name": p.name,
+                "similarity_score": round(p.similarity_score, 3),
+                "summary": (p.summary or "")[:RERANK_SUMMARY_CHARS],
+                "skills": p.skills,
+                "experience": p.experience,
+                "education": p.education
+            } for p in profiles
+        ], separators=(",", ":"), ensure_ascii=False)
+
+    def get_top_matches(self, profiles: List[Profile], top_n: int = DEFAULT_TOP_MATCHES,
+                        min_similarity_threshold: Optional[float] = None) -> List[Profile]:
+        threshold = self._threshold(min_similarity_threshold)
+        shortlist = self.select_shortlist(profiles, RERANK_SHORTLIST_FACTOR * top_n, threshold)
+        return self.rank_profiles(shortlist, threshold)[:top_n]
+
+    def select_shortlist(self, profiles: List[Profile], k: int,
+                         min_similarity_threshold: Optional[float] = None) -> List[Profile]:
+        """Top-k qualified profiles by similarity score, selected with a partial sort"""
+        if not profiles or k <= 0:
+            return []
+
+        scores = np.fromiter((p.similarity_score for p in profiles), dtype=float, count=len(profiles))
+        order = RankingUtils.top_indices(scores, k, self._threshold(min_similarity_threshold))
+        return [profiles[i] for i in order]
 
-    def get_top_matches(self, profiles: List[Profile], top_n: int = DEFAULT_TOP_MATCHES) -> List[Profile]:
-        return self.rank_profiles(profiles)[:top_n]
+    def _threshold(self, min_similarity_threshold: Optional[float]) -> float:
+        if min_similarity_threshold is None:
+            return self.min_similarity_threshold
+        return min_similarity_threshold
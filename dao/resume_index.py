@@ -0,0 +1,248 @@
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+from config.settings import MAX_TFIDF_FEATURES, NGRAM_RANGE, RESUME_INDEX_FOLDER, RESUME_INDEX_DRIFT_THRESHOLD
+from utilities import BlobStore, IndexStore
+
+class ResumeIndex:
+    """
+    On-disk TF-IDF index of resume vectors keyed by content hash.
+
+    The fitted vocabulary and IDF weights are stored next to a CSR matrix whose
+    arrays are memory-mapped on load, so scoring a new job description costs one
+    transform plus one sparse matmul. Resumes are added and removed without a
+    refit; the index is refitted once the out-of-vocabulary rate of resumes added
+    since the last fit exceeds the fit-time baseline by the drift threshold.
+    Only content hashes are stored: refits read resume text from the blob store,
+    and resumes added between refits are saved as IndexStore segments.
+    """
+
+    IDF_FILE = "idf.npy"
+    VOCABULARY_FILE = "vocabulary.json"
+    HASHES_FILE = "hashes.npy"
+    MATRIX_FILES = ("data.npy", "indices.npy", "indptr.npy")
+
+    def __init__(self, index_folder: str = RESUME_INDEX_FOLDER, drift_threshold: float = RESUME_INDEX_DRIFT_THRESHOLD,
+                 blob_store: Optional[BlobStore] = None):
+        self.index_folder = index_folder
+        self.drift_threshold = drift_threshold
+        self.blob_store = blob_store or BlobStore()
+        self.store = IndexStore(index_folder)
+        self._lock = threading.Lock()
+        self._analyzer = CountVectorizer(stop_words='english', ngram_range=NGRAM_RANGE).build_analyzer()
+        self._reset()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self.row_of
+
+    def add(self, documents: Dict[str, str]) -> None:
+        """Add resumes given as {content_hash: normalized text}; already indexed hashes are skipped"""
+        with self._lock:
+            new_documents = {h: text for h, text in documents.items() if h not in self.row_of}
+            if not new_documents:
+                return
+
+            if not self.vocabulary:
+                self._fit(self.hashes + list(new_documents), new_documents)
+                self.save()
+                return
+
+            oov_tokens, total_tokens = self._count_oov(new_documents.values())
+            self.oov_tokens += oov_tokens
+            self.total_tokens += total_tokens
+
+            if self.drift() > self.drift_threshold:
+                print(f"Resume index drift {self.drift():.3f} exceeds threshold, rebuilding...")
+                self._fit(self.hashes + list(new_documents), new_documents)
+                self.save()
+            elif self.store.should_compact(len(new_documents)):
+                self._append_rows(new_documents)
+                self.save()
+            else:
+                new_rows = self._append_rows(new_documents)
+                self.store.append(self._meta(), {
+                    **dict(zip(self.MATRIX_FILES, (new_rows.data, new_rows.indices, new_rows.indptr))),
+                    self.HASHES_FILE: np.asarray(list(new_documents), dtype=str)
+                }, len(new_documents))
+
+    def remove(self, content_hashes: Iterable[str]) -> None:
+        with self._lock:
+            to_remove = set(content_hashes) & set(self.row_of)
+            if not to_remove:
+                return
+
+            keep_rows = [row for row, h in enumerate(self.hashes) if h not in to_remove]
+            self.matrix = self.matrix[keep_rows]
+            self.hashes = [self.hashes[row] for row in keep_rows]
+            self._rebuild_row_lookup()
+            self.save()
+
+    def score(self, query_text: str, content_hashes: List[str]) -> np.ndarray:
+        """Cosine similarity between the query and each indexed resume, in the given order"""
+        with self._lock:
+            if not self.vocabulary or not content_hashes:
+                return np.zeros(len(content_hashes))
+
+            rows = [self.row_of[h] for h in content_hashes]
+            query_vector = self._transform([query_text])
+            return (self.matrix[rows] @ query_vector.T).toarray().ravel()
+
+    def score_matrix(self, query_texts: List[str], content_hashes: List[str]) -> np.ndarray:
+        """Cosine similarity of every query against every given resume, one row per query"""
+        with self._lock:
+            if not self.vocabulary or not content_hashes or not query_texts:
+                return np.zeros((len(query_texts), len(content_hashes)))
+
+            rows = [self.row_of[h] for h in content_hashes]
+            query_matrix = self._transform(query_texts)
+            return (query_matrix @ self.matrix[rows].T).toarray()
+
+    def drift(self) -> float:
+        if not self.total_tokens:
+            return 0.0
+        return self.oov_tokens / self.total_tokens - self.baseline_oov_rate
+
+    def rebuild(self) -> None:
+        with self._lock:
+            if not self.hashes:
+                return
+            self._fit(list(self.hashes), {})
+            self.save()
+
+    def save(self) -> None:
+        """Write the whole index as a new base snapshot"""
+        self.store.save(self._meta(), {
+            **dict(zip(self.MATRIX_FILES, (self.matrix.data, self.matrix.indices, self.matrix.indptr))),
+            self.HASHES_FILE: np.asarray(self.hashes, dtype=str),
+            self.IDF_FILE: np.asarray(self.idf),
+            self.VOCABULARY_FILE: self.vocabulary
+        }, len(self.hashes))
+
+    def load(self) -> None:
+        if not self.store.exists():
+            self._remove_legacy_files()
+            return
+
+        try:
+            meta, base, segments = self.store.load()
+            n_columns = len(base[self.IDF_FILE])
+            matrices = [
+                sp.csr_matrix(tuple(part[name] for name in self.MATRIX_FILES),
+                              shape=(len(part[self.HASHES_FILE]), n_columns))
+                for part in [base] + segments
+            ]
+            # The base stays memory-mapped unless segments have to be stacked onto it
+            self.matrix = matrices[0] if len(matrices) == 1 else sp.vstack(matrices, format='csr')
+            self.hashes = [h for part in [base] + segments for h in part[self.HASHES_FILE].tolist()]
+            self.idf = np.asarray(base[self.IDF_FILE])
+            self.vocabulary = base[self.VOCABULARY_FILE]
+            self.baseline_oov_rate = meta["baseline_oov_rate"]
+            self.oov_tokens = meta["oov_tokens"]
+            self.total_tokens = meta["total_tokens"]
+            self._rebuild_row_lookup()
+        except Exception as e:
+            print(f"Could not load resume index from {self.index_folder}, starting empty: {e}")
+            self.store.quarantine()
+            self._reset()
+
+    def _reset(self) -> None:
+        self.vocabulary: Dict[str, int] = {}
+        self.idf = np.zeros(0)
+        self.hashes: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.matrix = sp.csr_matrix((0, 0))
+        self.baseline_oov_rate = 0.0
+        self.oov_tokens = 0
+        self.total_tokens = 0
+        self._counter = None
+
+    def _remove_legacy_files(self) -> None:
+        # Indexes from before IndexStore also kept a copy of every resume text in documents.json
+        legacy_files = ("meta.json", "documents.json", "idf.npy", "data.npy", "indices.npy", "indptr.npy")
+        legacy_paths = [os.path.join(self.index_folder, filename) for filename in legacy_files]
+        if not any(os.path.exists(path) for path in legacy_paths):
+            return
+        print(f"Removing resume index in the old format from {self.index_folder}; it is rebuilt as resumes are added")
+        for path in legacy_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _meta(self) -> Dict:
+        return {
+            "baseline_oov_rate": self.baseline_oov_rate,
+            "oov_tokens": self.oov_tokens,
+            "total_tokens": self.total_tokens
+        }
+
+    def _fit(self, content_hashes: List[str], documents: Dict[str, str]) -> None:
+        content_hashes, texts = self._load_texts(content_hashes, documents)
+        vectorizer = TfidfVectorizer(
+            stop_words='english',
+            max_features=MAX_TFIDF_FEATURES,
+            ngram_range=NGRAM_RANGE
+        )
+        self.matrix = vectorizer.fit_transform(texts).tocsr()
+        self.vocabulary = {term: int(column) for term, column in vectorizer.vocabulary_.items()}
+        self.idf = vectorizer.idf_
+        self.hashes = content_hashes
+        self._counter = None
+        self._rebuild_row_lookup()
+
+        oov_tokens, total_tokens = self._count_oov(texts)
+        self.baseline_oov_rate = oov_tokens / total_tokens if total_tokens else 0.0
+        self.oov_tokens = 0
+        self.total_tokens = 0
+
+    def _append_rows(self, documents: Dict[str, str]) -> sp.csr_matrix:
+        new_rows = self._transform(list(documents.values()))
+        self.matrix = sp.vstack([self.matrix, new_rows], format='csr')
+        self.hashes.extend(documents)
+        self._rebuild_row_lookup()
+        return new_rows
+
+    def _load_texts(self, content_hashes: List[str], documents: Dict[str, str]) -> Tuple[List[str], List[str]]:
+        """Texts for a refit, from ``documents`` or the blob store; resumes whose text is gone are dropped"""
+        loaded_hashes, texts = [], []
+        for h in content_hashes:
+            if h in documents:
+                text = documents[h]
+            else:
+                try:
+                    text = self.blob_store.handle_for(h).load_normalized()
+                except FileNotFoundError:
+                    print(f"Resume {h[:12]} is no longer in the blob store, dropping it from the index")
+                    continue
+            loaded_hashes.append(h)
+            texts.append(text)
+        return loaded_hashes, texts
+
+    def _transform(self, texts: List[str]) -> sp.csr_matrix:
+        # Same weighting as TfidfVectorizer: raw counts scaled by IDF, then L2-normalised
+        if self._counter is None:
+            self._counter = CountVectorizer(
+                stop_words='english',
+                ngram_range=NGRAM_RANGE,
+                vocabulary=self.vocabulary
+            )
+        counts = self._counter.transform(texts)
+        return normalize(counts @ sp.diags(self.idf), norm='l2').tocsr()
+
+    def _count_oov(self, texts: Iterable[str]) -> Tuple[int, int]:
+        oov_tokens = 0
+        total_tokens = 0
+        for text in texts:
+            tokens = self._analyzer(text)
+            total_tokens += len(tokens)
+            oov_tokens += sum(1 for token in tokens if token not in self.vocabulary)
+        return oov_tokens, total_tokens
+
+    def _rebuild_row_lookup(self) -> None:
+        self.row_of = {h: row for row, h in enumerate(self.hashes)}
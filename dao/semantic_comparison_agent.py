@@ -0,0 +1,49 @@
+from typing import List, Optional
+import numpy as np
+from entities import Profile, JobDescription
+from config.settings import SEMANTIC_EXACT_LIMIT, SEMANTIC_SEARCH_TOP_K
+from utilities import SkillVocabulary
+from .comparison_agent import ComparisonAgent
+from .semantic_index import SemanticIndex
+
+class SemanticComparisonAgent(ComparisonAgent):
+    """
+    ComparisonAgent whose text signal is cosine similarity in the dense space of a
+    SemanticIndex, so paraphrases that share no terms still score. Skill and title
+    signals are unchanged. Runs of more than SEMANTIC_EXACT_LIMIT resumes score only
+    the nearest candidates found by the IVF search; the rest get a text similarity of 0.
+    """
+
+    def __init__(self, semantic_index: Optional[SemanticIndex] = None,
+                 skill_vocabulary: Optional[SkillVocabulary] = None):
+        super().__init__(skill_vocabulary=skill_vocabulary)
+        self.semantic_index = semantic_index or SemanticIndex()
+
+    def _text_similarities(self, job_description: JobDescription, profiles: List[Profile],
+                           profile_texts: List[str]) -> np.ndarray:
+        return self._text_similarity_matrix([job_description], profiles, profile_texts)[0]
+
+    def _text_similarity_matrix(self, job_descriptions: List[JobDescription], profiles: List[Profile],
+                                profile_texts: List[str]) -> np.ndarray:
+        content_hashes = [profile.content_hash for profile in profiles]
+        self.semantic_index.add(dict(zip(content_hashes, profile_texts)))
+        query_texts = [job_description.raw_text for job_description in job_descriptions]
+
+        if len(profiles) > SEMANTIC_EXACT_LIMIT:
+            allowed = set(content_hashes)
+            similarities = np.zeros((len(query_texts), len(content_hashes)))
+            for row, query_text in enumerate(query_texts):
+                hits = self.semantic_index.search(query_text, SEMANTIC_SEARCH_TOP_K, allowed=allowed)
+                if hits is None:
+                    break
+                scores = dict(hits)
+                similarities[row] = [scores.get(h, 0.0) for h in content_hashes]
+            else:
+                return similarities
+        else:
+            similarities = self.semantic_index.score_matrix(query_texts, content_hashes)
+            if similarities is not None:
+                return similarities
+
+        # Too few resumes to fit the projection yet
+        return super()._text_similarity_matrix(job_descriptions, profiles, profile_texts)
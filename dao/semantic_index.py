@@ -0,0 +1,319 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+from config.settings import (
+    NGRAM_RANGE, SEMANTIC_INDEX_FOLDER, SEMANTIC_MAX_FEATURES, SEMANTIC_DIMENSIONS,
+    SEMANTIC_IVF_LISTS, SEMANTIC_IVF_PROBES, SEMANTIC_REFIT_GROWTH, SEMANTIC_MIN_FIT_DOCS
+)
+from utilities import BlobStore, IndexStore
+
+SCORE_BLOCK_SIZE = 8192
+
+class SemanticIndex:
+    """
+    On-disk dense index of resumes in a latent semantic (LSA) space.
+
+    Resumes are projected with TF-IDF followed by TruncatedSVD and L2-normalised,
+    so a dot product is a cosine similarity. Vectors are grouped by their nearest
+    k-means centroid (an IVF layout) and stored contiguously per list, so
+    ``search`` only scores the ``n_probe`` lists closest to the query. The
+    projection is refitted from the blob store once the pool has grown by
+    ``refit_growth`` since the last fit. Otherwise new resumes are projected,
+    labelled with their nearest list and saved as an IndexStore segment; probes
+    scan those rows alongside their lists until the next compaction folds them
+    into the layout. Hashes added before the pool reaches ``min_fit_docs`` resumes
+    are recorded unfitted, and callers fall back to TF-IDF until then.
+    """
+
+    MODEL_FILE = "model.joblib"
+    VECTORS_FILE = "vectors.npy"
+    CENTROIDS_FILE = "centroids.npy"
+    OFFSETS_FILE = "offsets.npy"
+    LABELS_FILE = "labels.npy"
+    HASHES_FILE = "hashes.npy"
+
+    def __init__(self, index_folder: str = SEMANTIC_INDEX_FOLDER, blob_store: Optional[BlobStore] = None,
+                 n_components: int = SEMANTIC_DIMENSIONS, n_lists: Optional[int] = SEMANTIC_IVF_LISTS,
+                 n_probe: int = SEMANTIC_IVF_PROBES, refit_growth: float = SEMANTIC_REFIT_GROWTH,
+                 min_fit_docs: int = SEMANTIC_MIN_FIT_DOCS):
+        self.index_folder = index_folder
+        self.blob_store = blob_store or BlobStore()
+        self.n_components = n_components
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.refit_growth = refit_growth
+        self.min_fit_docs = min_fit_docs
+        self.store = IndexStore(index_folder)
+        self._lock = threading.Lock()
+        self._reset()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self.row_of
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._model is not None
+
+    def add(self, documents: Dict[str, str]) -> None:
+        """Add resumes given as {content_hash: normalized text}; already indexed hashes are skipped"""
+        with self._lock:
+            new_documents = {h: text for h, text in documents.items() if h not in self.row_of}
+            if not new_documents:
+                return
+
+            if not self.is_fitted:
+                # Texts stay in the blob store, so recording the hashes is enough to fit later
+                self._extend_hashes(list(new_documents))
+                if len(self.hashes) >= self.min_fit_docs:
+                    self._fit(list(self.hashes), new_documents)
+                self.save()
+                return
+
+            if len(self.hashes) + len(new_documents) >= self.refit_growth * self.fitted_size:
+                if self._fit(self.hashes + list(new_documents), new_documents):
+                    self.save()
+                    return
+
+            vectors, labels = self._append(new_documents)
+            if self.store.should_compact(len(new_documents)):
+                self.save()
+            else:
+                self.store.append({"fitted_size": self.fitted_size}, {
+                    self.VECTORS_FILE: vectors,
+                    self.LABELS_FILE: labels,
+                    self.HASHES_FILE: np.asarray(list(new_documents), dtype=str)
+                }, len(new_documents))
+
+    def remove(self, content_hashes: Iterable[str]) -> None:
+        with self._lock:
+            to_remove = set(content_hashes) & set(self.row_of)
+            if not to_remove:
+                return
+
+            keep_rows = np.asarray([row for row, h in enumerate(self.hashes) if h not in to_remove], dtype=np.int64)
+            kept_hashes = [self.hashes[row] for row in keep_rows]
+            if self.is_fitted:
+                labels = np.concatenate([self.labels, self.appended_labels])
+                self._set_layout(kept_hashes, self._vectors_at(keep_rows), labels[keep_rows])
+            else:
+                self.hashes = kept_hashes
+                self._rebuild_row_lookup()
+            self.save()
+
+    def score(self, query_text: str, content_hashes: List[str]) -> Optional[np.ndarray]:
+        """Exact cosine similarity for the given resumes, or None if any of them is not indexed"""
+        scores = self.score_matrix([query_text], content_hashes)
+        return scores[0] if scores is not None else None
+
+    def score_matrix(self, query_texts: List[str], content_hashes: List[str]) -> Optional[np.ndarray]:
+        """Exact cosine similarity of every query against every given resume, or None if any is not indexed"""
+        with self._lock:
+            if not self.is_fitted or any(h not in self.row_of for h in content_hashes):
+                return None
+
+            query_matrix = self._project(query_texts)
+            rows = np.fromiter((self.row_of[h] for h in content_hashes), dtype=np.int64, count=len(content_hashes))
+            scores = np.empty((len(query_texts), len(rows)), dtype=np.float32)
+            for start in range(0, len(rows), SCORE_BLOCK_SIZE):
+                block = rows[start:start + SCORE_BLOCK_SIZE]
+                scores[:, start:start + len(block)] = query_matrix @ self._vectors_at(block).T
+            return scores
+
+    def search(self, query_text: str, top_k: int, allowed: Optional[Set[str]] = None,
+               n_probe: Optional[int] = None) -> Optional[List[Tuple[str, float]]]:
+        """Approximate top-k (content_hash, similarity) over the probed lists, optionally limited to ``allowed``"""
+        with self._lock:
+            if not self.is_fitted:
+                return None
+
+            query_vector = self._project([query_text])[0]
+            probes = self._nearest_lists(query_vector[np.newaxis, :], n_probe or self.n_probe)[0]
+
+            row_groups = [np.arange(int(self.offsets[list_id]), int(self.offsets[list_id + 1])) for list_id in probes]
+            # Appended rows are not laid out by list yet, so they are picked by label
+            row_groups.append(len(self.vectors) + np.flatnonzero(np.isin(self.appended_labels, probes)))
+
+            candidate_rows = []
+            candidate_scores = []
+            for rows in row_groups:
+                if allowed is not None:
+                    rows = rows[[self.hashes[row] in allowed for row in rows]]
+                if not len(rows):
+                    continue
+                candidate_rows.append(rows)
+                candidate_scores.append(self._vectors_at(rows) @ query_vector)
+
+            if not candidate_rows:
+                return []
+            rows = np.concatenate(candidate_rows)
+            scores = np.concatenate(candidate_scores)
+            if len(scores) > top_k:
+                keep = np.argpartition(-scores, top_k - 1)[:top_k]
+                rows, scores = rows[keep], scores[keep]
+            order = np.argsort(-scores)
+            return [(self.hashes[rows[i]], float(scores[i])) for i in order]
+
+    def rebuild(self) -> None:
+        with self._lock:
+            if len(self.hashes) >= self.min_fit_docs and self._fit(list(self.hashes), {}):
+                self.save()
+
+    def save(self) -> None:
+        """Write the whole index as a new base snapshot, folding appended rows into the layout"""
+        if len(self.appended_vectors):
+            self._set_layout(
+                self.hashes,
+                np.vstack([self.vectors, self.appended_vectors]),
+                np.concatenate([self.labels, self.appended_labels])
+            )
+        self.store.save({"fitted_size": self.fitted_size}, {
+            self.MODEL_FILE: self._model,
+            self.VECTORS_FILE: self.vectors,
+            self.CENTROIDS_FILE: self.centroids,
+            self.OFFSETS_FILE: self.offsets,
+            self.LABELS_FILE: self.labels,
+            self.HASHES_FILE: np.asarray(self.hashes, dtype=str)
+        }, len(self.hashes))
+
+    def load(self) -> None:
+        if not self.store.exists():
+            return
+
+        try:
+            meta, base, segments = self.store.load()
+            self._model = base[self.MODEL_FILE]
+            self.vectors = base[self.VECTORS_FILE]
+            self.centroids = np.asarray(base[self.CENTROIDS_FILE])
+            self.offsets = np.asarray(base[self.OFFSETS_FILE])
+            self.labels = np.asarray(base[self.LABELS_FILE])
+            self.hashes = [h for part in [base] + segments for h in part[self.HASHES_FILE].tolist()]
+            if segments:
+                self.appended_vectors = np.vstack([segment[self.VECTORS_FILE] for segment in segments])
+                self.appended_labels = np.concatenate([segment[self.LABELS_FILE] for segment in segments])
+            self.fitted_size = meta["fitted_size"]
+            self._rebuild_row_lookup()
+        except Exception as e:
+            print(f"Could not load semantic index from {self.index_folder}, starting empty: {e}")
+            self.store.quarantine()
+            self._reset()
+
+    def _reset(self) -> None:
+        self._model = None
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.labels = np.zeros(0, dtype=np.int32)
+        self.appended_vectors = np.zeros((0, 0), dtype=np.float32)
+        self.appended_labels = np.zeros(0, dtype=np.int32)
+        self.hashes: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.fitted_size = 0
+
+    def _fit(self, content_hashes: List[str], documents: Dict[str, str]) -> bool:
+        content_hashes, texts = self._load_texts(content_hashes, documents)
+        # A handful of documents gives a degenerate projection that scores everything near 0
+        if len(content_hashes) < self.min_fit_docs:
+            return False
+
+        vectorizer = TfidfVectorizer(
+            stop_words='english',
+            max_features=SEMANTIC_MAX_FEATURES,
+            ngram_range=NGRAM_RANGE,
+            sublinear_tf=True
+        )
+        try:
+            tfidf_matrix = vectorizer.fit_transform(texts)
+        except ValueError:
+            # Empty vocabulary, e.g. only stop words
+            return False
+
+        n_components = min(self.n_components, tfidf_matrix.shape[0] - 1, tfidf_matrix.shape[1] - 1)
+        if n_components < 1:
+            return False
+
+        svd = TruncatedSVD(n_components=n_components, random_state=0)
+        vectors = normalize(svd.fit_transform(tfidf_matrix)).astype(np.float32)
+
+        n_lists = min(self.n_lists or max(1, int(np.sqrt(len(texts)))), len(texts))
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=0, n_init=3).fit(vectors)
+
+        self._model = (vectorizer, svd)
+        self.centroids = kmeans.cluster_centers_.astype(np.float32)
+        self.fitted_size = len(texts)
+        self._set_layout(content_hashes, vectors, kmeans.labels_.astype(np.int32))
+        return True
+
+    def _append(self, documents: Dict[str, str]) -> Tuple[np.ndarray, np.ndarray]:
+        vectors = self._project(list(documents.values()))
+        labels = self._nearest_lists(vectors, 1)[:, 0].astype(np.int32)
+        if len(self.appended_vectors):
+            self.appended_vectors = np.vstack([self.appended_vectors, vectors])
+        else:
+            self.appended_vectors = vectors
+        self.appended_labels = np.concatenate([self.appended_labels, labels])
+        self._extend_hashes(list(documents))
+        return vectors, labels
+
+    def _vectors_at(self, rows: np.ndarray) -> np.ndarray:
+        """Vectors of index rows; rows past the laid-out base are appended ones"""
+        if not len(self.appended_vectors):
+            return self.vectors[rows]
+        in_base = rows < len(self.vectors)
+        vectors = np.empty((len(rows), self.vectors.shape[1]), dtype=np.float32)
+        vectors[in_base] = self.vectors[rows[in_base]]
+        vectors[~in_base] = self.appended_vectors[rows[~in_base] - len(self.vectors)]
+        return vectors
+
+    def _set_layout(self, content_hashes: List[str], vectors: np.ndarray, labels: np.ndarray) -> None:
+        # Rows of one list are stored contiguously, so a probe reads a single slice
+        order = np.argsort(labels, kind='stable')
+        self.vectors = np.ascontiguousarray(vectors[order])
+        self.labels = labels[order]
+        self.hashes = [content_hashes[row] for row in order]
+        counts = np.bincount(self.labels, minlength=len(self.centroids))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self.appended_vectors = np.zeros((0, self.vectors.shape[1]), dtype=np.float32)
+        self.appended_labels = np.zeros(0, dtype=np.int32)
+        self._rebuild_row_lookup()
+
+    def _nearest_lists(self, vectors: np.ndarray, n_probe: int) -> np.ndarray:
+        # argmin ||v - c||^2 == argmax (v.c - ||c||^2 / 2)
+        closeness = vectors @ self.centroids.T - 0.5 * np.einsum('ij,ij->i', self.centroids, self.centroids)
+        n_probe = min(n_probe, len(self.centroids))
+        return np.argsort(-closeness, axis=1)[:, :n_probe]
+
+    def _project(self, texts: Iterable[str]) -> np.ndarray:
+        vectorizer, svd = self._model
+        return normalize(svd.transform(vectorizer.transform(texts))).astype(np.float32)
+
+    def _load_texts(self, content_hashes: List[str], documents: Dict[str, str]) -> Tuple[List[str], List[str]]:
+        """Texts for a fit, from ``documents`` or the blob store; resumes whose text is gone are dropped"""
+        loaded_hashes, texts = [], []
+        for h in content_hashes:
+            if h in documents:
+                text = documents[h]
+            else:
+                try:
+                    text = self.blob_store.handle_for(h).load_normalized()
+                except FileNotFoundError:
+                    print(f"Resume {h[:12]} is no longer in the blob store, dropping it from the semantic index")
+                    continue
+            loaded_hashes.append(h)
+            texts.append(text)
+        return loaded_hashes, texts
+
+    def _extend_hashes(self, content_hashes: List[str]) -> None:
+        for h in content_hashes:
+            self.row_of[h] = len(self.hashes)
+            self.hashes.append(h)
+
+    def _rebuild_row_lookup(self) -> None:
+        self.row_of = {h: row for row, h in enumerate(self.hashes)}
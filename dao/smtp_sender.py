@@ -0,0 +1,190 @@
+import queue
+import random
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import List, Optional, Tuple
+from config.settings import (
+    SMTP_SERVER, SMTP_PORT, EMAIL_ADDRESS, EMAIL_PASSWORD, SMTP_USE_TLS, SMTP_TIMEOUT_SECONDS,
+    SMTP_POOL_SIZE, SMTP_IDLE_TIMEOUT_SECONDS, SMTP_MAX_RETRIES, SMTP_RETRY_BASE_DELAY
+)
+
+@dataclass
+class OutgoingEmail:
+    recipient: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+def build_message(sender: str, recipient: str, subject: str, body: str) -> MIMEMultipart:
+    msg = MIMEMultipart()
+    msg['From'] = sender
+    msg['To'] = recipient
+    msg['Subject'] = subject
+    msg.attach(MIMEText(body, 'plain'))
+    return msg
+
+class SmtpSender:
+    """
+    Sends email over a pool of persistent, authenticated SMTP sessions.
+
+    ``send`` delivers synchronously on a pooled session, reconnecting once if
+    the server has dropped it. ``submit`` only queues the message for
+    ``pool_size`` background workers, which retry failed sends with jittered
+    exponential backoff. Sessions idle for longer than ``idle_timeout`` seconds
+    are closed.
+    """
+
+    def __init__(self, host: str = SMTP_SERVER, port: int = SMTP_PORT,
+                 username: Optional[str] = EMAIL_ADDRESS, password: Optional[str] = EMAIL_PASSWORD,
+                 use_tls: bool = SMTP_USE_TLS, pool_size: int = SMTP_POOL_SIZE,
+                 idle_timeout: float = SMTP_IDLE_TIMEOUT_SECONDS, max_retries: int = SMTP_MAX_RETRIES):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.pool_size = max(1, pool_size)
+        self.idle_timeout = idle_timeout
+        self.max_retries = max_retries
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._queue: "queue.Queue[Optional[OutgoingEmail]]" = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def send(self, recipient: str, subject: str, body: str) -> None:
+        """Send now on a pooled session; raises the SMTP error if delivery fails"""
+        msg = build_message(self.username or "", recipient, subject, body).as_string()
+        server, reused = self._acquire()
+        try:
+            server.sendmail(self.username or "", recipient, msg)
+        except smtplib.SMTPServerDisconnected:
+            self._disconnect(server)
+            if not reused:
+                raise
+            # The pooled session went stale; retry once on a fresh one
+            server = self._connect()
+            try:
+                server.sendmail(self.username or "", recipient, msg)
+            except (smtplib.SMTPException, OSError):
+                self._disconnect(server)
+                raise
+        except (smtplib.SMTPException, OSError):
+            self._disconnect(server)
+            raise
+        self._release(server)
+        print(f"Email sent successfully to {recipient}")
+
+    def submit(self, recipient: str, subject: str, body: str) -> None:
+        self._ensure_workers()
+        self._queue.put(OutgoingEmail(recipient, subject, body))
+
+    def flush(self) -> None:
+        """Block until every queued message has been sent or given up on"""
+        self._queue.join()
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+            for _ in workers:
+                self._queue.put(None)
+        for worker in workers:
+            worker.join()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._disconnect(server)
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for idx in range(self.pool_size):
+                worker = threading.Thread(target=self._work, name=f"smtp-sender-{idx+1}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            try:
+                email = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                self._close_idle_sessions()
+                continue
+
+            try:
+                if email is None:
+                    return
+                self._deliver(email)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, email: OutgoingEmail) -> None:
+        while True:
+            email.attempts += 1
+            try:
+                self.send(email.recipient, email.subject, email.body)
+                return
+            except (smtplib.SMTPException, OSError) as e:
+                if email.attempts > self.max_retries or isinstance(e, smtplib.SMTPRecipientsRefused):
+                    print(f"Error sending email to {email.recipient}: {e}")
+                    return
+                delay = random.uniform(0, SMTP_RETRY_BASE_DELAY * 2 ** (email.attempts - 1))
+                print(f"Email to {email.recipient} failed ({e}), retrying in {delay:.1f}s "
+                      f"(attempt {email.attempts}/{self.max_retries})")
+                time.sleep(delay)
+
+    def _acquire(self) -> Tuple[smtplib.SMTP, bool]:
+        self._close_idle_sessions()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()[0], True
+        return self._connect(), False
+
+    def _release(self, server: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append((server, time.monotonic()))
+                return
+        self._disconnect(server)
+
+    def _close_idle_sessions(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            expired = [server for server, last_used in self._idle if last_used < cutoff]
+            self._idle = [(server, last_used) for server, last_used in self._idle if last_used >= cutoff]
+        for server in expired:
+            self._disconnect(server)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT_SECONDS)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            self._disconnect(server)
+            raise
+        return server
+
+    @staticmethod
+    def _disconnect(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+_shared_sender: Optional[SmtpSender] = None
+_shared_sender_lock = threading.Lock()
+
+def get_shared_sender() -> SmtpSender:
+    """Process-wide sender, so every CommunicationAgent reuses the same SMTP sessions"""
+    global _shared_sender
+    with _shared_sender_lock:
+        if _shared_sender is None:
+            _shared_sender = SmtpSender()
+        return _shared_sender
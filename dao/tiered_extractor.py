@@ -0,0 +1,48 @@
+from typing import Dict, List, Optional
+from interfaces import ExtractorInterface
+from config.settings import LOCAL_EXTRACTION_MIN_CONFIDENCE, TIERED_REQUIRED_FIELDS
+from .local_extractor import LocalExtractor
+
+class TieredExtractor(ExtractorInterface):
+    """
+    Runs the local extractor first and calls the remote extractor only when a
+    required field falls below the confidence threshold. Remote values replace
+    only the low-confidence fields; if the remote call fails, the local result
+    is returned so extraction keeps working while the endpoint is down.
+    """
+
+    def __init__(self, local_extractor: LocalExtractor, remote_extractor: ExtractorInterface,
+                 min_confidence: float = LOCAL_EXTRACTION_MIN_CONFIDENCE,
+                 required_fields: Optional[List[str]] = None):
+        self.local_extractor = local_extractor
+        self.remote_extractor = remote_extractor
+        self.min_confidence = min_confidence
+        self.required_fields = required_fields or TIERED_REQUIRED_FIELDS
+        self.local_only = 0
+        self.remote_calls = 0
+
+    def extract_resume_info(self, text: str) -> Dict:
+        info, confidence = self.local_extractor.extract_with_confidence(text)
+
+        low_confidence = [field for field in info if confidence.get(field, 0.0) < self.min_confidence]
+        if not any(field in low_confidence for field in self.required_fields):
+            self.local_only += 1
+            return info
+
+        self.remote_calls += 1
+        remote_info = self.remote_extractor.extract_resume_info(text)
+        if not remote_info:
+            print("Remote extraction unavailable, using local extraction result")
+            return info
+
+        merged = dict(info)
+        for field in low_confidence:
+            if remote_info.get(field):
+                merged[field] = remote_info[field]
+        return merged
+
+    def close(self) -> None:
+        self.remote_extractor.close()
+
+    def stats(self) -> Dict:
+        return {"local_only": self.local_only, "remote_calls": self.remote_calls}
@@ -0,0 +1,72 @@
+import re
+from typing import Dict, List
+from entities import JobDescription
+from config.settings import TITLE_VARIANT_SCORE, TITLE_KEYWORD_WEIGHT
+from utilities import AhoCorasick, TextUtils
+
+SENIORITY_WORDS = {
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "chief", "head", "associate",
+    "entry-level", "mid-level", "i", "ii", "iii", "iv"
+}
+ROLE_SYNONYMS = {
+    "developer": ["engineer", "programmer"],
+    "engineer": ["developer"],
+    "programmer": ["developer"],
+}
+
+class TitleMatcher:
+    """
+    Matcher built once per job description for its title, title variants and
+    required-skill keywords. ``scan`` counts hits for every pattern in one pass
+    over a resume's normalized text; ``score`` turns those counts into a graded
+    0-1 title signal.
+    """
+
+    def __init__(self, job_description: JobDescription):
+        self.title = TextUtils.normalize(job_description.title)
+        self.variants = [
+            variant for variant in dict.fromkeys(
+                [TextUtils.normalize(v) for v in job_description.title_variants] + self._derive_variants(self.title)
+            )
+            if variant and variant != self.title
+        ]
+        self.keywords = list(dict.fromkeys(
+            TextUtils.normalize(skill) for skill in job_description.required_skills if skill.strip()
+        ))
+        self.matcher = AhoCorasick([self.title] + self.variants + self.keywords)
+
+    def scan(self, normalized_text: str) -> Dict[str, int]:
+        """Hit count per pattern; ``normalized_text`` must already be normalized like TextUtils.normalize"""
+        return self.matcher.count(normalized_text)
+
+    def score(self, normalized_text: str) -> float:
+        return self.score_counts(self.scan(normalized_text))
+
+    def score_counts(self, counts: Dict[str, int]) -> float:
+        """Score from precomputed hit counts, e.g. from one scan shared by several matchers"""
+        if self.title and counts.get(self.title):
+            title_component = 1.0
+        elif any(counts.get(variant) for variant in self.variants):
+            title_component = TITLE_VARIANT_SCORE
+        else:
+            title_component = 0.0
+
+        if not self.keywords:
+            return title_component
+        keyword_coverage = sum(1 for keyword in self.keywords if counts.get(keyword)) / len(self.keywords)
+        return (1 - TITLE_KEYWORD_WEIGHT) * title_component + TITLE_KEYWORD_WEIGHT * keyword_coverage
+
+    @staticmethod
+    def _derive_variants(title: str) -> List[str]:
+        # "senior python developer" -> "python developer", "python engineer", "senior python engineer", ...
+        words = [word for word in re.split(r"[\s,/]+", title) if word]
+        core = [word for word in words if word.strip(".") not in SENIORITY_WORDS]
+        variants = [" ".join(core)]
+        for candidate in (words, core):
+            for idx, word in enumerate(candidate):
+                for synonym in ROLE_SYNONYMS.get(word, []):
+                    variants.append(" ".join(candidate[:idx] + [synonym] + candidate[idx + 1:]))
+        # "developer" or "senior engineer" alone would match nearly every resume
+        return [variant for variant in variants if len(variant.split()) >= 2 and any(
+            word.strip(".") not in SENIORITY_WORDS and word not in ROLE_SYNONYMS for word in variant.split()
+        )]
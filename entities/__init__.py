@@ -1,4 +1,6 @@
+from .raw_text_handle import RawTextHandle
 from .profile import Profile
 from .job_description import JobDescription
+from .resume_document import ResumeDocument
 
-__all__ = ['Profile', 'JobDescription']
\ No newline at end of file
+__all__ = ['RawTextHandle', 'Profile', 'JobDescription', 'ResumeDocument']
\ No newline at end of file
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 @dataclass
@@ -8,6 +8,12 @@ class JobDescription:
     required_skills: List[str]
     experience_required: str
     raw_text: str
+    # Alternative titles that count as a title match, e.g. "Backend Engineer" for "Python Developer"
+    title_variants: List[str] = field(default_factory=list)
+    # Hard requirements checked by the pre-filter before scoring: every must-have skill is
+    # required, and a resume mentioning any excluded keyword is dropped
+    must_have_skills: List[str] = field(default_factory=list)
+    excluded_keywords: List[str] = field(default_factory=list)
     
     def to_dict(self) -> dict:
         return {
@@ -15,7 +21,10 @@ class JobDescription:
             "title": self.title,
             "required_skills": self.required_skills,
             "experience_required": self.experience_required,
-            "raw_text": self.raw_text
+            "raw_text": self.raw_text,
+            "title_variants": self.title_variants,
+            "must_have_skills": self.must_have_skills,
+            "excluded_keywords": self.excluded_keywords
         }
     
     def __str__(self) -> str:
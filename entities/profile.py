@@ -1,18 +1,39 @@
+import sys
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
+from .raw_text_handle import RawTextHandle
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
+    """Slotted candidate profile; the resume text stays on disk until a stage asks for ``raw_text``"""
     id: str
     name: str
     email: str
     phone: str
-    skills: List[str]
+    skills: Tuple[str, ...]
     experience: str
     education: str
     summary: str
-    raw_text: str
+    raw_text_handle: RawTextHandle
     similarity_score: float = 0.0
+    # Every uploaded file that was collapsed onto this profile as a duplicate
+    source_files: Tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        # Skill names repeat across thousands of profiles; interning stores each once
+        self.skills = tuple(sys.intern(str(skill)) for skill in self.skills or ())
+    
+    @property
+    def raw_text(self) -> str:
+        return self.raw_text_handle.load()
+    
+    @property
+    def normalized_text(self) -> str:
+        return self.raw_text_handle.load_normalized()
+    
+    @property
+    def content_hash(self) -> str:
+        return self.raw_text_handle.content_hash
     
     def to_dict(self) -> dict:
         return {
@@ -20,11 +41,12 @@ class Profile:
             "name": self.name,
             "email": self.email,
             "phone": self.phone,
-            "skills": self.skills,
+            "skills": list(self.skills),
             "experience": self.experience,
             "education": self.education,
             "summary": self.summary,
-            "similarity_score": self.similarity_score
+            "similarity_score": self.similarity_score,
+            "source_files": list(self.source_files)
         }
     
     def __str__(self) -> str:
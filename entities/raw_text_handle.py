@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+@dataclass(frozen=True, slots=True)
+class RawTextHandle:
+    """Reference to resume text stored on disk under its content hash"""
+    content_hash: str
+    path: str
+    # Whitespace-collapsed, lowercased copy written next to the original at ingestion time
+    normalized_path: str = ""
+    
+    def load(self) -> str:
+        return Path(self.path).read_text(encoding='utf-8')
+    
+    def load_normalized(self) -> str:
+        if self.normalized_path:
+            return Path(self.normalized_path).read_text(encoding='utf-8')
+        return " ".join(self.load().split()).lower()
+    
+    def __str__(self) -> str:
+        return f"RawTextHandle(hash={self.content_hash[:12]})"
\ No newline at end of file
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+@dataclass
+class ResumeDocument:
+    """An uploaded resume held in memory instead of on disk"""
+    name: str
+    data: bytes
+    
+    @property
+    def extension(self) -> str:
+        return Path(self.name).suffix.lower()
+    
+    def __str__(self) -> str:
+        return f"ResumeDocument(name={self.name}, size={len(self.data)})"
\ No newline at end of file
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List
+import numpy as np
 from entities import Profile, JobDescription
 
 class ComparisonInterface(ABC):
@@ -10,4 +11,8 @@ class ComparisonInterface(ABC):
     
     @abstractmethod
     def compare_profiles_with_jd(self, job_description: JobDescription, profiles: List[Profile]) -> List[Profile]:
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def score_matrix(self, job_descriptions: List[JobDescription], profiles: List[Profile]) -> np.ndarray:
+        pass
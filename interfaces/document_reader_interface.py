@@ -12,4 +12,8 @@ class DocumentReaderInterface(ABC):
     
     @abstractmethod
     def read_docx(self, file_path: str) -> str:
+        pass
+    
+    @abstractmethod
+    def read_bytes(self, data: bytes, ext: str) -> str:
         pass
\ No newline at end of file
@@ -5,4 +5,8 @@ class ExtractorInterface(ABC):
     
     @abstractmethod
     def extract_resume_info(self, text: str) -> Dict:
+        pass
+    
+    def close(self) -> None:
+        """Release clients or background workers held by the extractor"""
         pass
\ No newline at end of file
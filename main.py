@@ -56,7 +56,10 @@ def main():
             """
         )
         matching_service = RecruitmentMatchingService()
-        result = matching_service.run_matching_process(job_description, resume_files)
+        try:
+            result = matching_service.run_matching_process(job_description, resume_files)
+        finally:
+            matching_service.close()
         
         print("\n" + "="*60)
         print("FINAL RESULTS")
@@ -79,6 +82,8 @@ def main():
                 print("Sending email notifications...")
                 comm_agent = CommunicationAgent(ar_email, recruiter_email)
                 comm_agent.notify(result)
+                sent = comm_agent.outbox.flush()
+                print(f"Sent {sent} notification email(s); {comm_agent.outbox.pending_count()} still pending")
             else:
                 print("Email addresses not provided. Skipping email notifications.")
         
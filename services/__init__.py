@@ -1,3 +1,4 @@
 from .recruitment_matching_service import RecruitmentMatchingService
+from .matching_job_runner import MatchingJobRunner
 
-__all__ = ['RecruitmentMatchingService']
\ No newline at end of file
+__all__ = ['RecruitmentMatchingService', 'MatchingJobRunner']
\ No newline at end of file
@@ -0,0 +1,207 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from entities import JobDescription
+from utilities import FileUtils
+from config.settings import DEFAULT_TOP_MATCHES, JOB_DB_PATH, JOB_MAX_WORKERS
+from .recruitment_matching_service import RecruitmentMatchingService
+
+# Identifies this process in job rows; a PID alone can be reused after a restart
+PROCESS_BOOT_ID = uuid.uuid4().hex
+
+JOB_COLUMNS = (
+    "job_id", "status", "job_title", "submitted_at", "started_at", "finished_at",
+    "stage", "progress_done", "progress_total", "result", "error"
+)
+
+def _process_alive(pid: Optional[int]) -> bool:
+    if not pid or pid == os.getpid():
+        # Rows without an owner predate owner tracking; this PID with another boot ID is a previous run
+        return False
+    if os.name == "nt":
+        # os.kill cannot probe a process on Windows without signalling it
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class MatchingJobRunner:
+    """
+    Runs matching jobs on a worker pool so the caller never blocks on a run.
+
+    Job state, per-file progress and results live in a SQLite table, so they
+    survive page reloads and can be polled by job ID. Jobs are picked up in
+    submission order by ``max_workers`` workers, so concurrent submitters share
+    the pool instead of queueing behind one long run.
+    """
+
+    def __init__(self, matching_service: RecruitmentMatchingService,
+                 db_path: str = JOB_DB_PATH, max_workers: int = JOB_MAX_WORKERS):
+        self.matching_service = matching_service
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="matching-job")
+        self._lock = threading.Lock()
+
+        FileUtils.ensure_directory_exists(os.path.dirname(db_path) or ".")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS matching_jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                job_title TEXT,
+                submitted_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                stage TEXT,
+                progress_done INTEGER NOT NULL DEFAULT 0,
+                progress_total INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                owner_pid INTEGER,
+                owner_boot_id TEXT
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(matching_jobs)")}
+        for column, column_type in (("owner_pid", "INTEGER"), ("owner_boot_id", "TEXT")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE matching_jobs ADD COLUMN {column} {column_type}")
+        self._conn.commit()
+        self._futures: Dict[str, Future] = {}
+        self._recover_orphaned_jobs()
+
+    def submit(self, job_description: JobDescription, resume_files: List,
+               min_similarity_threshold: Optional[float] = None, top_n: int = DEFAULT_TOP_MATCHES,
+               on_finished: Optional[Callable[[Dict], None]] = None) -> str:
+        """Queue a matching run and return its job ID; ``on_finished`` receives the final job record"""
+        job_id = uuid.uuid4().hex
+        self._execute(
+            "INSERT INTO matching_jobs (job_id, status, job_title, submitted_at, progress_total, owner_pid, owner_boot_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, "queued", job_description.title, datetime.now().isoformat(), len(resume_files),
+             os.getpid(), PROCESS_BOOT_ID)
+        )
+        future = self._executor.submit(
+            self._run, job_id, job_description, resume_files, min_similarity_threshold, top_n, on_finished
+        )
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget_future(job_id))
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM matching_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def list_jobs(self, limit: int = 20) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM matching_jobs ORDER BY submitted_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def shutdown(self, close_service: bool = False) -> None:
+        """
+        Stop taking jobs: this runner's queued jobs are cancelled, running ones finish in the
+        background. With ``close_service`` the matching service is closed once they have.
+        """
+        with self._lock:
+            futures = dict(self._futures)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if close_service:
+            threading.Thread(target=self._close_service_when_idle, name="matching-job-close", daemon=True).start()
+        for job_id, future in futures.items():
+            if future.cancelled():
+                self._execute(
+                    "UPDATE matching_jobs SET status = 'failed', error = 'Cancelled by a service reload', "
+                    "finished_at = ? WHERE job_id = ? AND status = 'queued'",
+                    (datetime.now().isoformat(), job_id)
+                )
+
+    def _close_service_when_idle(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.matching_service.close()
+
+    def _recover_orphaned_jobs(self) -> None:
+        """Fail unfinished jobs whose owning process is gone; they cannot resume"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, owner_pid, owner_boot_id FROM matching_jobs WHERE status IN ('queued', 'running')"
+            ).fetchall()
+            # Jobs of this process belong to a runner that is still working through them,
+            # e.g. one retired by a service reload; other live processes keep theirs too
+            orphaned = [
+                job_id for job_id, owner_pid, owner_boot_id in rows
+                if owner_boot_id != PROCESS_BOOT_ID and not _process_alive(owner_pid)
+            ]
+            for job_id in orphaned:
+                self._conn.execute(
+                    "UPDATE matching_jobs SET status = 'failed', error = 'Interrupted by a restart', finished_at = ? "
+                    "WHERE job_id = ?",
+                    (datetime.now().isoformat(), job_id)
+                )
+            self._conn.commit()
+
+    def _forget_future(self, job_id: str) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def _run(self, job_id: str, job_description: JobDescription, resume_files: List,
+             min_similarity_threshold: Optional[float], top_n: int,
+             on_finished: Optional[Callable[[Dict], None]]) -> None:
+        self._execute(
+            "UPDATE matching_jobs SET status = 'running', started_at = ? WHERE job_id = ?",
+            (datetime.now().isoformat(), job_id)
+        )
+
+        def report_progress(stage: str, done: int, total: int) -> None:
+            self._execute(
+                "UPDATE matching_jobs SET stage = ?, progress_done = ?, progress_total = ? WHERE job_id = ?",
+                (stage, done, total, job_id)
+            )
+
+        try:
+            result = self.matching_service.run_matching_process(
+                job_description,
+                resume_files,
+                min_similarity_threshold=min_similarity_threshold,
+                top_n=top_n,
+                progress_callback=report_progress
+            )
+            self._execute(
+                "UPDATE matching_jobs SET status = 'completed', result = ?, finished_at = ? WHERE job_id = ?",
+                (json.dumps(result, ensure_ascii=False), datetime.now().isoformat(), job_id)
+            )
+        except Exception as e:
+            print(f"Matching job {job_id} failed: {e}")
+            self._execute(
+                "UPDATE matching_jobs SET status = 'failed', error = ?, finished_at = ? WHERE job_id = ?",
+                (str(e), datetime.now().isoformat(), job_id)
+            )
+        finally:
+            if on_finished is not None:
+                try:
+                    on_finished(self.get_job(job_id))
+                except Exception as e:
+                    print(f"Job completion callback error for {job_id}: {e}")
+
+    def _execute(self, query: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(query, params)
+            self._conn.commit()
+
+    @staticmethod
+    def _to_job(row: tuple) -> Dict:
+        job = dict(zip(JOB_COLUMNS, row))
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
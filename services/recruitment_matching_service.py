@@ -1,97 +1,516 @@
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple, Union
 from datetime import datetime
-from entities import Profile, JobDescription
-from dao import DocumentReader, AzureExtractor, ComparisonAgent, RankingAgent
-from utilities import ExportUtils
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import contextvars
+import multiprocessing
+import threading
+from contextlib import nullcontext
+import numpy as np
+from azure.ai.inference import ChatCompletionsClient
+from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
+from entities import Profile, JobDescription, ResumeDocument
+from interfaces import ExtractorInterface, ComparisonInterface
+from dao import (
+    DocumentReader, AzureExtractor, AsyncAzureExtractor, LocalExtractor, TieredExtractor,
+    ComparisonAgent, SemanticComparisonAgent, BM25ComparisonAgent, RankingAgent, ResumeIndex, SemanticIndex, BM25Index,
+    ExtractionCache, create_chat_client, create_async_chat_client
+)
+from utilities import ExportUtils, BlobStore, Deduplicator, PreFilter, RankingUtils
+from config.settings import (
+    DEFAULT_TOP_MATCHES, USE_RESUME_INDEX, USE_EXTRACTION_CACHE, USE_ASYNC_EXTRACTOR, EXTRACTION_MODE, EXTRACTION_BATCH_MODE,
+    INGESTION_MAX_WORKERS, INGESTION_PARSER_PROCESSES, INGESTION_INLINE_PARSE_MAX_FILES, DEFAULT_CSV_FILENAME, EXPORT_FULL_POOL, DEDUP_ENABLED,
+    COMPARISON_BACKEND, MULTI_MATCH_TOP_JOBS, PREFILTER_ENABLED, BLOB_RETENTION_DAYS
+)
+
+# Called as progress_callback(stage, done, total) while a matching run advances
+ProgressCallback = Callable[[str, int, int], None]
+# A resume is either a path on disk or an in-memory upload
+ResumeSource = Union[str, ResumeDocument]
+
+def _read_source(document_reader: DocumentReader, source: ResumeSource) -> str:
+    if isinstance(source, ResumeDocument):
+        return document_reader.read_bytes(source.data, source.extension)
+    return document_reader.read_document(source)
+
+def _source_name(source: ResumeSource) -> str:
+    return source.name if isinstance(source, ResumeDocument) else source
+
+def _format_experience(experience_years) -> str:
+    # An empty string marks experience the extractor could not determine
+    if experience_years is None or experience_years == "":
+        return ""
+    return f"{experience_years} years"
 
 class RecruitmentMatchingService:
     
-    def __init__(self):
+    def __init__(self, use_resume_index: bool = USE_RESUME_INDEX, use_extraction_cache: bool = USE_EXTRACTION_CACHE,
+                 max_workers: int = INGESTION_MAX_WORKERS, parser_processes: Optional[int] = INGESTION_PARSER_PROCESSES,
+                 use_deduplication: bool = DEDUP_ENABLED, use_prefilter: bool = PREFILTER_ENABLED,
+                 chat_client: Optional[ChatCompletionsClient] = None,
+                 async_chat_client: Optional[AsyncChatCompletionsClient] = None):
+        self.max_workers = max_workers
+        self.parser_processes = parser_processes
         self.document_reader = DocumentReader()
-        self.extractor = AzureExtractor()
-        self.comparison_agent = ComparisonAgent()
-        self.ranking_agent = RankingAgent()
+        self._parser_pool: Optional[ProcessPoolExecutor] = None
+        self._parser_pool_lock = threading.Lock()
+        self.blob_store = BlobStore()
+        self.deduplicator = Deduplicator() if use_deduplication else None
+        # One HTTP client shared by extraction and ranking
+        self.chat_client = chat_client or create_chat_client()
+        self.async_chat_client = async_chat_client
+        self.extraction_cache = ExtractionCache() if use_extraction_cache else None
+        self.extractor = self._create_extractor(EXTRACTION_MODE)
+        self.batch_extraction = EXTRACTION_BATCH_MODE and isinstance(self.extractor, AzureExtractor)
+        self.async_extraction = isinstance(self.extractor, AsyncAzureExtractor)
+        self.resume_index = ResumeIndex(blob_store=self.blob_store) if use_resume_index else None
+        # Indexes holding resume hashes, cleaned up when their blobs expire
+        self.text_indexes = [self.resume_index] if self.resume_index is not None else []
+        self.comparison_agent = self._create_comparison_agent(COMPARISON_BACKEND)
+        self._sweep_expired_blobs(BLOB_RETENTION_DAYS)
+        self.pre_filter = PreFilter() if use_prefilter else None
+        self.ranking_agent = RankingAgent(client=self.chat_client)
         self.export_utils = ExportUtils()
 
-    def process_resume_files(self, resume_files: List[str]) -> List[Profile]:
-        profiles = []
+    def _create_extractor(self, mode: str) -> ExtractorInterface:
+        if mode == "local":
+            return LocalExtractor()
+        
+        if USE_ASYNC_EXTRACTOR:
+            # Created only when used, since the async transport needs aiohttp
+            self.async_chat_client = self.async_chat_client or create_async_chat_client()
+            remote_extractor = AsyncAzureExtractor(cache=self.extraction_cache, client=self.async_chat_client)
+        else:
+            remote_extractor = AzureExtractor(cache=self.extraction_cache, client=self.chat_client)
+        
+        if mode == "tiered":
+            return TieredExtractor(LocalExtractor(), remote_extractor)
+        return remote_extractor
+
+    def _create_comparison_agent(self, backend: str) -> ComparisonInterface:
+        if backend == "semantic":
+            self.text_indexes.append(SemanticIndex(blob_store=self.blob_store))
+            return SemanticComparisonAgent(semantic_index=self.text_indexes[-1])
+        if backend == "bm25":
+            self.text_indexes.append(BM25Index())
+            return BM25ComparisonAgent(bm25_index=self.text_indexes[-1])
+        return ComparisonAgent(resume_index=self.resume_index)
+    
+    def _sweep_expired_blobs(self, retention_days: Optional[float]) -> None:
+        """Drop resumes not seen for ``retention_days`` from every index, then delete their text"""
+        if retention_days is None:
+            return
+        
+        expired = self.blob_store.expired(retention_days)
+        if not expired:
+            return
         
+        for index in self.text_indexes:
+            index.remove(expired)
+        for content_hash in expired:
+            self.blob_store.delete(content_hash)
+        print(f"Deleted {len(expired)} resumes older than {retention_days} days")
+
+    def close(self) -> None:
+        """Release the extractor's client and event loop, the parser pool and the document reader's page pool"""
+        self.extractor.close()
+        with self._parser_pool_lock:
+            if self._parser_pool is not None:
+                self._parser_pool.shutdown(wait=False, cancel_futures=True)
+                self._parser_pool = None
+        self.document_reader.close()
+    
+    def process_resume_files(self, resume_files: List[ResumeSource],
+                             progress_callback: Optional[ProgressCallback] = None) -> List[Profile]:
         print(f"Processing {len(resume_files)} resume files...")
         
-        for idx, file_path in enumerate(resume_files):
-            print(f"Processing file {idx+1}/{len(resume_files)}: {file_path}")
-            
-            text = self.document_reader.read_document(file_path)
-            if not text:
-                print(f"Warning: Could not extract text from {file_path}")
-                continue
-            
-            info = self.extractor.extract_resume_info(text)
-            if not info:
-                print(f"Warning: Could not extract info from {file_path}")
-                continue
-            
-            profile = Profile(
-                id=f"profile_{idx+1}",
-                name=info.get("name", f"Candidate_{idx+1}"),
-                email=info.get("email", ""),
-                phone=info.get("phone", ""),
-                skills=info.get("skills", []),
-                experience=f"{info.get('experience_years', '0')} years",
-                education=info.get("education", ""),
-                summary=info.get("summary", ""),
-                raw_text=text
-            )
-            
-            profiles.append(profile)
-            print(f"Successfully processed: {profile.name}")
+        texts = self._read_documents(resume_files, progress_callback)
+        
+        # Extraction and scoring run once per unique resume
+        groups = self._group_duplicates(texts)
+        unique = list(groups)
+        infos = self._extract_infos([resume_files[idx] for idx in unique], [texts[idx] for idx in unique],
+                                    progress_callback)
+        
+        profiles = []
+        for idx, info in zip(unique, infos):
+            source_files = tuple(_source_name(resume_files[member]) for member in groups[idx])
+            profile = self._build_profile(idx, resume_files[idx], texts[idx], info, source_files)
+            if profile:
+                profiles.append(profile)
         
         print(f"\nSuccessfully processed {len(profiles)} profiles")
         return profiles
 
-    def run_matching_process(self, job_description: JobDescription, resume_files: List[str]) -> Dict:
+    def _read_documents(self, resume_files: List[ResumeSource],
+                        progress_callback: Optional[ProgressCallback] = None) -> List[str]:
+        """Parse documents, in the service's process pool when concurrent ingestion is enabled"""
+        texts = [""] * len(resume_files)
+        
+        if self.max_workers <= 1 or len(resume_files) <= INGESTION_INLINE_PARSE_MAX_FILES:
+            for idx, file_path in enumerate(resume_files):
+                print(f"Reading file {idx+1}/{len(resume_files)}: {file_path}")
+                try:
+                    texts[idx] = _read_source(self.document_reader, file_path)
+                except Exception as e:
+                    print(f"Error reading {file_path}: {e}")
+                self._report_progress(progress_callback, "reading", idx + 1, len(resume_files))
+            return texts
+        
+        executor = self._get_parser_pool()
+        futures = [executor.submit(_read_source, self.document_reader, file_path) for file_path in resume_files]
+        for idx, future in enumerate(futures):
+            try:
+                texts[idx] = future.result()
+            except BrokenProcessPool as e:
+                print(f"Error reading {resume_files[idx]}: {e}")
+                # A worker died; the next run starts a fresh pool
+                self._discard_parser_pool(executor)
+            except Exception as e:
+                print(f"Error reading {resume_files[idx]}: {e}")
+            self._report_progress(progress_callback, "reading", idx + 1, len(resume_files))
+        return texts
+    
+    def _get_parser_pool(self) -> ProcessPoolExecutor:
+        with self._parser_pool_lock:
+            if self._parser_pool is None:
+                # Spawned workers do not inherit the threads, locks and clients of this process
+                self._parser_pool = ProcessPoolExecutor(
+                    max_workers=self.parser_processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._parser_pool
+    
+    def _discard_parser_pool(self, executor: ProcessPoolExecutor) -> None:
+        with self._parser_pool_lock:
+            if self._parser_pool is executor:
+                self._parser_pool = None
+        executor.shutdown(wait=False)
+
+    def _group_duplicates(self, texts: List[str]) -> Dict[int, List[int]]:
+        """Map the first index of each group of exact or near-duplicate texts to all of its members"""
+        if self.deduplicator is None:
+            return {idx: [idx] for idx in range(len(texts))}
+        
+        groups: Dict[int, List[int]] = {}
+        for idx, canonical_idx in enumerate(self.deduplicator.canonical_indices(texts)):
+            groups.setdefault(canonical_idx, []).append(idx)
+        
+        duplicates = len(texts) - len(groups)
+        if duplicates:
+            print(f"Collapsed {duplicates} duplicate resumes")
+        return groups
+
+    def _extract_infos(self, resume_files: List[ResumeSource], texts: List[str],
+                       progress_callback: Optional[ProgressCallback] = None) -> List[Dict]:
+        """Run extraction per document: batched, as async tasks, in a bounded thread pool, or one at a time"""
+        infos = [{} for _ in resume_files]
+        
+        if self.batch_extraction:
+            try:
+                infos = self.extractor.extract_batch(texts, max_workers=self.max_workers)
+                self._report_progress(progress_callback, "extracting", len(texts), len(texts))
+                return infos
+            except Exception as e:
+                print(f"Batch extraction error, falling back to per-resume extraction: {e}")
+        
+        if self.async_extraction:
+            return self._extract_infos_async(resume_files, texts, progress_callback)
+        
+        if self.max_workers <= 1:
+            for idx, text in enumerate(texts):
+                if not text:
+                    continue
+                print(f"Extracting {idx+1}/{len(resume_files)}: {resume_files[idx]}")
+                try:
+                    infos[idx] = self.extractor.extract_resume_info(text)
+                except Exception as e:
+                    print(f"Error extracting info from {resume_files[idx]}: {e}")
+                self._report_progress(progress_callback, "extracting", idx + 1, len(texts))
+            return infos
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                # Each task runs in a copy of this context so cache lookups count towards this run
+                executor.submit(contextvars.copy_context().run, self.extractor.extract_resume_info, text): idx
+                for idx, text in enumerate(texts) if text
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                idx = futures[future]
+                try:
+                    infos[idx] = future.result()
+                except Exception as e:
+                    print(f"Error extracting info from {resume_files[idx]}: {e}")
+                print(f"Extracted {completed}/{len(futures)}: {resume_files[idx]}")
+                self._report_progress(progress_callback, "extracting", completed, len(futures))
+        return infos
+
+    def _extract_infos_async(self, resume_files: List[ResumeSource], texts: List[str],
+                             progress_callback: Optional[ProgressCallback] = None) -> List[Dict]:
+        """One concurrent batch on the async extractor, limited by its rate budget rather than INGESTION_MAX_WORKERS"""
+        infos = [{} for _ in resume_files]
+        indices = [idx for idx, text in enumerate(texts) if text]
+        completed = 0
+        
+        def on_result(position: int, info: Dict) -> None:
+            nonlocal completed
+            completed += 1
+            print(f"Extracted {completed}/{len(indices)}: {resume_files[indices[position]]}")
+            self._report_progress(progress_callback, "extracting", completed, len(indices))
+        
+        try:
+            results = self.extractor.extract_many([texts[idx] for idx in indices], on_result=on_result)
+        except Exception as e:
+            print(f"Error extracting resume info: {e}")
+            return infos
+        for idx, info in zip(indices, results):
+            infos[idx] = info
+        return infos
+    
+    def _track_extraction_cache(self):
+        """Hit/miss counts of this run alone, even while other runs share the cache"""
+        if self.extraction_cache is None:
+            return nullcontext(None)
+        return self.extraction_cache.track()
+
+    @staticmethod
+    def _report_progress(progress_callback: Optional[ProgressCallback], stage: str, done: int, total: int) -> None:
+        if progress_callback is None:
+            return
+        try:
+            progress_callback(stage, done, total)
+        except Exception as e:
+            print(f"Progress callback error: {e}")
+
+    def _build_profile(self, idx: int, file_path: ResumeSource, text: str, info: Dict,
+                       source_files: Tuple[str, ...] = ()) -> Optional[Profile]:
+        if not text:
+            print(f"Warning: Could not extract text from {file_path}")
+            return None
+        
+        if not info:
+            print(f"Warning: Could not extract info from {file_path}")
+            return None
+        
+        profile = Profile(
+            id=f"profile_{idx+1}",
+            name=info.get("name", f"Candidate_{idx+1}"),
+            email=info.get("email", ""),
+            phone=info.get("phone", ""),
+            skills=info.get("skills", []),
+            experience=_format_experience(info.get("experience_years")),
+            education=info.get("education", ""),
+            summary=info.get("summary", ""),
+            raw_text_handle=self.blob_store.put(text),
+            source_files=source_files or (_source_name(file_path),)
+        )
+        
+        print(f"Successfully processed: {profile.name}")
+        return profile
+
+    def run_matching_process(self, job_description: JobDescription, resume_files: List[ResumeSource],
+                             min_similarity_threshold: Optional[float] = None,
+                             top_n: int = DEFAULT_TOP_MATCHES,
+                             progress_callback: Optional[ProgressCallback] = None) -> Dict:
         """Run the complete matching process"""
+        if min_similarity_threshold is None:
+            min_similarity_threshold = self.ranking_agent.min_similarity_threshold
+        
         print(f"Starting recruitment matching process...")
         print(f"Job Description: {job_description.title} (ID: {job_description.id})")
         
-        profiles = self.process_resume_files(resume_files)
+        with self._track_extraction_cache() as cache_stats:
+            profiles = self.process_resume_files(resume_files, progress_callback)
         
         if not profiles:
             print("No profiles were successfully processed.")
             return self._create_empty_result(job_description)
         
-        print(f"\nComparing {len(profiles)} profiles with job description...")
-        scored_profiles = self.comparison_agent.compare_profiles_with_jd(job_description, profiles)
+        candidates, prefilter_summary = self._apply_prefilter(job_description, profiles)
+        
+        print(f"\nComparing {len(candidates)} profiles with job description...")
+        self._report_progress(progress_callback, "scoring", 0, len(profiles))
+        scored_profiles = self.comparison_agent.compare_profiles_with_jd(job_description, candidates)
         
         print("Ranking profiles...")
-        top_matches = self.ranking_agent.get_top_matches(scored_profiles)
+        self._report_progress(progress_callback, "ranking", 0, len(profiles))
+        top_matches = self.ranking_agent.get_top_matches(scored_profiles, top_n, min_similarity_threshold)
         
         self.export_utils.print_ranking_summary(scored_profiles)
         
+        # Per-run file names keep concurrent runs from overwriting each other's exports
+        export_stem = self.export_utils.make_export_stem(job_description.id)
+        exports = {}
         if top_matches:
-            self.export_utils.export_to_csv(top_matches)
+            exports["top_matches_csv"] = self.export_utils.export_to_csv(top_matches, f"{export_stem}_{DEFAULT_CSV_FILENAME}")
+        if EXPORT_FULL_POOL:
+            # Sorted in place so the export reads the pool best first without a copy
+            scored_profiles.sort(key=lambda x: x.similarity_score, reverse=True)
+            exports.update(self.export_utils.export_scored_pool(scored_profiles, export_stem))
         
         # Step 6: Creat result summary
-        result = self._create_match_result(job_description, profiles, top_matches)
+        result = self._create_match_result(job_description, profiles, scored_profiles, top_matches, min_similarity_threshold,
+                                           top_n, exports, prefilter_summary, cache_stats)
         
-        self.export_utils.export_to_json(result)
+        self.export_utils.export_to_json(result, f"{export_stem}_match_results.json")
         
         print(f"\nMatching process completed. Found {len(top_matches)} top matches.")
+        self._report_progress(progress_callback, "done", len(profiles), len(profiles))
         return result
 
-    def _create_match_result(self, job_description: JobDescription, all_profiles: List[Profile], top_matches: List[Profile]) -> Dict:
+    def run_multi_matching_process(self, job_descriptions: List[JobDescription], resume_files: List[ResumeSource],
+                                   min_similarity_threshold: Optional[float] = None,
+                                   top_n: int = DEFAULT_TOP_MATCHES, top_jobs: int = MULTI_MATCH_TOP_JOBS,
+                                   progress_callback: Optional[ProgressCallback] = None) -> Dict:
+        """Match several job descriptions against one pool: resumes are ingested once and scored as one matrix"""
+        if min_similarity_threshold is None:
+            min_similarity_threshold = self.ranking_agent.min_similarity_threshold
+        
+        print(f"Starting multi-job matching process for {len(job_descriptions)} job descriptions...")
+        
+        with self._track_extraction_cache() as cache_stats:
+            profiles = self.process_resume_files(resume_files, progress_callback)
+        
+        if not profiles or not job_descriptions:
+            print("No profiles were successfully processed.")
+            return self._create_empty_multi_result(job_descriptions)
+        
+        keep_masks, prefilter_summaries = self._prefilter_masks(job_descriptions, profiles)
+        # Only resumes that pass at least one JD's pre-filter are scored; filtered cells are NaN.
+        # The pool behind IDF weights (and BM25's per-JD max) is this union, so text scores can
+        # differ slightly from a single-JD run that scores only that JD's survivors.
+        scored_columns = np.flatnonzero(keep_masks.any(axis=0))
+        
+        print(f"\nScoring {len(scored_columns)} profiles against {len(job_descriptions)} job descriptions...")
+        self._report_progress(progress_callback, "scoring", 0, len(profiles))
+        score_matrix = np.full((len(job_descriptions), len(profiles)), np.nan)
+        score_matrix[:, scored_columns] = self.comparison_agent.score_matrix(
+            job_descriptions, [profiles[i] for i in scored_columns]
+        )
+        score_matrix[~keep_masks] = np.nan
+        
+        # Ranked by score alone: an LLM re-rank per requisition would undo the single pass
+        jobs = [
+            self._create_job_view(job_description, profiles, scores, min_similarity_threshold, top_n, prefilter_summary)
+            for job_description, scores, prefilter_summary in zip(job_descriptions, score_matrix, prefilter_summaries)
+        ]
+        candidates = [
+            self._create_candidate_view(profile, job_descriptions, scores, min_similarity_threshold, top_jobs)
+            for profile, scores in zip(profiles, score_matrix.T)
+        ]
+        
+        export_stem = self.export_utils.make_export_stem("multi")
+        exports = {
+            "score_matrix_csv": self.export_utils.export_score_matrix(
+                score_matrix,
+                [job_description.id for job_description in job_descriptions],
+                [profile.id for profile in profiles],
+                f"{export_stem}_score_matrix.csv"
+            )
+        }
+        
+        result = {
+            "total_jobs": len(job_descriptions),
+            "total_profiles": len(profiles),
+            "jobs": jobs,
+            "candidates": candidates,
+            "timestamp": datetime.now().isoformat(),
+            "processing_summary": {
+                "min_similarity_threshold": min_similarity_threshold,
+                "top_candidates_limit": top_n,
+                "top_jobs_limit": top_jobs,
+                "duplicates_collapsed": sum(len(p.source_files) - 1 for p in profiles),
+                "extraction_cache": cache_stats,
+                "exports": exports
+            }
+        }
+        
+        self.export_utils.export_to_json(result, f"{export_stem}_multi_match_results.json")
+        
+        print(f"\nMulti-job matching process completed for {len(job_descriptions)} job descriptions.")
+        self._report_progress(progress_callback, "done", len(profiles), len(profiles))
+        return result
+
+    def _apply_prefilter(self, job_description: JobDescription, profiles: List[Profile]) -> Tuple[List[Profile], Optional[Dict]]:
+        """Drop profiles that miss the JD's hard requirements before any scoring"""
+        if self.pre_filter is None:
+            return profiles, None
+        
+        keep, summary = self.pre_filter.apply(job_description, profiles)
+        if summary["eliminated"]:
+            print(f"Pre-filter kept {summary['passed']}/{len(profiles)} profiles: {summary['eliminated']}")
+        return [profile for profile, kept in zip(profiles, keep) if kept], summary
+
+    def _prefilter_masks(self, job_descriptions: List[JobDescription],
+                         profiles: List[Profile]) -> Tuple[np.ndarray, List[Optional[Dict]]]:
+        """One keep-mask row per job description"""
+        if self.pre_filter is None:
+            return np.ones((len(job_descriptions), len(profiles)), dtype=bool), [None] * len(job_descriptions)
+        
+        keep_masks = np.ones((len(job_descriptions), len(profiles)), dtype=bool)
+        summaries = []
+        for row, job_description in enumerate(job_descriptions):
+            keep_masks[row], summary = self.pre_filter.apply(job_description, profiles)
+            summaries.append(summary)
+        return keep_masks, summaries
+
+    def _create_job_view(self, job_description: JobDescription, profiles: List[Profile], scores: np.ndarray,
+                         min_similarity_threshold: float, top_n: int, prefilter_summary: Optional[Dict] = None) -> Dict:
+        top_indices = RankingUtils.top_indices(scores, top_n, min_similarity_threshold)
+        return {
+            "job_id": job_description.id,
+            "job_title": job_description.title,
+            "qualified_matches": int(np.count_nonzero(scores >= min_similarity_threshold)),
+            "top_matches": len(top_indices),
+            "matches": [{**profiles[i].to_dict(), "similarity_score": float(scores[i])} for i in top_indices],
+            "prefilter": prefilter_summary
+        }
+
+    def _create_candidate_view(self, profile: Profile, job_descriptions: List[JobDescription], scores: np.ndarray,
+                               min_similarity_threshold: float, top_jobs: int) -> Dict:
+        return {
+            "profile_id": profile.id,
+            "name": profile.name,
+            "email": profile.email,
+            "best_jobs": [
+                {
+                    "job_id": job_descriptions[i].id,
+                    "job_title": job_descriptions[i].title,
+                    "similarity_score": float(scores[i])
+                } for i in RankingUtils.top_indices(scores, top_jobs, min_similarity_threshold)
+            ]
+        }
+
+    def _create_empty_multi_result(self, job_descriptions: List[JobDescription]) -> Dict:
+        """Create empty result when no profiles are processed in a multi-job run"""
+        return {
+            "total_jobs": len(job_descriptions),
+            "total_profiles": 0,
+            "jobs": [],
+            "candidates": [],
+            "timestamp": datetime.now().isoformat(),
+            "error": "No profiles were successfully processed"
+        }
+
+    def _create_match_result(self, job_description: JobDescription, all_profiles: List[Profile],
+                             scored_profiles: List[Profile], top_matches: List[Profile], min_similarity_threshold: float,
+                             top_n: int, exports: Dict[str, str], prefilter_summary: Optional[Dict] = None,
+                             extraction_cache_stats: Optional[Dict] = None) -> Dict:
         """Create structured match result"""
         return {
             "job_id": job_description.id,
             "job_title": job_description.title,
             "total_profiles": len(all_profiles),
-            "qualified_matches": len([p for p in all_profiles if p.similarity_score >= self.ranking_agent.min_similarity_threshold]),
+            "qualified_matches": len([p for p in scored_profiles if p.similarity_score >= min_similarity_threshold]),
             "top_matches": len(top_matches),
             "matches": [profile.to_dict() for profile in top_matches],
             "timestamp": datetime.now().isoformat(),
             "processing_summary": {
-                "min_similarity_threshold": self.ranking_agent.min_similarity_threshold,
-                "top_candidates_limit": 3
+                "min_similarity_threshold": min_similarity_threshold,
+                "top_candidates_limit": top_n,
+                "duplicates_collapsed": sum(len(p.source_files) - 1 for p in all_profiles),
+                "extraction_cache": extraction_cache_stats,
+                "prefilter": prefilter_summary,
+                "exports": exports
             }
         }
     
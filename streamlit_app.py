@@ -1,10 +1,10 @@
 import streamlit as st
 import os
-import tempfile
+import time
 import json
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 import sys
 from pathlib import Path
 import pickle
@@ -48,14 +48,25 @@ if authentication_status :
 
 
     try:
-        from entities import JobDescription, Profile
-        from services import RecruitmentMatchingService
+        from entities import JobDescription, Profile, ResumeDocument
+        from services import RecruitmentMatchingService, MatchingJobRunner
         from dao import CommunicationAgent
+        from config.settings import get_config_fingerprint, JOB_POLL_INTERVAL_SECONDS
     except ImportError as e:
         st.error(f"Import error: {e}")
         st.error("Please check that all required modules are installed and available.")
         st.stop()
 
+    @st.cache_resource(show_spinner=False, max_entries=1)
+    def get_matching_service(config_fingerprint: str) -> RecruitmentMatchingService:
+        """Process-wide matching service shared across reruns; a new config fingerprint rebuilds it"""
+        return RecruitmentMatchingService()
+
+    @st.cache_resource(show_spinner=False, max_entries=1)
+    def get_job_runner(config_fingerprint: str) -> MatchingJobRunner:
+        """Process-wide background job runner bound to the cached matching service"""
+        return MatchingJobRunner(get_matching_service(config_fingerprint))
+
     st.markdown("""
     <style>
         .main-header {
@@ -113,25 +124,44 @@ if authentication_status :
             st.session_state.processed_profiles = []
         if 'job_description' not in st.session_state:
             st.session_state.job_description = None
+        if 'active_job_id' not in st.session_state:
+            st.session_state.active_job_id = st.query_params.get("job_id")
 
-    def save_uploaded_files(uploaded_files) -> List[str]:
-        """Save uploaded files to temporary directory and return file paths"""
-        temp_dir = tempfile.mkdtemp()
-        file_paths = []
-        
-        for uploaded_file in uploaded_files:
-            safe_filename = "".join(c for c in uploaded_file.name if c.isalnum() or c in (' ', '.', '_', '-')).rstrip()
-            file_path = os.path.join(temp_dir, safe_filename)
-            
+    def finish_matching_job(job: Dict, notify_emails) -> None:
+        """Runs on the job worker thread: send notifications once the job completes"""
+        if job and job['status'] == 'completed' and notify_emails:
             try:
-                with open(file_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-                file_paths.append(file_path)
+                CommunicationAgent(*notify_emails).notify(job['result'])
             except Exception as e:
-                st.error(f"Error saving file {safe_filename}: {e}")
-                continue
+                print(f"Email notification failed for job {job['job_id']}: {e}")
+
+    def display_active_job() -> Optional[Dict]:
+        """Show the state of the session's background job and load its result once completed"""
+        job_id = st.session_state.active_job_id
+        if not job_id:
+            return None
+        
+        job = get_job_runner(get_config_fingerprint()).get_job(job_id)
+        if job is None:
+            st.warning(f"⚠️ Matching job {job_id[:8]} was not found.")
+            st.session_state.active_job_id = None
+            return None
+        
+        if job['status'] in ('queued', 'running'):
+            total = job['progress_total'] or 1
+            stage = (job['stage'] or job['status']).capitalize()
+            st.progress(min(job['progress_done'] / total, 1.0),
+                        text=f"🔍 Job {job_id[:8]}: {stage} {job['progress_done']}/{job['progress_total']}")
+        elif job['status'] == 'completed':
+            if st.session_state.matching_results is None:
+                result = job['result']
+                st.session_state.matching_results = result
+                st.success(f"🎉 Found {len(result.get('matches', []))} top matches out of {result.get('total_profiles', 0)} profiles!")
+                st.info("👉 Check the 'Results' tab to view the matching candidates!")
+        else:
+            st.error(f"❌ Matching job {job_id[:8]} failed: {job['error']}")
         
-        return file_paths
+        return job
 
     def get_score_class(score: float) -> str:
         """Return CSS class based on similarity score"""
@@ -181,7 +211,7 @@ if authentication_status :
         authenticator.logout("Logout","sidebar")
         st.sidebar.title(f"Welcome {name}")
         try:
-            test_service = RecruitmentMatchingService()
+            get_matching_service(get_config_fingerprint())
             st.success("🔧 Service initialized successfully!")
         except Exception as e:
             st.error(f"⚠️ Service initialization failed: {e}")
@@ -194,6 +224,14 @@ if authentication_status :
             env_info = os.getenv('WEBSITE_SITE_NAME', 'Local Development')
             st.info(f"Environment: {env_info}")
             
+            if st.button("🔄 Reload Service", help="Rebuild the matching service and its API clients"):
+                # The cached runner holds the old service, so it is retired along with it and
+                # closes the service once its running jobs are done
+                get_job_runner(get_config_fingerprint()).shutdown(close_service=True)
+                get_job_runner.clear()
+                get_matching_service.clear()
+                st.rerun()
+            
             similarity_threshold = st.slider(
                 "Minimum Similarity Threshold",
                 min_value=0.0,
@@ -220,6 +258,8 @@ if authentication_status :
                 ar_email = st.text_input("AR Requestor Email", placeholder="ar@company.com")
                 recruiter_email = st.text_input("Recruiter Email", placeholder="recruiter@company.com")
         
+        active_job = display_active_job()
+        
         tab1, tab2, tab3 = st.tabs(["📝 Job Description", "📄 Upload Resumes", "📊 Results"])
         
         with tab1:
@@ -267,6 +307,14 @@ if authentication_status :
                 )
                 
                 experience_required = st.text_input("Experience Required", value="5+ years")
+                must_have_input = st.text_input(
+                    "Must-have Skills (comma separated)",
+                    help="Candidates missing any of these are filtered out before scoring"
+                )
+                excluded_input = st.text_input(
+                    "Excluded Keywords (comma separated)",
+                    help="Candidates whose resume mentions any of these are filtered out before scoring"
+                )
             
             if st.button("💾 Save Job Description", type="primary"):
                 required_skills = [skill.strip() for skill in skills_input.split('\n') if skill.strip()]
@@ -276,7 +324,9 @@ if authentication_status :
                     title=job_title,
                     required_skills=required_skills,
                     experience_required=experience_required,
-                    raw_text=job_description_text
+                    raw_text=job_description_text,
+                    must_have_skills=[skill.strip() for skill in must_have_input.split(',') if skill.strip()],
+                    excluded_keywords=[keyword.strip() for keyword in excluded_input.split(',') if keyword.strip()]
                 )
                 
                 st.success("✅ Job description saved successfully!")
@@ -311,66 +361,29 @@ if authentication_status :
                     st.error("❌ Please upload resume files first!")
                     return
                 
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
                 try:
-                    status_text.text("💾 Saving uploaded files...")
-                    progress_bar.progress(10)
-                    file_paths = save_uploaded_files(uploaded_files)
-                    
-                    if not file_paths:
-                        st.error("❌ Failed to save uploaded files!")
-                        return
-                    
-                    status_text.text("🔧 Initializing matching service...")
-                    progress_bar.progress(20)
-                    matching_service = RecruitmentMatchingService()
+                    # Uploads are parsed straight from memory; nothing is written to disk
+                    resume_documents = [ResumeDocument(f.name, f.getvalue()) for f in uploaded_files]
                     
-                    matching_service.ranking_agent.min_similarity_threshold = similarity_threshold
+                    notify_emails = (ar_email, recruiter_email) if enable_email and ar_email and recruiter_email else None
+                    job_id = get_job_runner(get_config_fingerprint()).submit(
+                        st.session_state.job_description,
+                        resume_documents,
+                        min_similarity_threshold=similarity_threshold,
+                        top_n=int(top_matches_limit),
+                        on_finished=lambda job: finish_matching_job(job, notify_emails)
+                    )
                     
-                    status_text.text("🔍 Processing resumes and matching...")
-                    progress_bar.progress(50)
-                    
-                    with st.spinner("Processing resumes..."):
-                        result = matching_service.run_matching_process(
-                            st.session_state.job_description, 
-                            file_paths
-                        )
-                    
-                    progress_bar.progress(80)
-                    
-                    st.session_state.matching_results = result
-                    
-                    if enable_email and ar_email and recruiter_email:
-                        status_text.text("📧 Sending email notifications...")
-                        progress_bar.progress(90)
-                        
-                        try:
-                            comm_agent = CommunicationAgent(ar_email, recruiter_email)
-                            comm_agent.notify(result)
-                            st.success("📧 Email notifications sent successfully!")
-                        except Exception as e:
-                            st.warning(f"⚠️ Email notification failed: {str(e)}")
-                    
-                    progress_bar.progress(100)
-                    status_text.text("✅ Matching process completed!")
-                    
-                    for file_path in file_paths:
-                        try:
-                            os.remove(file_path)
-                        except:
-                            pass
-                    
-                    st.success(f"🎉 Found {len(result.get('matches', []))} top matches out of {result.get('total_profiles', 0)} profiles!")
-                    
-                    st.info("👉 Check the 'Results' tab to view the matching candidates!")
+                    st.session_state.active_job_id = job_id
+                    st.session_state.matching_results = None
+                    st.query_params["job_id"] = job_id
                     
                 except Exception as e:
-                    st.error(f"❌ An error occurred during processing: {str(e)}")
+                    st.error(f"❌ An error occurred while submitting the matching job: {str(e)}")
                     st.error("Please check your configuration and try again.")
-                    progress_bar.empty()
-                    status_text.empty()
+                    return
+                
+                st.rerun()
         
         with tab3:
             st.markdown('<div class="section-header">Matching Results</div>', unsafe_allow_html=True)
@@ -451,6 +464,11 @@ if authentication_status :
             "</div>", 
             unsafe_allow_html=True
         )
+        
+        # Poll the background job after the page has rendered
+        if active_job and active_job['status'] in ('queued', 'running'):
+            time.sleep(JOB_POLL_INTERVAL_SECONDS)
+            st.rerun()
 
     if __name__ == "__main__":
         main()
\ No newline at end of file
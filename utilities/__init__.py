@@ -1,4 +1,13 @@
 from .file_utils import FileUtils
 from .export_utils import ExportUtils
+from .text_utils import TextUtils
+from .rate_limiter import TokenBucket, RateLimitScheduler
+from .aho_corasick import AhoCorasick
+from .blob_store import BlobStore
+from .deduplicator import MinHashLSH, Deduplicator
+from .skill_vocabulary import SkillVocabulary
+from .pre_filter import PreFilter
+from .index_store import IndexStore
+from .ranking_utils import RankingUtils
 
-__all__ = ['FileUtils', 'ExportUtils']
\ No newline at end of file
+__all__ = ['FileUtils', 'ExportUtils', 'TextUtils', 'TokenBucket', 'RateLimitScheduler', 'AhoCorasick', 'BlobStore', 'MinHashLSH', 'Deduplicator', 'SkillVocabulary', 'PreFilter', 'IndexStore', 'RankingUtils']
\ No newline at end of file
@@ -0,0 +1,81 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher that finds every occurrence of every pattern in a
+    single pass over the text. Matching is exact, so callers normalise case
+    on both the patterns and the text. With ``word_boundaries`` set, matches
+    that start or end inside a word are skipped.
+    """
+
+    def __init__(self, patterns: Iterable[str], word_boundaries: bool = True):
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+        self.word_boundaries = word_boundaries
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            self._insert(pattern, pattern_id)
+        self._build_failure_links()
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start offset, pattern index) for every match"""
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                start = position - len(patterns[pattern_id]) + 1
+                if self.word_boundaries and not self._on_word_boundary(text, start, position + 1):
+                    continue
+                yield start, pattern_id
+
+    def count(self, text: str) -> Dict[str, int]:
+        counts = dict.fromkeys(self.patterns, 0)
+        for _, pattern_id in self.iter_matches(text):
+            counts[self.patterns[pattern_id]] += 1
+        return counts
+
+    def find_all(self, text: str) -> List[str]:
+        """Distinct matched patterns in order of first occurrence"""
+        found = {}
+        for _, pattern_id in self.iter_matches(text):
+            found.setdefault(pattern_id, None)
+        return [self.patterns[pattern_id] for pattern_id in found]
+
+    def _insert(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _on_word_boundary(self, text: str, start: int, end: int) -> bool:
+        pattern_start, pattern_end = text[start], text[end - 1]
+        if pattern_start.isalnum() and start > 0 and text[start - 1].isalnum():
+            return False
+        if pattern_end.isalnum() and end < len(text) and text[end].isalnum():
+            return False
+        return True
@@ -0,0 +1,83 @@
+import os
+import time
+from typing import List
+from entities import RawTextHandle
+from config.settings import PROFILE_BLOB_FOLDER
+from .file_utils import FileUtils
+from .text_utils import TextUtils
+
+class BlobStore:
+    """
+    Content-addressed text store; identical resumes share one file plus its normalized copy.
+    Storing a text again refreshes its modification time, which ``expired`` ages blobs by.
+    """
+
+    def __init__(self, folder: str = PROFILE_BLOB_FOLDER):
+        self.folder = folder
+
+    def put(self, text: str) -> RawTextHandle:
+        content_hash = TextUtils.content_hash(text)
+        handle = self.handle_for(content_hash)
+        if not os.path.exists(handle.normalized_path):
+            FileUtils.ensure_directory_exists(os.path.dirname(handle.path))
+            self._write(handle.path, text)
+            # Written last, so its presence means both files are complete
+            self._write(handle.normalized_path, TextUtils.normalize(text))
+        else:
+            self._touch(handle.path)
+            self._touch(handle.normalized_path)
+        return handle
+
+    def get(self, content_hash: str) -> str:
+        return self.handle_for(content_hash).load()
+
+    def delete(self, content_hash: str) -> None:
+        handle = self.handle_for(content_hash)
+        # The normalized copy goes first, so a half-deleted blob reads as never stored
+        for file_path in (handle.normalized_path, handle.path):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def expired(self, max_age_days: float) -> List[str]:
+        """Hashes of blobs not stored again for ``max_age_days`` days"""
+        if not os.path.isdir(self.folder):
+            return []
+
+        cutoff = time.time() - max_age_days * 24 * 60 * 60
+        expired = set()
+        for prefix in os.listdir(self.folder):
+            prefix_folder = os.path.join(self.folder, prefix)
+            if not os.path.isdir(prefix_folder):
+                continue
+            for file_name in os.listdir(prefix_folder):
+                file_path = os.path.join(prefix_folder, file_name)
+                try:
+                    if file_name.endswith(".txt") and os.path.getmtime(file_path) < cutoff:
+                        expired.add(file_name.split(".", 1)[0])
+                except FileNotFoundError:
+                    # Deleted by another process while listing
+                    pass
+        return sorted(expired)
+
+    @staticmethod
+    def _touch(file_path: str) -> None:
+        try:
+            os.utime(file_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _write(file_path: str, content: str) -> None:
+        try:
+            with FileUtils.atomic_write(file_path, mode='w', encoding='utf-8') as file:
+                file.write(content)
+        except OSError:
+            # Another writer stored the same content first (e.g. os.replace onto an open file on Windows)
+            if not os.path.exists(file_path):
+                raise
+
+    def handle_for(self, content_hash: str) -> RawTextHandle:
+        prefix = os.path.join(self.folder, content_hash[:2], content_hash)
+        return RawTextHandle(content_hash, f"{prefix}.txt", f"{prefix}.norm.txt")
@@ -0,0 +1,107 @@
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Set, Tuple
+import numpy as np
+from config.settings import DEDUP_JACCARD_THRESHOLD, DEDUP_NUM_PERM, DEDUP_SHINGLE_SIZE
+from .text_utils import TextUtils
+
+class MinHashLSH:
+    """
+    MinHash signatures over word shingles, bucketed by banded LSH.
+
+    Signatures whose estimated Jaccard similarity is above ``threshold`` share
+    at least one band bucket with high probability, so candidates for a
+    document are found without comparing it to every other document.
+    """
+
+    PRIME = np.uint64((1 << 31) - 1)
+
+    def __init__(self, threshold: float = DEDUP_JACCARD_THRESHOLD, num_perm: int = DEDUP_NUM_PERM,
+                 shingle_size: int = DEDUP_SHINGLE_SIZE, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self._a = rng.integers(1, self.PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, self.PRIME, num_perm, dtype=np.uint64)
+        self.bands, self.rows = self._band_layout(threshold, num_perm)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(self.bands)]
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self._shingles(text)
+        hashes = np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+                             dtype=np.uint64, count=len(shingles)) % self.PRIME
+        # Row i holds the hashes of every shingle under permutation i
+        return ((np.outer(hashes, self._a) + self._b) % self.PRIME).min(axis=0)
+
+    def insert(self, key: Hashable, signature: np.ndarray) -> None:
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket[band].append(key)
+
+    def query(self, signature: np.ndarray) -> Set[Hashable]:
+        candidates = set()
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+        return candidates
+
+    @staticmethod
+    def jaccard(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        return float(np.mean(signature_a == signature_b))
+
+    def _bands(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _shingles(self, text: str) -> List[str]:
+        words = TextUtils.normalize(text).split()
+        if len(words) <= self.shingle_size:
+            return [" ".join(words)]
+        return list({" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)})
+
+    @staticmethod
+    def _band_layout(threshold: float, num_perm: int) -> Tuple[int, int]:
+        # The LSH S-curve rises at (1/bands)^(1/rows). Take the steepest layout that rises at or
+        # below the threshold: candidates are verified against their signatures, so a false
+        # positive costs one comparison while a false negative misses a duplicate.
+        layouts = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+        eligible = [layout for layout in layouts if (1 / layout[0]) ** (1 / layout[1]) <= threshold]
+        if not eligible:
+            return layouts[0]
+        return max(eligible, key=lambda layout: (1 / layout[0]) ** (1 / layout[1]))
+
+class Deduplicator:
+    """Groups exact and near-duplicate texts; each text maps to the first index of its group"""
+
+    def __init__(self, threshold: float = DEDUP_JACCARD_THRESHOLD, num_perm: int = DEDUP_NUM_PERM,
+                 shingle_size: int = DEDUP_SHINGLE_SIZE):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+    def canonical_indices(self, texts: List[str]) -> List[int]:
+        canonical = list(range(len(texts)))
+        lsh = MinHashLSH(self.threshold, self.num_perm, self.shingle_size)
+        first_by_hash: Dict[str, int] = {}
+        signatures: Dict[int, np.ndarray] = {}
+
+        for idx, text in enumerate(texts):
+            if not text:
+                continue
+
+            content_hash = TextUtils.content_hash(TextUtils.normalize(text))
+            if content_hash in first_by_hash:
+                canonical[idx] = canonical[first_by_hash[content_hash]]
+                continue
+            first_by_hash[content_hash] = idx
+
+            signature = lsh.signature(text)
+            matches = [
+                candidate for candidate in lsh.query(signature)
+                if MinHashLSH.jaccard(signature, signatures[candidate]) >= self.threshold
+            ]
+            if matches:
+                canonical[idx] = canonical[min(matches)]
+                continue
+
+            signatures[idx] = signature
+            lsh.insert(idx, signature)
+
+        return canonical
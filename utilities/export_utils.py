@@ -1,14 +1,25 @@
 import csv
 import json
 import os
-from typing import List, Dict
+import re
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 from entities import Profile
-from config.settings import OUTPUT_FOLDER, DEFAULT_CSV_FILENAME
+from config.settings import (
+    OUTPUT_FOLDER, DEFAULT_CSV_FILENAME, EXPORT_POOL_FORMATS, EXPORT_PARQUET_BATCH_SIZE
+)
 from .file_utils import FileUtils
 
 class ExportUtils:    
     @staticmethod
-    def export_to_csv(profiles: List[Profile], filename: str = None) -> str:
+    def make_export_stem(job_id: str) -> str:
+        """Unique file name prefix for one run, so concurrent runs never write the same files"""
+        safe_job_id = re.sub(r"[^A-Za-z0-9_-]", "_", job_id or "job")
+        return f"{safe_job_id}_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
+    
+    @staticmethod
+    def export_to_csv(profiles: Iterable[Profile], filename: str = None) -> str:
         if filename is None:
             filename = DEFAULT_CSV_FILENAME
         
@@ -16,7 +27,7 @@ class ExportUtils:
         
         file_path = os.path.join(OUTPUT_FOLDER, filename)
         
-        with open(file_path, mode='w', newline='', encoding='utf-8') as file:
+        with FileUtils.atomic_write(file_path, mode='w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             writer.writerow([
                 "Name", "Email", "Phone", "Similarity Score", 
@@ -45,12 +56,106 @@ class ExportUtils:
         
         file_path = os.path.join(OUTPUT_FOLDER, filename)
         
-        with open(file_path, 'w', encoding='utf-8') as file:
+        with FileUtils.atomic_write(file_path, mode='w', encoding='utf-8') as file:
             json.dump(match_result, file, indent=2, ensure_ascii=False)
         
         print(f"Match results exported to: {file_path}")
         return file_path
     
+    @staticmethod
+    def export_to_jsonl(profiles: Iterable[Profile], filename: str) -> str:
+        """Write one JSON object per profile, one line at a time"""
+        FileUtils.ensure_directory_exists(OUTPUT_FOLDER)
+        
+        file_path = os.path.join(OUTPUT_FOLDER, filename)
+        
+        with FileUtils.atomic_write(file_path, mode='w', encoding='utf-8') as file:
+            for profile in profiles:
+                file.write(json.dumps(profile.to_dict(), ensure_ascii=False))
+                file.write("\n")
+        
+        print(f"Profiles exported to: {file_path}")
+        return file_path
+    
+    @staticmethod
+    def export_score_matrix(score_matrix, row_labels: List[str], column_labels: List[str], filename: str) -> str:
+        """Write a job x candidate score matrix as CSV, one row per job description"""
+        FileUtils.ensure_directory_exists(OUTPUT_FOLDER)
+        
+        file_path = os.path.join(OUTPUT_FOLDER, filename)
+        
+        with FileUtils.atomic_write(file_path, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(["Job ID"] + list(column_labels))
+            for row_label, scores in zip(row_labels, score_matrix):
+                writer.writerow([row_label] + [f"{score:.4f}" for score in scores])
+        
+        print(f"Score matrix exported to: {file_path}")
+        return file_path
+    
+    @staticmethod
+    def export_to_parquet(profiles: Iterable[Profile], filename: str,
+                          batch_size: int = EXPORT_PARQUET_BATCH_SIZE) -> str:
+        """Write profiles as Parquet row groups of ``batch_size`` rows"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        schema = pa.schema([
+            ("id", pa.string()),
+            ("name", pa.string()),
+            ("email", pa.string()),
+            ("phone", pa.string()),
+            ("skills", pa.list_(pa.string())),
+            ("experience", pa.string()),
+            ("education", pa.string()),
+            ("summary", pa.string()),
+            ("similarity_score", pa.float64()),
+            ("source_files", pa.list_(pa.string())),
+        ])
+        
+        FileUtils.ensure_directory_exists(OUTPUT_FOLDER)
+        
+        file_path = os.path.join(OUTPUT_FOLDER, filename)
+        
+        with FileUtils.atomic_write(file_path, mode='wb') as file:
+            with pq.ParquetWriter(file, schema) as writer:
+                batch = []
+                for profile in profiles:
+                    batch.append(profile.to_dict())
+                    if len(batch) >= batch_size:
+                        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                        batch = []
+                if batch:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        
+        print(f"Profiles exported to: {file_path}")
+        return file_path
+    
+    @staticmethod
+    def export_scored_pool(profiles: Iterable[Profile], export_stem: str,
+                           formats: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Export every scored profile, in the given order, in each requested format;
+        returns {format: path}. Writers stream rows, so one format can take a
+        generator; several formats need a list, since each one reads it again.
+        """
+        writers = {
+            "csv": (ExportUtils.export_to_csv, "csv"),
+            "jsonl": (ExportUtils.export_to_jsonl, "jsonl"),
+            "parquet": (ExportUtils.export_to_parquet, "parquet"),
+        }
+        exports = {}
+        for export_format in formats or EXPORT_POOL_FORMATS:
+            if export_format not in writers:
+                print(f"Unknown export format '{export_format}', skipping")
+                continue
+            writer, extension = writers[export_format]
+            try:
+                exports[export_format] = writer(profiles, f"{export_stem}_scored_pool.{extension}")
+            except Exception as e:
+                print(f"Error exporting scored pool as {export_format}: {e}")
+        return exports
+    
     @staticmethod
     def print_ranking_summary(profiles: List[Profile]) -> None:
         print("\n" + "="*60)
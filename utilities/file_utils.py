@@ -1,5 +1,7 @@
 import os
-from typing import List
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, List
 from pathlib import Path
 
 class FileUtils:    
@@ -23,6 +25,22 @@ class FileUtils:
     def ensure_directory_exists(directory_path: str) -> None:
         os.makedirs(directory_path, exist_ok=True)
     
+    @staticmethod
+    @contextmanager
+    def atomic_write(file_path: str, mode: str = 'w', **open_kwargs) -> Iterator[IO]:
+        """Write to a temporary file that replaces ``file_path`` only once writing succeeds"""
+        # A unique temporary name per writer, so concurrent writes to one path cannot interleave
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".",
+                                        prefix=f"{os.path.basename(file_path)}.", suffix=".tmp")
+        try:
+            with open(fd, mode, **open_kwargs) as file:
+                yield file
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     @staticmethod
     def is_valid_file_extension(file_path: str) -> bool:
         supported_extensions = {'.pdf', '.docx'}
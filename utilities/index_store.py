@@ -0,0 +1,151 @@
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+import joblib
+import numpy as np
+from config.settings import INDEX_MAX_SEGMENTS
+from .file_utils import FileUtils
+
+class IndexStore:
+    """
+    Files of an on-disk index: a base snapshot plus segments appended since it.
+
+    Every file is written under a fresh name through FileUtils.atomic_write, and a
+    manifest naming the current files is replaced last, so readers see either the
+    previous state or the new one, never a mix. A manifest naming a missing file
+    means an interrupted or clobbered save and fails to load. Files the committed
+    manifest no longer names are then deleted. Appending a segment writes only the
+    new rows, so an index pays for a full rewrite only when it is compacted.
+
+    Files are chosen by extension: ``.npy`` arrays (memory-mapped on load when asked),
+    ``.json`` payloads, ``.joblib`` fitted models. One process should write a folder;
+    with several writers the last manifest wins but is always complete.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, folder: str, max_segments: int = INDEX_MAX_SEGMENTS):
+        self.folder = folder
+        self.max_segments = max_segments
+        self.manifest: Dict = self._empty_manifest()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.folder, self.MANIFEST_FILE)
+
+    @property
+    def meta(self) -> Dict:
+        return self.manifest["meta"]
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.manifest["segments"])
+
+    def should_compact(self, new_rows: int) -> bool:
+        """
+        Whether to save a new base instead of appending ``new_rows``: once segments
+        would hold as many rows as the base, so full rewrites stay amortized linear
+        """
+        appended_rows = self.manifest["rows"] - self.manifest["base_rows"]
+        return self.segment_count >= self.max_segments or appended_rows + new_rows >= self.manifest["base_rows"]
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_path)
+
+    def load(self, mmap_mode: Optional[str] = 'r') -> Tuple[Dict, Dict[str, Any], List[Dict[str, Any]]]:
+        """(meta, base files, segment files) of the committed manifest; raises if any file is missing"""
+        with open(self.manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+
+        base = self._read_files(manifest["base"], mmap_mode)
+        segments = [self._read_files(segment, mmap_mode) for segment in manifest["segments"]]
+        self.manifest = manifest
+        return manifest["meta"], base, segments
+
+    def save(self, meta: Dict, files: Dict[str, Any], rows: int) -> None:
+        """Commit a new base snapshot of ``rows`` rows; segments appended to the old one are dropped"""
+        self._commit({
+            "meta": meta,
+            "base": self._write_files(files),
+            "segments": [],
+            "base_rows": rows,
+            "rows": rows
+        })
+
+    def append(self, meta: Dict, files: Dict[str, Any], rows: int) -> None:
+        """Commit one more segment of ``rows`` rows on top of the current base"""
+        self._commit({
+            "meta": meta,
+            "base": self.manifest["base"],
+            "segments": self.manifest["segments"] + [self._write_files(files)],
+            "base_rows": self.manifest["base_rows"],
+            "rows": self.manifest["rows"] + rows
+        })
+
+    def quarantine(self) -> None:
+        """Move an unreadable manifest aside so the next save cannot silently replace it"""
+        if self.exists():
+            corrupt_path = f"{self.manifest_path}.corrupt-{int(time.time())}"
+            os.replace(self.manifest_path, corrupt_path)
+            print(f"Moved unreadable index manifest to {corrupt_path}")
+        self.manifest = self._empty_manifest()
+
+    def _commit(self, manifest: Dict) -> None:
+        FileUtils.ensure_directory_exists(self.folder)
+        with FileUtils.atomic_write(self.manifest_path, mode='w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False)
+
+        previous, self.manifest = self.manifest, manifest
+        for stored_name in self._stored_names(previous) - self._stored_names(manifest):
+            try:
+                os.remove(os.path.join(self.folder, stored_name))
+            except OSError:
+                # Already gone, or still open elsewhere (e.g. memory-mapped on Windows)
+                pass
+
+    def _write_files(self, files: Dict[str, Any]) -> Dict[str, str]:
+        FileUtils.ensure_directory_exists(self.folder)
+        token = uuid.uuid4().hex[:12]
+        stored = {}
+        for name, value in files.items():
+            stem, extension = os.path.splitext(name)
+            stored_name = f"{stem}.{token}{extension}"
+            file_path = os.path.join(self.folder, stored_name)
+            if extension == ".npy":
+                with FileUtils.atomic_write(file_path, mode='wb') as file:
+                    np.save(file, np.asarray(value))
+            elif extension == ".json":
+                with FileUtils.atomic_write(file_path, mode='w', encoding='utf-8') as file:
+                    json.dump(value, file, ensure_ascii=False)
+            else:
+                with FileUtils.atomic_write(file_path, mode='wb') as file:
+                    joblib.dump(value, file)
+            stored[name] = stored_name
+        return stored
+
+    def _read_files(self, stored: Dict[str, str], mmap_mode: Optional[str]) -> Dict[str, Any]:
+        files = {}
+        for name, stored_name in stored.items():
+            file_path = os.path.join(self.folder, stored_name)
+            extension = os.path.splitext(name)[1]
+            if extension == ".npy":
+                files[name] = np.load(file_path, mmap_mode=mmap_mode)
+            elif extension == ".json":
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    files[name] = json.load(file)
+            else:
+                files[name] = joblib.load(file_path)
+        return files
+
+    @staticmethod
+    def _stored_names(manifest: Dict) -> set:
+        names = set(manifest["base"].values())
+        for segment in manifest["segments"]:
+            names.update(segment.values())
+        return names
+
+    @staticmethod
+    def _empty_manifest() -> Dict:
+        return {"meta": {}, "base": {}, "segments": [], "base_rows": 0, "rows": 0}
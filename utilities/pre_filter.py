@@ -0,0 +1,96 @@
+import re
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from entities import Profile, JobDescription
+from config.settings import PREFILTER_REQUIRED_SKILLS_AS_MUST_HAVE, PREFILTER_KEEP_UNKNOWN_EXPERIENCE
+from .aho_corasick import AhoCorasick
+from .skill_vocabulary import SkillVocabulary
+from .text_utils import TextUtils
+
+class PreFilter:
+    """
+    Drops resumes that miss a job description's hard requirements before any scoring.
+    Experience that is missing, unparseable or 0 years counts as unknown.
+
+    Rules run over the whole pool in order of cost: must-have skills as uint64
+    bitsets compared with one bitwise AND, minimum years of experience as one
+    array comparison, then excluded keywords with a single Aho-Corasick scan of
+    each remaining resume. Each rule only sees the survivors of the previous one,
+    so the per-rule elimination counts add up to the total.
+    """
+
+    def __init__(self, skill_vocabulary: Optional[SkillVocabulary] = None,
+                 required_skills_as_must_have: bool = PREFILTER_REQUIRED_SKILLS_AS_MUST_HAVE,
+                 keep_unknown_experience: bool = PREFILTER_KEEP_UNKNOWN_EXPERIENCE):
+        self.skill_vocabulary = skill_vocabulary or SkillVocabulary()
+        self.required_skills_as_must_have = required_skills_as_must_have
+        self.keep_unknown_experience = keep_unknown_experience
+
+    def apply(self, job_description: JobDescription, profiles: List[Profile]) -> Tuple[np.ndarray, Dict]:
+        """Boolean keep-mask over ``profiles`` and a summary of how many each rule eliminated"""
+        keep = np.ones(len(profiles), dtype=bool)
+        eliminated: Dict[str, int] = {}
+
+        must_have_skills = self._must_have_skills(job_description)
+        if must_have_skills and len(profiles):
+            eliminated["must_have_skills"] = self._eliminate(keep, self._has_all_skills(must_have_skills, profiles))
+
+        min_years = self.parse_years(job_description.experience_required)
+        if not np.isnan(min_years) and len(profiles):
+            years = np.fromiter((self.parse_years(p.experience) for p in profiles), dtype=float, count=len(profiles))
+            meets_minimum = years >= min_years
+            if self.keep_unknown_experience:
+                # Extractors report 0 years when a resume states no experience at all
+                meets_minimum |= np.isnan(years) | (years == 0)
+            eliminated["min_experience"] = self._eliminate(keep, meets_minimum)
+
+        excluded_keywords = [TextUtils.normalize(k) for k in job_description.excluded_keywords if k.strip()]
+        if excluded_keywords and keep.any():
+            # Only survivors are scanned, so their texts are the only ones loaded
+            matcher = AhoCorasick(excluded_keywords)
+            clean = keep.copy()
+            for idx in np.flatnonzero(keep):
+                clean[idx] = next(matcher.iter_matches(profiles[idx].normalized_text), None) is None
+            eliminated["excluded_keywords"] = self._eliminate(keep, clean)
+
+        return keep, {
+            "input_profiles": len(profiles),
+            "passed": int(keep.sum()),
+            "eliminated": eliminated
+        }
+
+    @staticmethod
+    def parse_years(text: Optional[str]) -> float:
+        """First number in e.g. "5+ years" or "3-5 yrs", or NaN if there is none"""
+        match = re.search(r"\d+(?:\.\d+)?", text or "")
+        return float(match.group()) if match else float("nan")
+
+    def _must_have_skills(self, job_description: JobDescription) -> List[str]:
+        if job_description.must_have_skills:
+            return job_description.must_have_skills
+        if self.required_skills_as_must_have:
+            return job_description.required_skills
+        return []
+
+    def _has_all_skills(self, must_have_skills: List[str], profiles: List[Profile]) -> np.ndarray:
+        bitsets = self._skill_bitsets([must_have_skills] + [profile.skills for profile in profiles])
+        required, candidates = bitsets[0], bitsets[1:]
+        return ((candidates & required) == required).all(axis=1)
+
+    def _skill_bitsets(self, skill_lists: List[List[str]]) -> np.ndarray:
+        # Skill ID i is bit i % 64 of word i // 64
+        skill_matrix = self.skill_vocabulary.encode(skill_lists)
+        n_words = skill_matrix.shape[1] // 64 + 1
+        rows = np.repeat(np.arange(skill_matrix.shape[0]), np.diff(skill_matrix.indptr))
+        columns = skill_matrix.indices.astype(np.uint64)
+        bitsets = np.zeros((skill_matrix.shape[0], n_words), dtype=np.uint64)
+        np.bitwise_or.at(bitsets, (rows, (columns // np.uint64(64)).astype(np.int64)),
+                         np.left_shift(np.uint64(1), columns % np.uint64(64)))
+        return bitsets
+
+    @staticmethod
+    def _eliminate(keep: np.ndarray, passes: np.ndarray) -> int:
+        """Clear ``keep`` where ``passes`` is False and return how many survivors that removed"""
+        removed = int(np.count_nonzero(keep & ~passes))
+        keep &= passes
+        return removed
@@ -0,0 +1,10 @@
+import numpy as np
+
+class RankingUtils:
+    @staticmethod
+    def top_indices(scores: np.ndarray, k: int, min_score: float) -> np.ndarray:
+        """Indices of the k best scores at or above ``min_score``, best first; ties keep input order"""
+        candidates = np.flatnonzero(scores >= min_score)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(scores[candidates], -k)[-k:]]
+        return candidates[np.argsort(-scores[candidates], kind='stable')]
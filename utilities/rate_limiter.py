@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        self._refill()
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= amount
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+
+class RateLimitScheduler:
+    """
+    Async scheduler that admits requests within requests-per-minute and
+    tokens-per-minute budgets. Waiters are served in arrival order, and a
+    server-side rate limit response pauses every waiter via ``pause``.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        estimated_tokens = min(estimated_tokens, self.tokens.capacity)
+        async with self._lock:
+            while True:
+                wait = max(
+                    self.paused_until - time.monotonic(),
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(estimated_tokens)
+                )
+                if wait <= 0:
+                    self.requests.consume(1)
+                    self.tokens.consume(estimated_tokens)
+                    return
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Charge (or refund) the difference between the estimate and the reported usage"""
+        self.tokens.consume(actual_tokens - estimated_tokens)
@@ -0,0 +1,82 @@
+import re
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import scipy.sparse as sp
+from config.skills import SKILL_GAZETTEER, SKILL_ALIASES
+
+class SkillVocabulary:
+    """
+    Maps skill names to canonical skill IDs and encodes skill lists as sparse binary vectors.
+
+    Gazetteer names and their aliases resolve to the same ID. Skills that are in
+    neither table get a temporary ID for the duration of one ``encode`` call, so
+    identical spellings still match within it while the vocabulary stays fixed.
+    """
+
+    def __init__(self, gazetteer: Optional[List[str]] = None, aliases: Optional[Dict[str, str]] = None):
+        self._ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+        for name in gazetteer if gazetteer is not None else SKILL_GAZETTEER:
+            self._add(self._key(name), name)
+        for alias, name in (aliases if aliases is not None else SKILL_ALIASES).items():
+            skill_id = self._ids.get(self._key(name))
+            if skill_id is None:
+                skill_id = self._add(self._key(name), name)
+            self._ids[self._key(alias)] = skill_id
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """ID of a gazetteer skill or alias, or None for an unknown skill"""
+        key = self._key(skill)
+        if not key:
+            return None
+
+        skill_id = self._ids.get(key)
+        if skill_id is None and key.endswith("s"):
+            skill_id = self._ids.get(key[:-1])
+        return skill_id
+
+    def canonical(self, skill: str) -> Optional[str]:
+        skill_id = self.skill_id(skill)
+        if skill_id is not None:
+            return self.names[skill_id]
+        return skill.strip() or None
+
+    def encode(self, skill_lists: Iterable[Iterable[str]]) -> sp.csr_matrix:
+        """
+        One binary row per skill list. Known skills use the vocabulary's columns;
+        unknown ones get columns after them that only mean something within this call.
+        """
+        unknown_ids: Dict[str, int] = {}
+        indices = []
+        indptr = [0]
+        for skills in skill_lists:
+            row = set()
+            for skill in skills:
+                if not isinstance(skill, str):
+                    continue
+                skill_id = self.skill_id(skill)
+                if skill_id is None:
+                    key = self._key(skill)
+                    if not key:
+                        continue
+                    skill_id = unknown_ids.setdefault(key, len(self.names) + len(unknown_ids))
+                row.add(skill_id)
+            indices.extend(sorted(row))
+            indptr.append(len(indices))
+
+        data = np.ones(len(indices), dtype=np.float32)
+        return sp.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(self.names) + len(unknown_ids)))
+
+    def _add(self, key: str, name: str) -> int:
+        skill_id = len(self.names)
+        self._ids[key] = skill_id
+        self.names.append(name)
+        return skill_id
+
+    @staticmethod
+    def _key(skill: str) -> str:
+        return re.sub(r"\s+", " ", skill.replace("-", " ")).strip().rstrip(",;:").lower()
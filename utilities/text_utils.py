@@ -0,0 +1,11 @@
+import hashlib
+import re
+
+class TextUtils:
+    @staticmethod
+    def normalize(text: str) -> str:
+        return re.sub(r"\s+", " ", text).strip().lower()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()